@@ -2,15 +2,42 @@ import os
 from pathlib import Path
 from typing import Optional
 
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.compression import Compression
+
 
 class Config:
     _ALLOWED_PHONE_REGIONS = {"UA", "US", "INTL"}
+    _ALLOWED_PERSISTENCE_MODES = {"snapshot", "journal", "delta"}
+    _ALLOWED_STORAGES = {"memory", "sqlite"}
+    _ALLOWED_SNAPSHOT_FORMATS = {"stream", "indexed"}
+    _ALLOWED_SNAPSHOT_CODECS = {"compact", "pickle"}
+    _DEFAULT_CHECKPOINT_INTERVAL = 500
+    _DEFAULT_DELTA_CHAIN_LENGTH = 10
+    _RETENTION_ENV = {
+        "keep_last": ("ASSISTANT_RETENTION_KEEP_LAST", 10),
+        "keep_hourly": ("ASSISTANT_RETENTION_KEEP_HOURLY", 24),
+        "keep_daily": ("ASSISTANT_RETENTION_KEEP_DAILY", 7),
+        "keep_weekly": ("ASSISTANT_RETENTION_KEEP_WEEKLY", 4),
+        "max_bytes": ("ASSISTANT_RETENTION_MAX_BYTES", 0),
+    }
 
     def __init__(self) -> None:
         self._contacts_dir: Optional[Path] = None
         self._notes_dir: Optional[Path] = None
         self._backend: Optional[str] = None
         self._phone_region: Optional[str] = None
+        self._persistence_mode: Optional[str] = None
+        self._checkpoint_interval: Optional[int] = None
+        self._delta_chain_length: Optional[int] = None
+        self._storage: Optional[str] = None
+        self._retention_settings: Optional[dict[str, int]] = None
+        self._retention_loaded = False
+        self._group_commit_window: Optional[float] = None
+        self._autosave_interval: Optional[float] = None
+        self._snapshot_format: Optional[str] = None
+        self._snapshot_codec: Optional[str] = None
+        self._compression: Optional[str] = None
 
     @property
     def contacts_dir(self) -> Path:
@@ -42,6 +69,111 @@ class Config:
             self._phone_region = raw if raw in self._ALLOWED_PHONE_REGIONS else "UA"
         return self._phone_region
 
+    @property
+    def persistence_mode(self) -> str:
+        if self._persistence_mode is None:
+            raw = (os.getenv("ASSISTANT_PERSISTENCE") or "snapshot").strip().lower()
+            self._persistence_mode = (
+                raw if raw in self._ALLOWED_PERSISTENCE_MODES else "snapshot"
+            )
+        return self._persistence_mode
+
+    @property
+    def checkpoint_interval(self) -> int:
+        if self._checkpoint_interval is None:
+            raw = (os.getenv("ASSISTANT_CHECKPOINT_INTERVAL") or "").strip()
+            self._checkpoint_interval = (
+                int(raw)
+                if raw.isdigit() and int(raw) > 0
+                else self._DEFAULT_CHECKPOINT_INTERVAL
+            )
+        return self._checkpoint_interval
+
+    @property
+    def delta_chain_length(self) -> int:
+        if self._delta_chain_length is None:
+            raw = (os.getenv("ASSISTANT_DELTA_CHAIN_LENGTH") or "").strip()
+            self._delta_chain_length = (
+                int(raw)
+                if raw.isdigit() and int(raw) > 0
+                else self._DEFAULT_DELTA_CHAIN_LENGTH
+            )
+        return self._delta_chain_length
+
+    @property
+    def storage(self) -> str:
+        if self._storage is None:
+            raw = (os.getenv("ASSISTANT_STORAGE") or "memory").strip().lower()
+            self._storage = raw if raw in self._ALLOWED_STORAGES else "memory"
+        return self._storage
+
+    @property
+    def snapshot_format(self) -> str:
+        if self._snapshot_format is None:
+            raw = (os.getenv("ASSISTANT_SNAPSHOT_FORMAT") or "stream").strip().lower()
+            self._snapshot_format = (
+                raw if raw in self._ALLOWED_SNAPSHOT_FORMATS else "stream"
+            )
+        return self._snapshot_format
+
+    @property
+    def snapshot_codec(self) -> str:
+        if self._snapshot_codec is None:
+            raw = (os.getenv("ASSISTANT_SNAPSHOT_CODEC") or "pickle").strip().lower()
+            self._snapshot_codec = (
+                raw if raw in self._ALLOWED_SNAPSHOT_CODECS else "pickle"
+            )
+        return self._snapshot_codec
+
+    @property
+    def compression(self) -> str:
+        if self._compression is None:
+            raw = (os.getenv("ASSISTANT_COMPRESSION") or "none").strip().lower()
+            try:
+                # Формат "метод[:рівень]", напр. "zlib:6"; помилкове значення вимикає
+                self._compression = str(Compression.parse(raw) or "none")
+            except InvalidError:
+                self._compression = "none"
+        return self._compression
+
+    @property
+    def group_commit_window(self) -> float:
+        if self._group_commit_window is None:
+            raw = (os.getenv("ASSISTANT_GROUP_COMMIT_MS") or "").strip()
+            self._group_commit_window = int(raw) / 1000 if raw.isdigit() else 0.0
+        return self._group_commit_window
+
+    @property
+    def autosave_interval(self) -> float:
+        if self._autosave_interval is None:
+            raw = (os.getenv("ASSISTANT_AUTOSAVE_SECONDS") or "").strip()
+            # 0 — фонове автозбереження вимкнене
+            self._autosave_interval = float(raw) if raw.isdigit() else 0.0
+        return self._autosave_interval
+
+    @property
+    def retention_settings(self) -> Optional[dict[str, int]]:
+        """Retention limits, or None when no ASSISTANT_RETENTION_* is set."""
+        if not self._retention_loaded:
+            settings: dict[str, int] = {}
+            configured = False
+            for key, (env_name, default) in self._RETENTION_ENV.items():
+                raw = (os.getenv(env_name) or "").strip()
+                configured = configured or raw.isdigit()
+                settings[key] = int(raw) if raw.isdigit() else default
+            # Прибирання видаляє файли — вмикається лише явним налаштуванням
+            self._retention_settings = settings if configured else None
+            self._retention_loaded = True
+        return self._retention_settings
+
+    @property
+    def contacts_db_path(self) -> Path:
+        return self.contacts_dir / "contacts.db"
+
+    @property
+    def notes_db_path(self) -> Path:
+        return self.notes_dir / "notes.db"
+
     def set_contacts_dir(self, path: Path) -> None:
         self._contacts_dir = path
 
@@ -17,18 +17,20 @@ from dal.entities.record import Record
 
 
 def render_calendar_with_clock(
-    records: Iterable[Record],
+    records: Iterable[Record] = (),
     *,
     month: int | None = None,
     year: int | None = None,
     now: datetime | None = None,
+    birthdays: dict[int, list[str]] | None = None,
 ) -> str:
     now = now or datetime.now()
     today = now.date()
     resolved_year = year or today.year
     resolved_month = month or today.month
 
-    birthday_map = _collect_birthdays(records, resolved_year)
+    if birthdays is None:
+        birthdays = _collect_birthdays(records, resolved_year).get(resolved_month, {})
 
     buffer = StringIO()
     console = Console(
@@ -45,7 +47,7 @@ def render_calendar_with_clock(
             resolved_month,
             resolved_year,
             today=today,
-            birthdays=birthday_map.get(resolved_month, {}),
+            birthdays=birthdays,
         )
     )
 
@@ -0,0 +1,84 @@
+from bll.validation_policies.phone_validation_policy import PhoneValidationPolicy
+from dal.entities.record import Record
+from dal.storages.i_serializable_storage import ISerializableStorage
+from dal.storages.observable_storage import ObservableStorage, StorageEvent
+
+
+class PhoneIndex[Key]:
+    """Incremental phone key → record keys index for reverse lookup.
+
+    Keys come from ``PhoneValidationPolicy.phone_key`` for the region active
+    at build time; switching the region rebuilds the index on the next lookup.
+    """
+
+    def __init__(self, storage: ObservableStorage[Key, Record]) -> None:
+        self.storage = storage
+        # Номер майже завжди належить одному контакту — кортеж дешевший за множину
+        self._keys_by_phone: dict[str, tuple[Key, ...]] = {}
+        self._phones_by_key: dict[Key, tuple[str, ...]] = {}
+        self._region: str | None = None
+        self._stale = True
+
+        storage.subscribe(self._on_storage_changed)
+
+    def find(self, phone: str) -> list[Key]:
+        self._ensure_built()
+        return list(self._keys_by_phone.get(PhoneValidationPolicy.phone_key(phone), ()))
+
+    def phones_of(self, key: Key) -> tuple[str, ...]:
+        """Phone keys of the last stored version of ``key``."""
+        self._ensure_built()
+        return self._phones_by_key.get(key, ())
+
+    def _ensure_built(self) -> None:
+        if not self._stale and self._region == PhoneValidationPolicy.get_region():
+            return
+
+        self._keys_by_phone.clear()
+        self._phones_by_key.clear()
+        self._region = PhoneValidationPolicy.get_region()
+
+        if isinstance(self.storage, ISerializableStorage):
+            for key, record in self.storage.export_state().items():
+                self._index(key, record)
+
+        self._stale = False
+
+    def _index(self, key: Key, record: Record) -> None:
+        self._unindex(key)
+
+        phone_key = PhoneValidationPolicy.phone_key
+        phones = tuple(dict.fromkeys(phone_key(phone.value) for phone in record.phones))
+        keys_by_phone = self._keys_by_phone
+        for phone in phones:
+            keys = keys_by_phone.get(phone)
+            keys_by_phone[phone] = (key,) if keys is None else (*keys, key)
+
+        if phones:
+            self._phones_by_key[key] = phones
+
+    def _unindex(self, key: Key) -> None:
+        for phone in self._phones_by_key.pop(key, ()):
+            keys = tuple(k for k in self._keys_by_phone.get(phone, ()) if k != key)
+            if keys:
+                self._keys_by_phone[phone] = keys
+            else:
+                self._keys_by_phone.pop(phone, None)
+
+    def _on_storage_changed(
+        self, event: StorageEvent, key: Key | None, item: Record | None
+    ) -> None:
+        if self._stale:
+            return
+
+        if event == "import":
+            # Стан замінено повністю — перебудуємо при наступному запиті
+            self._stale = True
+            return
+        if key is None:
+            return
+
+        if event == "delete":
+            self._unindex(key)
+        elif item is not None:
+            self._index(key, item)
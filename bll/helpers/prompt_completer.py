@@ -1,10 +1,44 @@
-from typing import Iterable, List
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, Iterator, List
 
 from prompt_toolkit.completion import Completer, Completion
 
 from bll.services.command_service.command_service import CommandService
 from bll.services.note_service.note_service import NoteService
 from bll.services.record_service.record_service import RecordService
+from dal.storages.lazy_dict import LazyDict
+from dal.storages.observable_storage import ObservableStorage
+
+
+class _VersionedList:
+    """Sorted completion source rebuilt only when its storage version changes."""
+
+    def __init__(self, service: Any, build: Callable[[], List[str]]):
+        self._service = service
+        self._build = build
+        self._version: int | None = None
+        self._values: List[str] = []
+
+    def get(self) -> List[str]:
+        storage = getattr(self._service, "storage", None)
+        if not isinstance(storage, ObservableStorage):
+            return self._build()
+
+        if self._version != storage.version:
+            self._values = self._build()
+            self._version = storage.version
+        return self._values
+
+    def with_prefix(self, prefix: str) -> Iterator[str]:
+        return _with_prefix(self.get(), prefix)
+
+
+def _with_prefix(sorted_values: List[str], prefix: str) -> Iterator[str]:
+    # Відсортований список: усі збіги з префіксом ідуть поспіль
+    index = bisect_left(sorted_values, prefix)
+    while index < len(sorted_values) and sorted_values[index].startswith(prefix):
+        yield sorted_values[index]
+        index += 1
 
 
 class PromptCompleter(Completer):
@@ -17,8 +51,17 @@ class PromptCompleter(Completer):
         self._command_service = command_service
         self._record_service = record_service
         self._note_service = note_service
+        self._contact_names = _VersionedList(record_service, self._get_contact_names)
+        self._note_names = _VersionedList(note_service, self._get_note_names)
+        self._all_tags = _VersionedList(note_service, self._get_all_tags)
 
     def _get_contact_names(self) -> List[str]:
+        storage = getattr(self._record_service, "storage", None)
+        data = getattr(storage, "data", None)
+        if isinstance(data, LazyDict):
+            # Ключі лінивого сховища — імена; записи не розпаковуємо
+            return sorted(data)
+
         names = []
         for rec in self._record_service.get_all():
             name = getattr(getattr(rec, "name", None), "value", None)
@@ -27,6 +70,10 @@ class PromptCompleter(Completer):
         return sorted(set(names))
 
     def _get_record_by_name(self, name: str):
+        storage = getattr(self._record_service, "storage", None)
+        if storage is not None:
+            return storage.find(name)
+
         for rec in self._record_service.get_all():
             rec_name = getattr(getattr(rec, "name", None), "value", None)
             if rec_name == name:
@@ -124,17 +171,28 @@ class PromptCompleter(Completer):
         return sorted(tags)
 
     def _get_tags_for_note(self, note_name: str) -> list[str]:
+        note = self._get_note_by_name(note_name)
+        if note is None:
+            return []
+
+        raw_tags = getattr(note, "tags", []) or []
+        tags = []
+        for tag in raw_tags:
+            tag_value = getattr(tag, "value", str(tag))
+            if tag_value:
+                tags.append(str(tag_value))
+        return sorted(set(tags))
+
+    def _get_note_by_name(self, note_name: str):
+        storage = getattr(self._note_service, "storage", None)
+        if storage is not None:
+            return storage.find(note_name)
+
         for note in self._note_service.get_all():
             n = getattr(getattr(note, "name", None), "value", None)
             if n == note_name:
-                raw_tags = getattr(note, "tags", []) or []
-                tags = []
-                for tag in raw_tags:
-                    tag_value = getattr(tag, "value", str(tag))
-                    if tag_value:
-                        tags.append(str(tag_value))
-                return sorted(set(tags))
-        return []
+                return note
+        return None
 
     def get_completions(self, document, complete_event) -> Iterable[Completion]:
         text = document.text_before_cursor
@@ -179,9 +237,8 @@ class PromptCompleter(Completer):
         # - якщо контакт існує, підказуємо ім'я (1-й аргумент)
         if cmd == "add-phone":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             # phone не доповнюємо
             return
 
@@ -190,9 +247,8 @@ class PromptCompleter(Completer):
         # - 2-й аргумент - phone цього контакту
         if cmd == "delete-phone":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             elif arg_index == 2:
                 contact_name = parts[1]
                 for phone in self._get_contact_phones(contact_name):
@@ -203,9 +259,8 @@ class PromptCompleter(Completer):
         # add-email [name] [new_email] - тільки ім'я
         if cmd == "add-email":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             # new_email не доповнюємо
             return
 
@@ -214,9 +269,8 @@ class PromptCompleter(Completer):
         # - 2-й аргумент - емейл цього контакту
         if cmd == "delete-email":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             elif arg_index == 2:
                 contact_name = parts[1]
                 for email in self._get_contact_emails(contact_name):
@@ -227,26 +281,23 @@ class PromptCompleter(Completer):
         # set-address [name] [address] - тільки ім'я
         if cmd == "set-address":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             # address не доповнюємо
             return
 
         # clear-address [name] - ім'я
         if cmd == "clear-address":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             return
 
         # delete-contact [name] → ім'я
         if cmd == "delete-contact":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             return
 
         # show-all-contacts - нічого не доповнюємо
@@ -260,26 +311,23 @@ class PromptCompleter(Completer):
         # add-birthday [name] [birthday] - тільки ім'я
         if cmd == "add-birthday":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             # birthday не доповнюємо
             return
 
         # clear-birthday [name] - ім'я
         if cmd == "clear-birthday":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             return
 
         # show-contact [name] - ім'я
         if cmd == "show-contact":
             if arg_index == 1:
-                for name in self._get_contact_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._contact_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             return
 
         # upcoming-birthdays [days] - нічого не доповнюємо
@@ -334,9 +382,8 @@ class PromptCompleter(Completer):
         if cmd in note_title_commands:
             # Перший аргумент: ім'я нотатки
             if arg_index == 1:
-                for name in self._get_note_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._note_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
 
             # =========================================================
             #        АВТОКОМПЛІТ ДЛЯ ТЕГІВ
@@ -344,9 +391,8 @@ class PromptCompleter(Completer):
 
             # add-note-tags [name] [tag]
             if cmd == "add-note-tags" and arg_index >= 2:
-                for tag in self._get_all_tags():
-                    if tag.startswith(prefix):
-                        yield Completion(tag, start_position=-len(prefix))
+                for tag in self._all_tags.with_prefix(prefix):
+                    yield Completion(tag, start_position=-len(prefix))
 
             # remove-note-tag [name] [tag]
             if cmd == "remove-note-tag" and arg_index == 2:
@@ -364,9 +410,8 @@ class PromptCompleter(Completer):
         # show-note [note-name] - ім'я
         if cmd == "show-note":
             if arg_index == 1:
-                for name in self._get_note_names():
-                    if name.startswith(prefix):
-                        yield Completion(name, start_position=-len(prefix))
+                for name in self._note_names.with_prefix(prefix):
+                    yield Completion(name, start_position=-len(prefix))
             return
 
         # search-notes [text] - нічого
@@ -376,9 +421,8 @@ class PromptCompleter(Completer):
         # show-notes-by-tag [tag]
         if cmd == "show-notes-by-tag":
             if arg_index == 1:
-                for tag in self._get_all_tags():
-                    if tag.startswith(prefix):
-                        yield Completion(tag, start_position=-len(prefix))
+                for tag in self._all_tags.with_prefix(prefix):
+                    yield Completion(tag, start_position=-len(prefix))
             return
 
         # save-note [name] - тільки команда
@@ -1,15 +1,51 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Callable
 
+from dal.entities.birthday import Birthday
 from dal.entities.field import Field
+from dal.entities.note import Note
+from dal.entities.record import Record
 from dal.exceptions.invalid_error import InvalidError
 
+type Extractor = Callable[[Any], list[str]]
+
 
 class SearchHelper:
     """Utility helpers for free-text search across arbitrary entities."""
 
+    _extractors: dict[type, Extractor] = {}
+    _resolved: dict[type, Extractor | None] = {}
+
+    @classmethod
+    def register_extractor(cls, entity_type: type) -> Callable[[Extractor], Extractor]:
+        def decorator(extractor: Extractor) -> Extractor:
+            cls._extractors[entity_type] = extractor
+            cls._resolved.clear()
+            return extractor
+
+        return decorator
+
+    @classmethod
+    def get_extractor(cls, entity_type: type) -> Extractor | None:
+        if entity_type not in cls._resolved:
+            cls._resolved[entity_type] = next(
+                (
+                    cls._extractors[base]
+                    for base in entity_type.__mro__
+                    if base in cls._extractors
+                ),
+                None,
+            )
+        return cls._resolved[entity_type]
+
+    @staticmethod
+    def haystack(obj: Any) -> str:
+        # Без кешу: поля сутностей змінюються на місці, і без подій сховища кеш
+        # застаріє; для сховищ з подіями слова записів тримає SearchIndex
+        return " ".join(SearchHelper.collect_strings(obj)).lower()
+
     @staticmethod
     def prepare_tokens(query: str) -> list[str]:
         if query is None:
@@ -27,11 +63,19 @@ class SearchHelper:
         if not tokens:
             return False
 
-        haystack = " ".join(SearchHelper.collect_strings(obj)).lower()
+        haystack = SearchHelper.haystack(obj)
         return all(token in haystack for token in tokens)
 
     @staticmethod
     def collect_strings(obj: Any) -> list[str]:
+        extractor = SearchHelper.get_extractor(type(obj))
+        if extractor is not None:
+            return extractor(obj)
+
+        return SearchHelper._walk_strings(obj)
+
+    @staticmethod
+    def _walk_strings(obj: Any) -> list[str]:
         results: list[str] = []
         visited: set[int] = set()
 
@@ -85,3 +129,36 @@ class SearchHelper:
 
         walk(obj)
         return results
+
+
+@SearchHelper.register_extractor(Field)
+def _extract_field(field: Field) -> list[str]:
+    return [str(field)]
+
+
+@SearchHelper.register_extractor(Birthday)
+def _extract_birthday(birthday: Birthday) -> list[str]:
+    # Шукаємо і за форматом вводу, і за ISO-датою
+    return [str(birthday), str(birthday.value)]
+
+
+@SearchHelper.register_extractor(Record)
+def _extract_record(record: Record) -> list[str]:
+    strings = [record.name.value]
+    strings.extend(phone.value for phone in record.phones)
+    strings.extend(email.value for email in record.emails)
+    if record.birthday is not None:
+        strings.extend(_extract_birthday(record.birthday))
+    if record.address is not None:
+        strings.append(record.address.value)
+    return strings
+
+
+@SearchHelper.register_extractor(Note)
+def _extract_note(note: Note) -> list[str]:
+    strings = [note.name.value, note.title.value, note.content.value]
+    strings.append(str(note.created_at))
+    if note.updated_at is not None:
+        strings.append(str(note.updated_at))
+    strings.extend(str(tag) for tag in note.tags)
+    return strings
@@ -0,0 +1,154 @@
+from typing import Any, Callable, Iterable
+
+from bll.helpers.search_helper import SearchHelper
+from dal.storages.i_serializable_storage import ISerializableStorage
+from dal.storages.observable_storage import ObservableStorage, StorageEvent
+
+GRAM_SIZE = 3
+
+
+class SearchIndex[Key, Item]:
+    """Incremental word/trigram index with SearchHelper substring semantics.
+
+    Tokens contain no whitespace, so a token occurs in the joined haystack
+    exactly when it occurs inside one of its words.
+    """
+
+    def __init__(
+        self,
+        storage: ObservableStorage[Key, Item],
+        extract: Callable[[Any], list[str]] = SearchHelper.collect_strings,
+    ) -> None:
+        self.storage = storage
+        self._extract = extract
+        self._postings: dict[str, set[Key]] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._words_by_key: dict[Key, frozenset[str]] = {}
+        self._order: dict[Key, int] = {}
+        self._next_order = 0
+        self._stale = True
+
+        storage.subscribe(self._on_storage_changed)
+
+    def search(self, tokens: list[str]) -> list[Key]:
+        if not tokens:
+            return []
+
+        self._ensure_built()
+
+        matched: set[Key] | None = None
+        # Найвибірковіші (довші) токени першими — менші проміжні множини
+        for token in sorted(tokens, key=len, reverse=True):
+            keys = self._keys_for_token(token)
+            matched = keys if matched is None else matched & keys
+            if not matched:
+                return []
+
+        return sorted(matched or (), key=self._order.__getitem__)
+
+    def _keys_for_token(self, token: str) -> set[Key]:
+        keys: set[Key] = set()
+        for word in self._words_containing(token):
+            keys |= self._postings[word]
+        return keys
+
+    def _words_containing(self, token: str) -> Iterable[str]:
+        if len(token) < GRAM_SIZE:
+            # Короткі токени невибіркові — перевіряємо весь словник
+            return [word for word in self._postings if token in word]
+
+        gram_sets = sorted(
+            (self._grams.get(gram, set()) for gram in self._token_grams(token)),
+            key=len,
+        )
+        candidates = set(gram_sets[0]).intersection(*gram_sets[1:])
+        return [word for word in candidates if token in word]
+
+    def _ensure_built(self) -> None:
+        if not self._stale:
+            return
+
+        self._postings.clear()
+        self._grams.clear()
+        self._words_by_key.clear()
+        self._order.clear()
+        self._next_order = 0
+
+        if isinstance(self.storage, ISerializableStorage):
+            for key, item in self.storage.export_state().items():
+                self._index(key, item)
+
+        self._stale = False
+
+    def _index(self, key: Key, item: Item) -> None:
+        haystack = " ".join(self._extract(item)).lower()
+        words = frozenset(haystack.split())
+
+        previous = self._words_by_key.get(key, frozenset())
+        for word in previous - words:
+            self._remove_posting(word, key)
+        postings_by_word = self._postings
+        for word in words - previous:
+            # Гаряча гілка при побудові — без виклику _add_posting на кожне слово
+            postings = postings_by_word.get(word)
+            if postings is None:
+                self._add_posting(word, key)
+            else:
+                postings.add(key)
+
+        self._words_by_key[key] = words
+        if key not in self._order:
+            self._order[key] = self._next_order
+            self._next_order += 1
+
+    def _unindex(self, key: Key) -> None:
+        for word in self._words_by_key.pop(key, frozenset()):
+            self._remove_posting(word, key)
+        self._order.pop(key, None)
+
+    def _add_posting(self, word: str, key: Key) -> None:
+        postings = self._postings.get(word)
+        if postings is None:
+            postings = self._postings[word] = set()
+            for gram in self._token_grams(word):
+                self._grams.setdefault(gram, set()).add(word)
+        postings.add(key)
+
+    def _remove_posting(self, word: str, key: Key) -> None:
+        postings = self._postings.get(word)
+        if postings is None:
+            return
+
+        postings.discard(key)
+        if postings:
+            return
+
+        del self._postings[word]
+        for gram in self._token_grams(word):
+            words = self._grams.get(gram)
+            if words is not None:
+                words.discard(word)
+                if not words:
+                    del self._grams[gram]
+
+    @staticmethod
+    def _token_grams(word: str) -> set[str]:
+        return {word[i : i + GRAM_SIZE] for i in range(len(word) - GRAM_SIZE + 1)}
+
+    def _on_storage_changed(
+        self, event: StorageEvent, key: Key | None, item: Item | None
+    ) -> None:
+        if self._stale:
+            return
+
+        if event == "import":
+            # Стан замінено повністю — перебудуємо при наступному пошуку
+            self._stale = True
+            return
+        if key is None:
+            return
+
+        if event == "delete":
+            self._unindex(key)
+        elif item is not None:
+            self._index(key, item)
@@ -83,6 +83,28 @@ def render_notes_table(notes: Iterable[Note], *, title: str | None = None) -> st
     return _render_table(table)
 
 
+def render_tag_stats_table(
+    stats: Iterable[tuple[Tag, int]], *, title: str | None = None
+) -> str:
+    table = Table(
+        title=title or "Tags",
+        box=box.SQUARE,
+        expand=True,
+        highlight=True,
+        show_lines=False,
+        header_style="bold white",
+    )
+
+    table.add_column("Tag", overflow="fold")
+    table.add_column("Color", style="dim", no_wrap=True)
+    table.add_column("Notes", style="bold cyan", justify="right", no_wrap=True)
+
+    for tag, count in stats:
+        table.add_row(_format_tags([tag]), tag.color or "—", str(count))
+
+    return _render_table(table)
+
+
 def render_note_details(note: Note, *, title: str | None = None) -> str:
     resolved_title = title or f"Note: {note.title.value}"
     return render_notes_table([note], title=resolved_title)
@@ -0,0 +1,121 @@
+from dal.entities.note import Note
+from dal.entities.tag import Tag
+from dal.storages.i_serializable_storage import ISerializableStorage
+from dal.storages.observable_storage import ObservableStorage, StorageEvent
+
+
+class TagIndex[Key]:
+    """Incremental case-folded tag → note keys index with per-tag colors.
+
+    Notes that share a tag name may color it differently; the color first seen
+    among notes that still carry the tag represents it.
+    """
+
+    def __init__(self, storage: ObservableStorage[Key, Note]) -> None:
+        self.storage = storage
+        self._keys_by_tag: dict[str, set[Key]] = {}
+        # Варіанти тегу (назва й колір) з кількістю нотаток у порядку появи
+        self._variants: dict[str, dict[Tag, int]] = {}
+        self._tags_by_key: dict[Key, tuple[Tag, ...]] = {}
+        # Упорядковані результати запитів; скидаються, коли змінюється тег
+        self._sorted_keys: dict[str, list[Key]] = {}
+        self._order: dict[Key, int] = {}
+        self._next_order = 0
+        self._stale = True
+
+        storage.subscribe(self._on_storage_changed)
+
+    def find(self, tag_name: str) -> list[Key]:
+        self._ensure_built()
+        tag_key = Note.tag_key(tag_name)
+        ordered = self._sorted_keys.get(tag_key)
+        if ordered is None:
+            keys = self._keys_by_tag.get(tag_key, ())
+            ordered = sorted(keys, key=self._order.__getitem__)
+            self._sorted_keys[tag_key] = ordered
+        return list(ordered)
+
+    def distinct_tags(self) -> list[Tag]:
+        return [tag for tag, _count in self.counts()]
+
+    def counts(self) -> list[tuple[Tag, int]]:
+        self._ensure_built()
+        stats = [
+            (next(iter(self._variants[tag_key])), len(keys))
+            for tag_key, keys in self._keys_by_tag.items()
+        ]
+        return sorted(stats, key=lambda stat: stat[0].value.lower())
+
+    def _ensure_built(self) -> None:
+        if not self._stale:
+            return
+
+        self._keys_by_tag.clear()
+        self._variants.clear()
+        self._tags_by_key.clear()
+        self._sorted_keys.clear()
+        self._order.clear()
+        self._next_order = 0
+
+        if isinstance(self.storage, ISerializableStorage):
+            for key, note in self.storage.export_state().items():
+                self._index(key, note)
+
+        self._stale = False
+
+    def _index(self, key: Key, note: Note) -> None:
+        self._unindex_tags(key)
+
+        tags = tuple(note.tags)
+        for tag in tags:
+            tag_key = Note.tag_key(tag.value)
+            self._keys_by_tag.setdefault(tag_key, set()).add(key)
+            self._sorted_keys.pop(tag_key, None)
+            variants = self._variants.setdefault(tag_key, {})
+            variants[tag] = variants.get(tag, 0) + 1
+
+        self._tags_by_key[key] = tags
+        if key not in self._order:
+            self._order[key] = self._next_order
+            self._next_order += 1
+
+    def _unindex(self, key: Key) -> None:
+        self._unindex_tags(key)
+        self._order.pop(key, None)
+
+    def _unindex_tags(self, key: Key) -> None:
+        for tag in self._tags_by_key.pop(key, ()):
+            tag_key = Note.tag_key(tag.value)
+            self._sorted_keys.pop(tag_key, None)
+            keys = self._keys_by_tag.get(tag_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag_key]
+
+            variants = self._variants.get(tag_key)
+            if variants is None or tag not in variants:
+                continue
+            variants[tag] -= 1
+            if not variants[tag]:
+                del variants[tag]
+            if not variants:
+                del self._variants[tag_key]
+
+    def _on_storage_changed(
+        self, event: StorageEvent, key: Key | None, item: Note | None
+    ) -> None:
+        if self._stale:
+            return
+
+        if event == "import":
+            # Стан замінено повністю — перебудуємо при наступному запиті
+            self._stale = True
+            return
+        if key is None:
+            return
+
+        if event == "delete":
+            self._unindex(key)
+        elif item is not None:
+            self._index(key, item)
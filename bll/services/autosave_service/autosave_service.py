@@ -0,0 +1,150 @@
+import threading
+import time
+from datetime import datetime
+from typing import Callable
+
+from bll.registries.i_registry import IRegistry
+from bll.services.autosave_service.i_autosave_service import IAutosaveService
+from bll.services.file_service.i_file_service import IFileService
+from dal.storages.observable_storage import ObservableStorage
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+class _PendingChanges:
+    def __init__(self, version: int, now: float) -> None:
+        self.version = version
+        self.first_change = now
+        self.last_change = now
+
+
+class AutosaveService(IAutosaveService):
+    """Saves changed storages from a background thread.
+
+    A save happens once a storage version stays unchanged for ``debounce``
+    seconds, or after ``max_delay`` seconds of continuous changes. Commands
+    must hold ``lock``; file services built with the same ``state_lock``
+    serialize the state under it and write the bytes after releasing it, so
+    every snapshot reflects a state between two commands without blocking them.
+    """
+
+    def __init__(
+        self,
+        file_service_registry: IRegistry,
+        lock: threading.RLock,
+        debounce: float,
+        max_delay: float | None = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.file_service_registry = file_service_registry
+        self.lock = lock
+        self.debounce = debounce
+        self.max_delay = max_delay if max_delay is not None else debounce * 6
+        self.poll_interval = min(poll_interval, debounce) if debounce else poll_interval
+        self._clock = clock
+        self._seen_versions: dict[str, int] = {}
+        self._pending: dict[str, _PendingChanges] = {}
+        self._last_saved_at: dict[str, datetime] = {}
+        self._last_error: dict[str, str] = {}
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        # Стан на момент запуску вважаємо відомим — зберігаємо лише нові зміни
+        self.run_once()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def run_once(self) -> list[str]:
+        now = self._clock()
+        saved: list[str] = []
+
+        for key, service in self.file_service_registry.get_all().items():
+            version = self._version_of(service)
+            if version is None:
+                continue
+
+            if key not in self._seen_versions:
+                # Перше спостереження — лише запам'ятовуємо, зберігаємо нові зміни
+                self._seen_versions[key] = version
+            elif version != self._seen_versions[key]:
+                self._seen_versions[key] = version
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = _PendingChanges(version, now)
+                else:
+                    pending.version = version
+                    pending.last_change = now
+
+            pending = self._pending.get(key)
+            if pending is None or not self._is_due(pending, now):
+                continue
+
+            if self._save(key, service):
+                saved.append(key)
+            else:
+                # Повторимо після наступної паузи, а не на кожному опитуванні
+                pending.first_change = pending.last_change = now
+
+        return saved
+
+    def get_last_saved_at(self, key: str) -> datetime | None:
+        return self._last_saved_at.get(key)
+
+    def describe_status(self) -> str:
+        parts = []
+        for key in self.file_service_registry.get_all():
+            if key in self._last_error:
+                parts.append(f"{key}: failed ({self._last_error[key]})")
+            elif key in self._last_saved_at:
+                parts.append(f"{key}: {self._last_saved_at[key]:%H:%M:%S}")
+            else:
+                parts.append(f"{key}: —")
+        return "💾 Autosave · " + " · ".join(parts)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.poll_interval):
+            self.run_once()
+
+    def _is_due(self, pending: _PendingChanges, now: float) -> bool:
+        return (
+            now - pending.last_change >= self.debounce
+            or now - pending.first_change >= self.max_delay
+        )
+
+    def _save(self, key: str, service: IFileService) -> bool:
+        try:
+            with self.lock:
+                # Версію знімаємо до збереження — зміни під час запису не загубляться
+                version = self._version_of(service)
+                save_able = service.is_save_able()
+            if save_able:
+                service.save_with_name()
+                self._last_saved_at[key] = datetime.now()
+        except Exception as e:
+            self._last_error[key] = str(e)
+            return False
+
+        self._last_error.pop(key, None)
+        self._pending.pop(key, None)
+        if version is not None:
+            self._seen_versions[key] = version
+        return True
+
+    @staticmethod
+    def _version_of(service: IFileService) -> int | None:
+        storage = getattr(service, "storage", None)
+        if isinstance(storage, ObservableStorage):
+            return storage.version
+        return None
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class IAutosaveService(ABC):
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def run_once(self) -> list[str]:
+        pass
+
+    @abstractmethod
+    def get_last_saved_at(self, key: str) -> datetime | None:
+        pass
+
+    @abstractmethod
+    def describe_status(self) -> str:
+        pass
@@ -1,5 +1,6 @@
 import calendar
 import inspect
+from datetime import datetime
 from typing import Optional
 
 from colorama import Fore, Style
@@ -11,10 +12,12 @@ from bll.helpers.table_renderer import (
     render_contacts_table,
     render_note_details,
     render_notes_table,
+    render_tag_stats_table,
 )
 from bll.helpers.tag_palette import TAG_COLORS
 from bll.registries.i_registry import IRegistry
 from bll.services.command_service.i_command_service import ICommandService
+from bll.services.file_service.startup_loader import StartupLoader
 from bll.services.input_service.i_input_service import IInputService
 from bll.services.note_service.i_note_service import INoteService
 from bll.services.record_service.i_record_service import IRecordService
@@ -24,10 +27,50 @@ from dal.entities.note import Note
 from dal.entities.record import Record
 from dal.exceptions.exit_bot_error import ExitBotError
 from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.compression import Compression
 
 
 class CommandService(ICommandService):
     TAG_COLOR_CHOICES = TAG_COLORS
+    CONTACT_COMMANDS = (
+        "calendar",
+        "add-contact",
+        "delete-contact",
+        "all-contacts",
+        "show-contact",
+        "add-phone",
+        "delete-phone",
+        "add-email",
+        "delete-email",
+        "set-address",
+        "clear-address",
+        "add-birthday",
+        "clear-birthday",
+        "upcoming-birthdays",
+        "search-contacts",
+        "find-by-phone",
+        "save-contact",
+        "load-contact",
+        "delete-contact-file",
+        "contacts-files",
+    )
+    NOTE_COMMANDS = (
+        "add-note",
+        "delete-note",
+        "show-note",
+        "all-notes",
+        "search-notes",
+        "edit-note-title",
+        "edit-note-content",
+        "add-note-tags",
+        "remove-note-tag",
+        "show-notes-by-tag",
+        "tag-stats",
+        "save-note",
+        "load-note",
+        "delete-note-file",
+        "note-files",
+    )
 
     def __init__(
         self,
@@ -35,12 +78,22 @@ class CommandService(ICommandService):
         note_service: INoteService,
         input_service: IInputService,
         file_service_registry: IRegistry,
+        startup_loader: StartupLoader | None = None,
     ) -> None:
         self.record_service = record_service
         self.note_service = note_service
         self.input_service = input_service
         self.file_service_registry = file_service_registry
+        self.startup_loader = startup_loader
         self._help_text: str | None = None
+        self._required_storages: dict[str, tuple[str, ...]] = {
+            **{name: ("contacts",) for name in self.CONTACT_COMMANDS},
+            **{name: ("notes",) for name in self.NOTE_COMMANDS},
+            "exit": ("contacts", "notes"),
+            "close": ("contacts", "notes"),
+            "compact-files": ("contacts", "notes"),
+            "benchmark-compression": ("contacts", "notes"),
+        }
 
         self.commands: dict[str, Command] = {
             # Basic Commands
@@ -122,6 +175,11 @@ class CommandService(ICommandService):
                 self.search_contacts,
                 "🔍 Find contacts by name, phone, email, etc.",
             ),
+            "find-by-phone": Command(
+                "find-by-phone [phone]",
+                self.find_by_phone,
+                "☎️ Find contacts by phone in any format",
+            ),
             "save-contact": Command(
                 "save-contact [file-name]?",
                 self.save_contact_state,
@@ -187,6 +245,11 @@ class CommandService(ICommandService):
                 self.show_notes_by_tag,
                 "🏷️ Filter notes by tag",
             ),
+            "tag-stats": Command(
+                "tag-stats",
+                self.show_tag_stats,
+                "📊 Show how many notes use each tag",
+            ),
             "save-note": Command(
                 "save-note [file-name]?",
                 self.save_note_state,
@@ -205,6 +268,21 @@ class CommandService(ICommandService):
             "note-files": Command(
                 "note-files", self.show_note_files, "📁 List saved notes files"
             ),
+            "compact-files": Command(
+                "compact-files",
+                self.compact_files,
+                "🧹 Prune old autosaves by retention policy",
+            ),
+            "benchmark-compression": Command(
+                "benchmark-compression",
+                self.benchmark_compression,
+                "📊 Compare snapshot compression: size vs. save/load time",
+            ),
+            "load-times": Command(
+                "load-times",
+                self.show_load_times,
+                "⏱️ Show how long startup loading took",
+            ),
         }
 
     def execute(self, command_name: str, arguments: list[str]) -> str:
@@ -212,6 +290,8 @@ class CommandService(ICommandService):
         if not command:
             raise InvalidError("Invalid command")
 
+        self._wait_for_storages(command_name)
+
         handler = command.handler
         sig = inspect.signature(handler)
         param_count = len(sig.parameters)
@@ -240,6 +320,8 @@ class CommandService(ICommandService):
     @command_handler_decorator
     def add_phone(self, arguments: list[str]) -> str:
         name, new_phone = [arg.strip() for arg in arguments]
+        # Перевіряємо до змін: білдер змінює збережений запис на місці
+        self.record_service.ensure_phone_available(name, new_phone)
 
         contact = (
             self.record_service.get_by_name(name).update().add_phone(new_phone).build()
@@ -353,8 +435,13 @@ class CommandService(ICommandService):
     @command_handler_decorator
     def show_calendar(self, arguments: list[str] | None = None) -> str:
         month, year = self._resolve_calendar_arguments(arguments or [])
-        contacts = self.record_service.get_all() or []
-        return render_calendar_with_clock(contacts, month=month, year=year)
+        now = datetime.now()
+        month = month or now.month
+        year = year or now.year
+        birthdays = self.record_service.get_birthday_calendar(month, year)
+        return render_calendar_with_clock(
+            month=month, year=year, now=now, birthdays=birthdays
+        )
 
     @command_handler_decorator
     def add_email(self, arguments: list[str]) -> str:
@@ -438,6 +525,7 @@ class CommandService(ICommandService):
                     "set-address",
                     "clear-address",
                     "search-contacts",
+                    "find-by-phone",
                 ],
                 "🎂 Birthdays": [
                     "add-birthday",
@@ -455,6 +543,7 @@ class CommandService(ICommandService):
                     "add-note-tags",
                     "remove-note-tag",
                     "show-notes-by-tag",
+                    "tag-stats",
                 ],
                 "💾 Files": [
                     "save-contact",
@@ -465,8 +554,17 @@ class CommandService(ICommandService):
                     "load-note",
                     "delete-note-file",
                     "note-files",
+                    "compact-files",
+                    "benchmark-compression",
+                ],
+                "⚙️ System": [
+                    "hello",
+                    "help",
+                    "exit",
+                    "close",
+                    "calendar",
+                    "load-times",
                 ],
-                "⚙️ System": ["hello", "help", "exit", "close", "calendar"],
             }
             lines: list[str] = []
             for title, cmds in sections.items():
@@ -523,6 +621,42 @@ class CommandService(ICommandService):
     def show_note_files(self) -> str:
         return self._show_all_state_files("notes")
 
+    @command_handler_decorator
+    def compact_files(self) -> str:
+        lines: list[str] = []
+        for key, service in self.file_service_registry.get_all().items():
+            removed, reclaimed = service.compact()
+            lines.append(
+                f"  • {key}: removed {removed} file(s), "
+                f"reclaimed {self._format_size(reclaimed)}"
+            )
+
+        return f"{Fore.GREEN}🧹 Compaction finished:{Style.RESET_ALL}\n" + "\n".join(
+            lines
+        )
+
+    @command_handler_decorator
+    def show_load_times(self) -> str:
+        if self.startup_loader is None:
+            return f"{Fore.YELLOW}Startup loading was not tracked.{Style.RESET_ALL}"
+
+        lines: list[str] = []
+        for key, report in self.startup_loader.get_reports().items():
+            if report is None:
+                lines.append(f"  • {key}: still loading…")
+            elif report.error is not None:
+                lines.append(
+                    f"  • {key}: failed after {report.elapsed:.3f}s — {report.error}"
+                )
+            else:
+                lines.append(
+                    f"  • {key}: '{report.file_name}' in {report.elapsed:.3f}s"
+                )
+
+        if not lines:
+            return f"{Fore.YELLOW}Nothing was loaded at startup.{Style.RESET_ALL}"
+        return f"{Fore.GREEN}⏱️ Startup loading:{Style.RESET_ALL}\n" + "\n".join(lines)
+
     @command_handler_decorator
     def add_note(self, arguments: list[str]) -> str:
         note_name = arguments[0].strip()
@@ -653,6 +787,18 @@ class CommandService(ICommandService):
         title = f"🔍 Found {len(matches)} contact(s) matching '{query}'"
         return render_contacts_table(matches, title=title)
 
+    @command_handler_decorator
+    def find_by_phone(self, arguments: list[str]) -> str:
+        # Номер із пробілами приходить кількома аргументами
+        phone = " ".join(arguments).strip()
+        matches = self.record_service.find_by_phone(phone)
+
+        if not matches:
+            return f"{Fore.YELLOW}☎️ No contacts with phone '{phone}'{Style.RESET_ALL}"
+
+        title = f"☎️ Found {len(matches)} contact(s) with phone '{phone}'"
+        return render_contacts_table(matches, title=title)
+
     @command_handler_decorator
     def search_notes(self, arguments: list[str]) -> str:
         query = " ".join(arguments).strip()
@@ -825,6 +971,14 @@ class CommandService(ICommandService):
         )
         return render_notes_table(notes, title=title)
 
+    @command_handler_decorator
+    def show_tag_stats(self) -> str:
+        stats = self.note_service.get_tag_stats()
+        if not stats:
+            return f"{Fore.YELLOW}🏷️ No tags yet{Style.RESET_ALL}"
+
+        return render_tag_stats_table(stats, title=f"📊 Tags ({len(stats)})")
+
     def _contact_response(
         self, message: str, contact: Record, *, title: str | None = None
     ) -> str:
@@ -933,6 +1087,33 @@ class CommandService(ICommandService):
         file_service.delete_by_name(file_name)
         return f"{Fore.GREEN}✅ File '{file_name}' deleted{Style.RESET_ALL}"
 
+    @command_handler_decorator
+    def benchmark_compression(self) -> str:
+        candidates = Compression.benchmark_candidates()
+        sections: list[str] = []
+        for key, service in self.file_service_registry.get_all().items():
+            try:
+                reports = service.benchmark_compression(candidates)
+            except InvalidError as e:
+                sections.append(f"  {key}: {e}")
+                continue
+
+            baseline = reports[0].size or 1
+            lines = [f"  {key}:"]
+            for report in reports:
+                lines.append(
+                    f"    {report.label:<7} {self._format_size(report.size):>10}  "
+                    f"{report.size / baseline:6.1%}  "
+                    f"save {report.save_seconds * 1000:7.1f} ms  "
+                    f"load {report.load_seconds * 1000:7.1f} ms"
+                )
+            sections.append("\n".join(lines))
+
+        return (
+            f"{Fore.CYAN}📊 Compression benchmark (in memory):{Style.RESET_ALL}\n"
+            + "\n".join(sections)
+        )
+
     def _show_all_state_files(self, key: str) -> str:
         file_service = self.file_service_registry.get(key)
         file_names = file_service.get_file_list()
@@ -943,8 +1124,28 @@ class CommandService(ICommandService):
         files_list = "\n".join(f"  • {name}" for name in file_names)
         return f"{Fore.CYAN}📁 Available files:{Style.RESET_ALL}\n" + files_list
 
+    @staticmethod
+    def _format_size(size: int) -> str:
+        value = float(size)
+        for unit in ("B", "KB", "MB"):
+            if value < 1024:
+                return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+            value /= 1024
+        return f"{value:.1f} GB"
+
+    def _wait_for_storages(self, command_name: str) -> None:
+        if self.startup_loader is None:
+            return
+
+        for key in self._required_storages.get(command_name, ()):
+            if not self.startup_loader.is_ready(key):
+                print(f"{Fore.YELLOW}⏳ Waiting for {key} to load…{Style.RESET_ALL}")
+            self.startup_loader.wait(key)
+
     def _save_all_states(self) -> None:
         for key, service in self.file_service_registry.get_all().items():
             if service.is_save_able():
                 saved_file = service.save_with_name()
                 print(f"{Fore.GREEN}💾 [{key}] saved → {saved_file}{Style.RESET_ALL}")
+            # Відкладені групові записи мають опинитися на диску до виходу
+            service.flush()
@@ -0,0 +1,148 @@
+import threading
+from collections.abc import MutableMapping
+from typing import Iterable
+
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.i_delta_file_manager import IDeltaFileManager
+from dal.file_managers.i_encoding_file_manager import IEncodingFileManager
+from dal.file_managers.i_file_manager import IFileManager
+
+
+class DeltaChain[Data: MutableMapping]:
+    """Delta snapshots of one file manager, chained to a full base snapshot.
+
+    Keeps the snapshot the next delta builds on and the deltas written since
+    the last full one; ``limit`` deltas trigger a rebase, 0 turns deltas off.
+    """
+
+    def __init__(self, file_manager: IFileManager[Data], limit: int = 0) -> None:
+        self.file_manager = file_manager
+        self.limit = limit
+        # Знімок, що точно відповідає стану до незбережених змін
+        self.parent: str | None = None
+        # Дельти від останнього повного знімка до parent
+        self._deltas: list[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit > 0 and isinstance(self.file_manager, IDeltaFileManager)
+
+    def can_extend(self, changed_count: int, total_count: int) -> bool:
+        if not self.enabled or self.parent is None:
+            return False
+        if not self.file_manager.has_file_with_name(self.parent):
+            return False
+        with self._lock:
+            # Якщо rebase відстає, ланцюжок не росте безмежно
+            if len(self._deltas) >= 2 * self.limit:
+                return False
+        # Коли змінилась більшість записів, повний знімок не більший за дельту
+        return changed_count * 2 <= total_count
+
+    def encode(self, changes: dict) -> bytes:
+        assert isinstance(self.file_manager, IEncodingFileManager)
+        assert isinstance(self.file_manager, IDeltaFileManager)
+        assert self.parent is not None
+        changed, deleted = self._split(changes)
+        return self.file_manager.encode_delta(changed, deleted, self.parent)
+
+    def save(self, changes: dict, name: str) -> str:
+        assert isinstance(self.file_manager, IDeltaFileManager)
+        assert self.parent is not None
+        changed, deleted = self._split(changes)
+        return self.file_manager.save_delta(changed, deleted, self.parent, name)
+
+    def loaded(self, name: str, chain: list[str]) -> None:
+        self.parent = name
+        with self._lock:
+            self._deltas = chain[1:]
+
+    def saved(self, name: str, is_delta: bool) -> bool:
+        """Makes ``name`` the new parent; returns whether a rebase is due."""
+        self.parent = name
+        with self._lock:
+            if is_delta:
+                self._deltas.append(name)
+            else:
+                self._deltas.clear()
+            return len(self._deltas) >= self.limit > 0
+
+    def forget(self, name: str) -> None:
+        if self.parent == name:
+            self.parent = None
+
+    def detach(self) -> None:
+        # Новий стан не походить від збереженого знімка — наступний буде повним
+        self.parent = None
+
+    def chain_of(self, name: str) -> list[str]:
+        """Returns ``[base, delta, ..., name]``, or ``[]`` for a full snapshot."""
+        if not isinstance(self.file_manager, IDeltaFileManager):
+            return []
+
+        chain = [name]
+        parent = self.file_manager.get_delta_parent(name)
+        if parent is None:
+            return []
+
+        while parent is not None:
+            if parent in chain:
+                raise InvalidError(f"Snapshot '{name}' has a cyclic delta chain")
+            if not self.file_manager.has_file_with_name(parent):
+                raise InvalidError(
+                    f"Cannot restore '{name}': base snapshot '{parent}' is missing"
+                )
+            chain.append(parent)
+            parent = self.file_manager.get_delta_parent(parent)
+
+        chain.reverse()
+        return chain
+
+    def reconstruct(self, chain: list[str]) -> Data:
+        assert isinstance(self.file_manager, IDeltaFileManager)
+        data = self.file_manager.load(chain[0])
+        for delta_name in chain[1:]:
+            changed, deleted = self.file_manager.load_delta(delta_name)
+            for key in deleted:
+                data.pop(key, None)
+            data.update(changed)
+        return data
+
+    def rebase(self, name: str) -> None:
+        assert isinstance(self.file_manager, IDeltaFileManager)
+        chain = self.chain_of(name)
+        if not chain:
+            return
+
+        self.file_manager.rebase(self.reconstruct(chain), name)
+        with self._lock:
+            # Знімок тепер повний — довжина ланцюжка рахується від нього
+            if name in self._deltas:
+                del self._deltas[: self._deltas.index(name) + 1]
+
+    def children(self, name: str) -> list[str]:
+        if not isinstance(self.file_manager, IDeltaFileManager):
+            return []
+        parents = self.file_manager.get_delta_parents()
+        return [child for child, parent in parents.items() if parent == name]
+
+    def ancestors(self, names: Iterable[str]) -> set[str]:
+        if not isinstance(self.file_manager, IDeltaFileManager):
+            return set()
+
+        # Батьків беремо з маніфесту — прибирання не читає заголовки файлів
+        parents = self.file_manager.get_delta_parents()
+        ancestors: set[str] = set()
+        for name in names:
+            parent = parents.get(name)
+            while parent is not None and parent not in ancestors:
+                ancestors.add(parent)
+                parent = parents.get(parent)
+        return ancestors
+
+    @staticmethod
+    def _split(changes: dict) -> tuple[dict, list]:
+        changed = {key: item for key, item in changes.items() if item is not None}
+        deleted = [key for key, item in changes.items() if item is None]
+        return changed, deleted
@@ -1,67 +1,151 @@
 import pickle
+import threading
+from collections.abc import MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
+from bll.services.file_service.delta_chain import DeltaChain
 from bll.services.file_service.i_file_service import IFileService
+from bll.services.file_service.journal_writer import (
+    DEFAULT_CHECKPOINT_INTERVAL,
+    JournalWriter,
+)
+from bll.services.file_service.retention_policy import RetentionPolicy
 from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.compression import Compression, CompressionReport
+from dal.file_managers.i_encoding_file_manager import IEncodingFileManager
 from dal.file_managers.i_file_manager import IFileManager
+from dal.file_managers.i_lazy_file_manager import ILazyFileManager
+from dal.file_managers.i_streaming_file_manager import IStreamingFileManager
+from dal.file_managers.snapshot_manifest import TIMESTAMP_FORMAT
+from dal.journals.i_journal import IJournal
+from dal.storages.i_batch_importable_storage import IBatchImportableStorage
+from dal.storages.i_durable_storage import IDurableStorage
+from dal.storages.i_lazy_importable_storage import ILazyImportableStorage
 from dal.storages.i_serializable_storage import ISerializableStorage
+from dal.storages.observable_storage import ObservableStorage, StorageEvent
 
 
-class FileService[Data](IFileService):
+class FileService[Data: MutableMapping](IFileService):
     def __init__(
-        self, file_manager: IFileManager[Data], storage: ISerializableStorage[Data]
+        self,
+        file_manager: IFileManager[Data],
+        storage: ISerializableStorage[Data],
+        journal: IJournal | None = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        retention_policy: RetentionPolicy | None = None,
+        delta_chain_limit: int = 0,
+        state_lock: "threading.RLock | None" = None,
     ) -> None:
         self.file_manager = file_manager
         self.storage = storage
-        self._last_loaded_bytes: bytes | None = None
+        self.retention_policy = retention_policy
+        self._journal = (
+            JournalWriter(journal, checkpoint_interval) if journal is not None else None
+        )
+        # 0 — кожне збереження повне; інакше стільки дельт до фонового rebase.
+        # Журнал і дельти не поєднуються: журнал спирається на повний знімок
+        self._deltas = DeltaChain[Data](
+            file_manager, delta_chain_limit if journal is None else 0
+        )
+        self._retention_lock = threading.Lock()
+        self._background_executor: ThreadPoolExecutor | None = None
+        self._retention_future: Future | None = None
+        self._rebase_future: Future | None = None
+        self._saved_version: int | None = None
         self._last_loaded_name: str | None = None
+        # Знімок, відкритий через mmap: його не можна видалити, поки він відкритий
+        self._lazy_name: str | None = None
+        # Зміни після останнього знімка чи запису в журнал; None — видалення
+        self._pending: dict = {}
+        # Замок, під яким змінюють сховище (у застосунку — замок команд)
+        self._state_lock = state_lock or threading.RLock()
+        # Одне збереження чи завантаження за раз; береться після _state_lock
+        self._save_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+
+        tracks_changes = self._journal is not None or self._deltas.enabled
+        if tracks_changes and isinstance(storage, ObservableStorage):
+            storage.subscribe(self._on_storage_changed)
 
     def save_with_name(self, name: str = "autosave") -> str:
         self._validate_name(name)
-        data_to_save = self.storage.export_state()
-
-        if not data_to_save:
-            raise InvalidError("Data to save cannot be None or empty")
-
-        try:
-            current_bytes = pickle.dumps(data_to_save)
-        except Exception as e:
-            raise InvalidError(f"Cannot serialize data: {e}")
 
-        if self._last_loaded_bytes == current_bytes:
-            # Немає змін — не перезаписуємо
-            return self._last_loaded_name or name
+        if self._journal is not None and self._journal.accepts(name):
+            with self._state_lock, self._save_lock:
+                journal_name = self._append_to_journal()
+            if journal_name is not None:
+                return journal_name
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if not name.endswith(".pkl"):
-            name = f"{name}_{timestamp}.pkl"
-
-        self.file_manager.save(data_to_save, name)
-        self._last_loaded_bytes = current_bytes
-        self._last_loaded_name = name
-        return name
+        return self._save_snapshot(name)
 
     def load_by_name(self, name: str) -> None:
         self._validate_name(name)
 
+        # Незавершене збереження ще читає попередній стан сховища
+        with self._save_lock:
+            self._load(name)
+
+    def _load(self, name: str) -> None:
         if not self.file_manager.has_file_with_name(name):
             raise InvalidError(f"File with name '{name}' does not exist")
 
-        loaded_data = self.file_manager.load(name)
-        self.storage.import_state(loaded_data)
-        self._update_last_loaded(name, loaded_data)
-        self._last_loaded_bytes = pickle.dumps(loaded_data)
-        self._last_loaded_name = name
+        journal = self._journal
+        is_journal_base = journal is not None and journal.is_base(name)
+        file_manager, storage = self.file_manager, self.storage
+        chain = self._deltas.chain_of(name)
+        lazy_name: str | None = None
+        lazy_storage = storage if isinstance(storage, ILazyImportableStorage) else None
+        # Журнал відтворюється лише поверх повністю завантаженого словника
+        snapshot = (
+            file_manager.open_lazy(name)
+            if not is_journal_base
+            and not chain
+            and lazy_storage is not None
+            and isinstance(file_manager, ILazyFileManager)
+            else None
+        )
+
+        if chain:
+            # Дельта: повний базовий знімок і всі зміни поверх нього по черзі
+            loaded_data = self._deltas.reconstruct(chain)
+            if journal is not None and is_journal_base:
+                journal.replay(loaded_data)
+            storage.import_state(loaded_data)
+        elif lazy_storage is not None and snapshot is not None:
+            # Записи розпаковуються лише при першому зверненні
+            lazy_storage.import_lazy(snapshot)
+            lazy_name = name
+        elif (
+            not is_journal_base
+            and isinstance(file_manager, IStreamingFileManager)
+            and isinstance(storage, IBatchImportableStorage)
+        ):
+            # Записи стають доступними порціями, ще до кінця завантаження
+            storage.import_batches(file_manager.load_batches(name))
+        else:
+            loaded_data = file_manager.load(name)
+            if journal is not None and is_journal_base:
+                journal.replay(loaded_data)
+            storage.import_state(loaded_data)
+
+        self._mark_saved(name)
+        self._lazy_name = lazy_name
+        self._deltas.loaded(name, chain)
+        if journal is not None:
+            journal.loaded(name)
+
+    def flush(self) -> None:
+        try:
+            self.file_manager.flush()
+        except OSError as e:
+            raise InvalidError(f"Cannot write pending snapshots: {e}")
 
     def is_save_able(self) -> bool:
-        data_to_save = self.storage.export_state()
-        if not data_to_save:
+        # Сховище само фіксує кожну зміну — знімок лише за явною командою
+        if isinstance(self.storage, IDurableStorage) or self._is_unchanged():
             return False
-        try:
-            current_bytes = pickle.dumps(data_to_save)
-            return current_bytes != self._last_loaded_bytes
-        except Exception:
-            return True
+        return bool(self.storage.export_state())
 
     def get_file_list(self) -> list[str]:
         names = self.file_manager.get_all_names()
@@ -70,49 +154,82 @@ class FileService[Data](IFileService):
         return names
 
     def get_latest_file_name(self) -> str:
-        names = self.get_file_list()
-        latest_name = None
-        latest_dt = None
+        latest_name = self.file_manager.get_latest_name()
+        if not latest_name:
+            raise InvalidError("No files available")
+        return latest_name
 
-        for name in names:
-            if "." not in name:
-                continue
-            base, _ext = name.rsplit(".", 1)
+    def delete_by_name(self, name: str) -> None:
+        self._validate_name(name)
+        if not self.file_manager.has_file_with_name(name):
+            raise InvalidError(f"File with name '{name}' does not exist")
 
-            parts = base.split("_")
-            if len(parts) < 3:
-                continue
+        if name == self._lazy_name:
+            # Windows не дає видалити відображений файл — спершу читаємо його в пам'ять
+            with self._state_lock:
+                self._release_lazy()
+        with self._save_lock:
+            self._delete(name)
 
-            date_part = parts[-2]
-            time_part = parts[-1]
+    def _delete(self, name: str) -> None:
+        with self._retention_lock:
+            # Дельти, що спираються на цей знімок, спершу стають повними
+            for child in self._deltas.children(name):
+                self._deltas.rebase(child)
+            self.file_manager.delete(name)
 
-            if len(date_part) != 8 or len(time_part) != 6:
-                continue
-            if not (date_part + time_part).isdigit():
-                continue
+        self._deltas.forget(name)
+        if self._journal is not None and self._journal.forget(name):
+            self._saved_version = None
 
-            try:
-                dt = datetime.strptime(f"{date_part}_{time_part}", "%Y%m%d_%H%M%S")
-            except ValueError:
-                continue
+        if self._last_loaded_name == name:
+            # Поточний стан більше не збережений на диску
+            self._last_loaded_name = None
+            self._saved_version = None
 
-            if latest_dt is None or dt > latest_dt:
-                latest_dt = dt
-                latest_name = name
+    def compact(self) -> tuple[int, int]:
+        policy = self.retention_policy or RetentionPolicy()
+        names = [self._last_loaded_name, self._deltas.parent, self._lazy_name]
+        if self._journal is not None:
+            # Журнал відтворюється поверх свого базового знімка
+            names.append(self._journal.get_base_name())
+        protected = {name for name in names if name is not None}
 
-        return latest_name if latest_name else sorted(names)[-1]
+        removed = 0
+        reclaimed = 0
+        with self._retention_lock:
+            entries = self.file_manager.get_entries()
+            expired = policy.select_expired(entries, protected)
+            expired_names = {entry.name for entry in expired}
+            # Базу чи проміжну дельту не видаляємо, поки на неї спирається знімок
+            required = self._deltas.ancestors(
+                entry.name for entry in entries if entry.name not in expired_names
+            )
+            for entry in expired:
+                if entry.name in required:
+                    continue
+                try:
+                    self.file_manager.delete(entry.name)
+                except OSError:
+                    continue
+                removed += 1
+                reclaimed += entry.size
 
-    def delete_by_name(self, name: str) -> None:
-        self._validate_name(name)
-        if not self.file_manager.has_file_with_name(name):
-            raise InvalidError(f"File with name '{name}' does not exist")
-        self.file_manager.delete(name)
+        return removed, reclaimed
 
-        if self._last_loaded_name == name:
-            self._last_loaded_name = self.get_latest_file_name()
-            self._last_loaded_bytes = pickle.dumps(
-                self.file_manager.load(self._last_loaded_name)
-            )
+    def benchmark_compression(
+        self, candidates: list[Compression]
+    ) -> list[CompressionReport]:
+        data = self.storage.export_state()
+        if not data:
+            raise InvalidError("Nothing to benchmark: storage is empty")
+        return self.file_manager.benchmark_compression(data, candidates)
+
+    def wait_for_retention(self) -> None:
+        if self._rebase_future is not None:
+            self._rebase_future.result()
+        if self._retention_future is not None:
+            self._retention_future.result()
 
     @staticmethod
     def _validate_name(name: str) -> None:
@@ -121,6 +238,152 @@ class FileService[Data](IFileService):
         if not name or not name.strip():
             raise InvalidError("File name cannot be empty or whitespace")
 
-    def _update_last_loaded(self, name: str, data: Data) -> None:
+    def _current_version(self) -> int | None:
+        if isinstance(self.storage, ObservableStorage):
+            return self.storage.version
+        return None
+
+    def _is_unchanged(self) -> bool:
+        current = self._current_version()
+        return current is not None and current == self._saved_version
+
+    def _mark_saved(self, name: str) -> None:
         self._last_loaded_name = name
-        self._last_loaded_bytes = pickle.dumps(data)
+        self._saved_version = self._current_version()
+
+    def _save_snapshot(self, name: str) -> str:
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        extension = self.file_manager.extension
+        if not name.endswith(extension):
+            name = f"{name}_{timestamp}{extension}"
+
+        with self._save_lock:
+            with self._state_lock:
+                data_to_save = self.storage.export_state()
+                if not data_to_save:
+                    raise InvalidError("Data to save cannot be None or empty")
+                if self._is_unchanged() and self._last_loaded_name:
+                    # Немає змін — не перезаписуємо
+                    return self._last_loaded_name
+
+                version = self._current_version()
+                is_delta = self._deltas.can_extend(
+                    len(self._pending), len(data_to_save)
+                )
+                with self._pending_lock:
+                    changes, self._pending = self._pending, {}
+
+                # Команди змінюють записи на місці, тож серіалізуємо під замком;
+                # поза ним лишається тільки запис готових байтів на диск
+                payload: bytes | None = None
+                written_name: object = None
+                try:
+                    if isinstance(self.file_manager, IEncodingFileManager):
+                        payload = self._encode(data_to_save, changes, is_delta)
+                    else:
+                        written_name = self._write(
+                            data_to_save, changes, is_delta, name
+                        )
+                except Exception as e:
+                    self._restore_pending(changes)
+                    raise self._save_error(e)
+
+            if payload is not None:
+                assert isinstance(self.file_manager, IEncodingFileManager)
+                try:
+                    written_name = self.file_manager.save_encoded(payload, name)
+                except Exception as e:
+                    self._restore_pending(changes)
+                    raise self._save_error(e)
+
+            saved_name = written_name if isinstance(written_name, str) else name
+            self._last_loaded_name = saved_name
+            # Зміни під час запису лишаються в _pending і потраплять у наступний
+            self._saved_version = version
+            if self._deltas.saved(saved_name, is_delta):
+                self._schedule_rebase(saved_name)
+
+            if self._journal is not None:
+                self._journal.checkpoint(saved_name)
+
+            self._schedule_retention()
+
+        return saved_name
+
+    def _encode(self, data: Data, changes: dict, is_delta: bool) -> bytes:
+        if is_delta:
+            return self._deltas.encode(changes)
+        assert isinstance(self.file_manager, IEncodingFileManager)
+        return self.file_manager.encode(data)
+
+    def _write(self, data: Data, changes: dict, is_delta: bool, name: str) -> object:
+        if is_delta:
+            return self._deltas.save(changes, name)
+        return self.file_manager.save(data, name)
+
+    @staticmethod
+    def _save_error(error: Exception) -> Exception:
+        if isinstance(error, (pickle.PicklingError, TypeError, AttributeError)):
+            return InvalidError(f"Cannot serialize data: {error}")
+        return error
+
+    def _release_lazy(self) -> None:
+        if isinstance(self.storage, ILazyImportableStorage):
+            self.storage.release_lazy()
+        self._lazy_name = None
+
+    def _restore_pending(self, changes: dict) -> None:
+        with self._pending_lock:
+            # Новіші зміни важливіші за ті, що не вдалося зберегти
+            self._pending = {**changes, **self._pending}
+
+    def _schedule_retention(self) -> None:
+        if self.retention_policy is None:
+            return
+
+        # Прибирання не повинно затримувати prompt — виконуємо у фоновому потоці
+        self._retention_future = self._background().submit(self.compact)
+
+    def _background(self) -> ThreadPoolExecutor:
+        # Один потік: rebase і прибирання не конкурують за ті самі файли
+        if self._background_executor is None:
+            self._background_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="retention"
+            )
+        return self._background_executor
+
+    def _schedule_rebase(self, name: str) -> None:
+        if self._rebase_future is not None and not self._rebase_future.done():
+            return
+        self._rebase_future = self._background().submit(self._rebase_locked, name)
+
+    def _rebase_locked(self, name: str) -> None:
+        with self._retention_lock:
+            if self.file_manager.has_file_with_name(name):
+                self._deltas.rebase(name)
+
+    def _append_to_journal(self) -> str | None:
+        assert self._journal is not None
+        base_name = self._journal.get_base_name() or "autosave"
+
+        if not self._pending:
+            return base_name
+
+        if not self._journal.append(self._pending):
+            # Час для контрольного знімка — його пишемо вже без замка стану
+            return None
+
+        self._pending.clear()
+        self._saved_version = self._current_version()
+        return base_name
+
+    def _on_storage_changed(
+        self, event: StorageEvent, key: object | None, item: object | None
+    ) -> None:
+        with self._pending_lock:
+            if event == "import":
+                self._pending.clear()
+                self._deltas.detach()
+                return
+
+            self._pending[key] = None if event == "delete" else item
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from dal.file_managers.compression import Compression, CompressionReport
+
 
 class IFileService(ABC):
     @abstractmethod
@@ -10,6 +12,10 @@ class IFileService(ABC):
     def load_by_name(self, name: str) -> None:
         pass
 
+    @abstractmethod
+    def flush(self) -> None:
+        pass
+
     @abstractmethod
     def delete_by_name(self, name: str) -> None:
         pass
@@ -25,3 +31,13 @@ class IFileService(ABC):
     @abstractmethod
     def is_save_able(self) -> bool:
         pass
+
+    @abstractmethod
+    def compact(self) -> tuple[int, int]:
+        pass
+
+    @abstractmethod
+    def benchmark_compression(
+        self, candidates: list[Compression]
+    ) -> list[CompressionReport]:
+        pass
@@ -0,0 +1,65 @@
+from collections.abc import MutableMapping
+
+from dal.journals.i_journal import IJournal
+
+DEFAULT_CHECKPOINT_INTERVAL = 500
+
+
+class JournalWriter:
+    """Appends changes to the journal between full checkpoint snapshots.
+
+    Plain autosaves go to the journal until it holds ``checkpoint_interval``
+    entries; loading the checkpoint replays the journal on top of it.
+    """
+
+    def __init__(
+        self, journal: IJournal, checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL
+    ) -> None:
+        self.journal = journal
+        self.checkpoint_interval = checkpoint_interval
+        self.needs_checkpoint = True
+
+    def get_base_name(self) -> str | None:
+        return self.journal.get_base_name()
+
+    def is_base(self, name: str) -> bool:
+        return self.journal.get_base_name() == name
+
+    def accepts(self, name: str) -> bool:
+        return name == "autosave" and not self.needs_checkpoint
+
+    def append(self, changes: dict) -> bool:
+        """Appends ``changes``; returns False when a checkpoint is due instead."""
+        if self.journal.count() + len(changes) > self.checkpoint_interval:
+            return False
+
+        self.journal.append(list(changes.items()))
+        return True
+
+    def replay(self, data: MutableMapping) -> None:
+        if not isinstance(data, dict):
+            return
+
+        for key, item in self.journal.read():
+            if item is None:
+                data.pop(key, None)
+            else:
+                data[key] = item
+
+    def checkpoint(self, name: str) -> None:
+        self.journal.reset(name)
+        self.needs_checkpoint = False
+
+    def loaded(self, name: str) -> None:
+        # Зміни поверх іншого знімка не можна дописувати в чужий журнал
+        self.needs_checkpoint = not self.is_base(name)
+
+    def forget(self, name: str) -> bool:
+        """Drops the journal if ``name`` was its base; returns whether it was."""
+        if not self.is_base(name):
+            return False
+
+        # Журнал без базового знімка марний — наступне збереження буде повним
+        self.journal.reset(None)
+        self.needs_checkpoint = True
+        return True
@@ -0,0 +1,131 @@
+from datetime import datetime
+from typing import Callable, Iterable, Mapping
+
+from dal.file_managers.snapshot_manifest import SnapshotEntry
+
+DEFAULT_KEEP_LAST = 10
+DEFAULT_KEEP_HOURLY = 24
+DEFAULT_KEEP_DAILY = 7
+DEFAULT_KEEP_WEEKLY = 4
+
+
+def _hour_bucket(timestamp: datetime) -> tuple[int, ...]:
+    return (timestamp.year, timestamp.month, timestamp.day, timestamp.hour)
+
+
+def _day_bucket(timestamp: datetime) -> tuple[int, ...]:
+    return (timestamp.year, timestamp.month, timestamp.day)
+
+
+def _week_bucket(timestamp: datetime) -> tuple[int, ...]:
+    iso = timestamp.isocalendar()
+    return (iso.year, iso.week)
+
+
+class RetentionPolicy:
+    def __init__(
+        self,
+        keep_last: int = DEFAULT_KEEP_LAST,
+        keep_hourly: int = DEFAULT_KEEP_HOURLY,
+        keep_daily: int = DEFAULT_KEEP_DAILY,
+        keep_weekly: int = DEFAULT_KEEP_WEEKLY,
+        max_bytes: int = 0,
+        prefix: str = "autosave_",
+    ):
+        self.keep_last = keep_last
+        self.keep_hourly = keep_hourly
+        self.keep_daily = keep_daily
+        self.keep_weekly = keep_weekly
+        self.max_bytes = max_bytes
+        self.prefix = prefix
+
+    @classmethod
+    def from_settings(cls, settings: Mapping[str, int]) -> "RetentionPolicy":
+        return cls(
+            keep_last=settings.get("keep_last", DEFAULT_KEEP_LAST),
+            keep_hourly=settings.get("keep_hourly", DEFAULT_KEEP_HOURLY),
+            keep_daily=settings.get("keep_daily", DEFAULT_KEEP_DAILY),
+            keep_weekly=settings.get("keep_weekly", DEFAULT_KEEP_WEEKLY),
+            max_bytes=settings.get("max_bytes", 0),
+        )
+
+    def select_expired(
+        self, entries: Iterable[SnapshotEntry], protected: Iterable[str] = ()
+    ) -> list[SnapshotEntry]:
+        entries = list(entries)
+        protected_names = set(protected)
+
+        # Правила стосуються лише датованих автозбережень; решту не чіпаємо
+        candidates = sorted(
+            (
+                entry
+                for entry in entries
+                if entry.timestamp is not None and entry.name.startswith(self.prefix)
+            ),
+            key=lambda entry: (entry.timestamp, entry.name),
+            reverse=True,
+        )
+        if not candidates:
+            return []
+
+        kept = {entry.name for entry in candidates[: self.keep_last]}
+        kept.add(candidates[0].name)
+        for count, bucket in (
+            (self.keep_hourly, _hour_bucket),
+            (self.keep_daily, _day_bucket),
+            (self.keep_weekly, _week_bucket),
+        ):
+            kept |= self._newest_per_bucket(candidates, count, bucket)
+
+        if self.max_bytes > 0:
+            kept = self._fit_into_budget(entries, candidates, kept, protected_names)
+
+        return [
+            entry
+            for entry in reversed(candidates)
+            if entry.name not in kept and entry.name not in protected_names
+        ]
+
+    @staticmethod
+    def _newest_per_bucket(
+        candidates: list[SnapshotEntry],
+        count: int,
+        bucket: Callable[[datetime], tuple[int, ...]],
+    ) -> set[str]:
+        kept: set[str] = set()
+        seen: set[tuple[int, ...]] = set()
+        for entry in candidates:
+            if len(seen) >= count:
+                break
+            if entry.timestamp is None:
+                continue
+            key = bucket(entry.timestamp)
+            if key not in seen:
+                seen.add(key)
+                kept.add(entry.name)
+        return kept
+
+    def _fit_into_budget(
+        self,
+        entries: list[SnapshotEntry],
+        candidates: list[SnapshotEntry],
+        kept: set[str],
+        protected: set[str],
+    ) -> set[str]:
+        candidate_names = {entry.name for entry in candidates}
+        total = sum(
+            entry.size
+            for entry in entries
+            if entry.name in kept
+            or entry.name in protected
+            or entry.name not in candidate_names
+        )
+
+        # Найстаріші знімки йдуть першими, найновіший лишається завжди
+        for entry in reversed(candidates[1:]):
+            if total <= self.max_bytes:
+                break
+            if entry.name in kept and entry.name not in protected:
+                kept.discard(entry.name)
+                total -= entry.size
+        return kept
@@ -0,0 +1,107 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from bll.registries.i_registry import IRegistry
+
+
+class LoadReport:
+    def __init__(
+        self,
+        key: str,
+        file_name: str | None,
+        elapsed: float,
+        error: str | None = None,
+    ) -> None:
+        self.key = key
+        self.file_name = file_name
+        self.elapsed = elapsed
+        self.error = error
+
+    def __str__(self) -> str:
+        if self.error is not None:
+            return f"⚠️ {self.key} could not load previous state: {self.error}"
+        return f"📂 {self.key} loaded last saved state from '{self.file_name}'"
+
+
+class StartupLoader:
+    """Loads the latest saved state of every file service in worker threads.
+
+    The prompt does not wait for the loads; ``wait`` blocks only the callers
+    that need a particular storage.
+    """
+
+    def __init__(self, file_service_registry: IRegistry) -> None:
+        self.file_service_registry = file_service_registry
+        self._futures: dict[str, Future[LoadReport]] = {}
+        self._reported: set[str] = set()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def start(self, keys: list[str] | None = None) -> None:
+        services = self.file_service_registry.get_all()
+        keys = list(services) if keys is None else keys
+        if not keys:
+            return
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(keys), thread_name_prefix="startup-load"
+        )
+        for key in keys:
+            self._futures[key] = self._executor.submit(self._load, key, services[key])
+        # Потоки завершаться самі після останнього завантаження
+        self._executor.shutdown(wait=False)
+
+    def wait(self, key: str) -> LoadReport | None:
+        future = self._futures.get(key)
+        return future.result() if future is not None else None
+
+    def is_ready(self, key: str) -> bool:
+        future = self._futures.get(key)
+        return future is None or future.done()
+
+    def when_ready(self, callback: Callable[[], None]) -> None:
+        pending = [future for future in self._futures.values() if not future.done()]
+        if not pending:
+            callback()
+            return
+
+        remaining = len(pending)
+
+        def on_done(_future: Future) -> None:
+            nonlocal remaining
+            with self._lock:
+                remaining -= 1
+                is_last = remaining == 0
+            if is_last:
+                callback()
+
+        for future in pending:
+            future.add_done_callback(on_done)
+
+    def get_reports(self) -> dict[str, LoadReport | None]:
+        return {
+            key: future.result() if future.done() else None
+            for key, future in self._futures.items()
+        }
+
+    def pop_finished_reports(self) -> list[LoadReport]:
+        finished: list[LoadReport] = []
+        for key, future in self._futures.items():
+            if key not in self._reported and future.done():
+                self._reported.add(key)
+                finished.append(future.result())
+        return finished
+
+    @staticmethod
+    def _load(key: str, service) -> LoadReport:
+        started = time.perf_counter()
+        file_name = None
+        try:
+            file_name = service.get_latest_file_name()
+            service.load_by_name(file_name)
+        except Exception as e:
+            # Помилку повідомимо користувачу, а не в потоці завантаження
+            return LoadReport(key, file_name, time.perf_counter() - started, str(e))
+        return LoadReport(key, file_name, time.perf_counter() - started)
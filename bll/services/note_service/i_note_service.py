@@ -65,3 +65,7 @@ class INoteService(ABC):
     @abstractmethod
     def get_distinct_tags(self) -> list[Tag]:
         pass
+
+    @abstractmethod
+    def get_tag_stats(self) -> list[tuple[Tag, int]]:
+        pass
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Sequence
 
 from bll.helpers.search_helper import SearchHelper
+from bll.helpers.search_index import SearchIndex
+from bll.helpers.tag_index import TagIndex
 from bll.helpers.tag_palette import TAG_COLOR_CODES
 from bll.services.note_service.i_note_service import INoteService
 from dal.entities.note import Note
@@ -9,7 +11,10 @@ from dal.entities.tag import Tag
 from dal.exceptions.already_exists_error import AlreadyExistsError
 from dal.exceptions.invalid_error import InvalidError
 from dal.exceptions.not_found_error import NotFoundError
+from dal.storages.i_searchable_storage import ISearchableStorage
 from dal.storages.i_storage import IStorage
+from dal.storages.i_tag_indexed_storage import ITagIndexedStorage
+from dal.storages.observable_storage import ObservableStorage
 
 
 class NoteService(INoteService):
@@ -17,6 +22,16 @@ class NoteService(INoteService):
 
     def __init__(self, storage: IStorage[str, Note]):
         self.storage = storage
+        self._search_index: SearchIndex[str, Note] | None = None
+        if isinstance(storage, ObservableStorage) and not isinstance(
+            storage, ISearchableStorage
+        ):
+            self._search_index = SearchIndex(storage)
+        self._tag_index: TagIndex[str] | None = None
+        if isinstance(storage, ObservableStorage) and not isinstance(
+            storage, ITagIndexedStorage
+        ):
+            self._tag_index = TagIndex(storage)
 
     def add(
         self,
@@ -87,6 +102,15 @@ class NoteService(INoteService):
     def search(self, query: str) -> list[Note]:
         tokens = SearchHelper.prepare_tokens(query)
 
+        if isinstance(self.storage, ISearchableStorage):
+            return self.storage.search(tokens)
+
+        if self._search_index is not None:
+            notes = (
+                self.storage.find(key) for key in self._search_index.search(tokens)
+            )
+            return [note for note in notes if note is not None]
+
         def is_match(note: Note) -> bool:
             return SearchHelper.match_all_tokens(note, tokens)
 
@@ -118,13 +142,15 @@ class NoteService(INoteService):
 
     def get_by_tag(self, tag_name: str) -> list[Note]:
         normalized = self._normalize_tag_name(tag_name)
+        if isinstance(self.storage, ITagIndexedStorage):
+            return self.storage.find_by_tag(normalized)
+        if self._tag_index is not None:
+            notes = (self.storage.find(key) for key in self._tag_index.find(normalized))
+            return [note for note in notes if note is not None]
         return [note for note in self.get_all() if note.has_tag(normalized)]
 
     def get_all_sorted_by_tags(self, tag_name: str | None = None) -> list[Note]:
-        notes = self.get_all()
-        if tag_name:
-            normalized = self._normalize_tag_name(tag_name)
-            notes = [note for note in notes if note.has_tag(normalized)]
+        notes = self.get_by_tag(tag_name) if tag_name else self.get_all()
 
         return sorted(
             notes,
@@ -132,14 +158,21 @@ class NoteService(INoteService):
         )
 
     def get_distinct_tags(self) -> list[Tag]:
-        unique: dict[str, Tag] = {}
+        return [tag for tag, _count in self.get_tag_stats()]
+
+    def get_tag_stats(self) -> list[tuple[Tag, int]]:
+        if self._tag_index is not None:
+            return self._tag_index.counts()
+
+        stats: dict[str, tuple[Tag, int]] = {}
         for note in self.get_all():
             for tag in note.tags:
-                key = tag.value.lower()
-                if key not in unique:
-                    unique[key] = Tag(tag.value, tag.color)
+                key = Note.tag_key(tag.value)
+                # Теги незмінні й спільні — копія не потрібна
+                first, count = stats.get(key, (tag, 0))
+                stats[key] = (first, count + 1)
 
-        return sorted(unique.values(), key=lambda t: t.value.lower())
+        return sorted(stats.values(), key=lambda stat: stat[0].value.lower())
 
     @staticmethod
     def _validate_note_name(note_name: str) -> None:
@@ -178,11 +211,11 @@ class NoteService(INoteService):
 
     def _prepare_tags(
         self, tags: Sequence[Tag | tuple[str, str | None] | str] | None
-    ) -> list[tuple[str, str | None]]:
+    ) -> list[Tag]:
         prepared: list[tuple[str, str | None]] = []
 
         if not tags:
-            return prepared
+            return []
 
         for raw in tags:
             if isinstance(raw, Tag):
@@ -202,13 +235,13 @@ class NoteService(INoteService):
 
         # deduplicate by name (preserve first occurrence color)
         seen: set[str] = set()
-        unique_tags: list[tuple[str, str | None]] = []
+        unique_tags: list[Tag] = []
         for name, color in prepared:
-            key = name.lower()
+            key = Note.tag_key(name)
             if key in seen:
                 continue
             seen.add(key)
-            unique_tags.append((name, color))
+            unique_tags.append(Tag.intern(name, color))
 
         return unique_tags
 
@@ -36,6 +36,18 @@ class IRecordService(ABC):
     def get_with_upcoming_birthdays(self, days: int = 7) -> list[Record]:
         pass
 
+    @abstractmethod
+    def get_birthday_calendar(self, month: int, year: int) -> dict[int, list[str]]:
+        pass
+
     @abstractmethod
     def search(self, query: str) -> list[Record]:
         pass
+
+    @abstractmethod
+    def find_by_phone(self, phone: str) -> list[Record]:
+        pass
+
+    @abstractmethod
+    def ensure_phone_available(self, record_name: str, phone: str) -> None:
+        pass
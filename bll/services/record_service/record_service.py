@@ -1,19 +1,38 @@
-from datetime import date
+from calendar import isleap, monthrange
+from datetime import date, timedelta
 
 from bll.helpers.date_helper import DateHelper
+from bll.helpers.phone_index import PhoneIndex
 from bll.helpers.search_helper import SearchHelper
+from bll.helpers.search_index import SearchIndex
 from bll.services.record_service.i_record_service import IRecordService
 from bll.validation_policies.phone_validation_policy import PhoneValidationPolicy
+from dal.entities.name import Name
 from dal.entities.record import Record
 from dal.exceptions.already_exists_error import AlreadyExistsError
 from dal.exceptions.invalid_error import InvalidError
 from dal.exceptions.not_found_error import NotFoundError
+from dal.storages.i_birthday_indexed_storage import IBirthdayIndexedStorage
+from dal.storages.i_phone_indexed_storage import IPhoneIndexedStorage
+from dal.storages.i_searchable_storage import ISearchableStorage
 from dal.storages.i_storage import IStorage
+from dal.storages.observable_storage import ObservableStorage
 
 
 class RecordService(IRecordService):
     def __init__(self, storage: IStorage[str, Record]):
         self.storage = storage
+        self._search_index: SearchIndex[str, Record] | None = None
+        # Сховище з власним пошуком не потребує індексу в пам'яті
+        if isinstance(storage, ObservableStorage) and not isinstance(
+            storage, ISearchableStorage
+        ):
+            self._search_index = SearchIndex(storage)
+        self._phone_index: PhoneIndex[str] | None = None
+        if isinstance(storage, ObservableStorage) and not isinstance(
+            storage, IPhoneIndexedStorage
+        ):
+            self._phone_index = PhoneIndex(storage)
 
     def save(self, new_record: Record) -> Record:
         self._validate_record(new_record)
@@ -21,6 +40,7 @@ class RecordService(IRecordService):
         if self.has(new_record.name.value):
             raise AlreadyExistsError(f"Record '{new_record.name}' already exists")
 
+        self._ensure_unique_phones(new_record.name.value, new_record, set())
         self.storage.add(new_record)
 
         return new_record
@@ -31,6 +51,8 @@ class RecordService(IRecordService):
         if not self.has(record_name):
             raise NotFoundError(f"Record '{record_name}' not found")
 
+        known = self._stored_phone_keys(record_name, new_record)
+        self._ensure_unique_phones(record_name, new_record, known)
         self.storage.update_item(record_name, new_record)
 
         return new_record
@@ -49,12 +71,25 @@ class RecordService(IRecordService):
     def rename(self, record_name: str, new_name: str) -> Record:
         if not self.has(record_name):
             raise NotFoundError(f"Record '{record_name}' not found")
+        self._validate_record_name(new_name)
+        # Нове ім'я перевіряємо до будь-яких змін у записі чи сховищі
+        name = Name(new_name)
+        if new_name != record_name and self.has(new_name):
+            raise AlreadyExistsError(f"Record '{new_name}' already exists")
 
         record = self.get_by_name(record_name)
-        record.name.value = new_name
-
-        self.delete(record_name)
-        self.save(record)
+        previous_name = record.name
+        record.name = name
+        try:
+            self._validate_record(record)
+            # Номери не змінились — спільні старі номери не блокують перейменування
+            self.storage.add(record)
+        except Exception:
+            record.name = previous_name
+            raise
+
+        if new_name != record_name:
+            self.storage.delete(record_name)
 
         return record
 
@@ -69,6 +104,9 @@ class RecordService(IRecordService):
         return self.storage.has(record_name)
 
     def get_with_upcoming_birthdays(self, days: int = 7) -> list[Record]:
+        if not isinstance(days, int) or days <= 0:
+            raise InvalidError("Days must be a positive integer")
+
         def is_birthday_within_week(record: Record) -> bool:
             # record.birthday може бути None, тому перевіряємо явно
             if record.birthday is None or record.birthday.value is None:
@@ -79,6 +117,11 @@ class RecordService(IRecordService):
                 birthday_value, today=date.today(), days=days
             )
 
+        if isinstance(self.storage, IBirthdayIndexedStorage):
+            # Вікно впорядковане за датою, тож індекс повертає вже відсортоване
+            window = self._birthday_window(date.today(), days)
+            return self.storage.find_by_birthdays(window)
+
         records = self.storage.filter(is_birthday_within_week)
 
         def next_birthday_date(record: Record) -> date | None:
@@ -98,14 +141,137 @@ class RecordService(IRecordService):
 
         return sorted(records, key=lambda r: next_birthday_date(r) or date.max)
 
+    def get_birthday_calendar(self, month: int, year: int) -> dict[int, list[str]]:
+        if isinstance(self.storage, IBirthdayIndexedStorage):
+            _, days_in_month = monthrange(year, month)
+            month_days = [(month, day) for day in range(1, days_in_month + 1)]
+            if month == 2 and not isleap(year):
+                month_days.append((2, 29))
+            records = self.storage.find_by_birthdays(month_days)
+        else:
+            records = self.storage.filter(
+                lambda r: r.birthday is not None and r.birthday.value.month == month
+            )
+
+        birthdays_by_day: dict[int, list[str]] = {}
+        for record in records:
+            adjusted = DateHelper.set_date_with_feb_edge_case(
+                record.birthday.value, year
+            )
+            birthdays_by_day.setdefault(adjusted.day, []).append(record.name.value)
+
+        for names in birthdays_by_day.values():
+            names.sort()
+
+        return birthdays_by_day
+
     def search(self, query: str) -> list[Record]:
         tokens = SearchHelper.prepare_tokens(query)
 
+        if isinstance(self.storage, ISearchableStorage):
+            return self.storage.search(tokens)
+
+        if self._search_index is not None:
+            records = (
+                self.storage.find(key) for key in self._search_index.search(tokens)
+            )
+            return [record for record in records if record is not None]
+
         def is_match(record: Record) -> bool:
             return SearchHelper.match_all_tokens(record, tokens)
 
         return self.storage.filter(is_match)
 
+    def find_by_phone(self, phone: str) -> list[Record]:
+        if not isinstance(phone, str) or not phone.strip():
+            raise InvalidError("Phone value cannot be empty")
+
+        if isinstance(self.storage, IPhoneIndexedStorage):
+            return self.storage.find_by_phone(phone)
+
+        records = (self.storage.find(key) for key in self._phone_owners(phone))
+        return [record for record in records if record is not None]
+
+    def ensure_phone_available(self, record_name: str, phone: str) -> None:
+        """Raises ``AlreadyExistsError`` if ``phone`` is taken, before any change."""
+        record = self.get_by_name(record_name)
+        phone_key = PhoneValidationPolicy.phone_key(phone)
+        for own in record.phones:
+            if PhoneValidationPolicy.phone_key(own.value) == phone_key:
+                raise AlreadyExistsError(
+                    f"Phone '{phone}' duplicates '{own.value}' "
+                    f"in record '{record.name}'"
+                )
+        self._ensure_phone_owner(record_name, record.name.value, phone)
+
+    def _phone_owners(self, phone: str) -> list[str]:
+        if isinstance(self.storage, IPhoneIndexedStorage):
+            return [record.name.value for record in self.storage.find_by_phone(phone)]
+        if self._phone_index is not None:
+            return self._phone_index.find(phone)
+
+        phone_key = PhoneValidationPolicy.phone_key(phone)
+        return [
+            record.name.value
+            for record in self.storage.filter(
+                lambda r: any(
+                    PhoneValidationPolicy.phone_key(p.value) == phone_key
+                    for p in r.phones
+                )
+            )
+        ]
+
+    def _stored_phone_keys(self, record_name: str, record: Record) -> set[str]:
+        if self._phone_index is not None:
+            # Індекс оновлюється лише після запису — тут попередня версія
+            return set(self._phone_index.phones_of(record_name))
+
+        stored = self.storage.find(record_name)
+        if stored is None or stored is record:
+            return set()
+        return {PhoneValidationPolicy.phone_key(phone.value) for phone in stored.phones}
+
+    def _ensure_unique_phones(
+        self, record_name: str, record: Record, known: set[str]
+    ) -> None:
+        seen: dict[str, str] = {}
+        for phone in record.phones:
+            phone_key = PhoneValidationPolicy.phone_key(phone.value)
+            if phone_key in seen:
+                raise AlreadyExistsError(
+                    f"Phone '{phone.value}' duplicates '{seen[phone_key]}' "
+                    f"in record '{record.name}'"
+                )
+            seen[phone_key] = phone.value
+
+            # Номер, що вже був у записі, не перевіряємо: старі спільні номери
+            # (наприклад, домашній у двох контактів) не блокують редагування
+            if phone_key not in known:
+                self._ensure_phone_owner(record_name, record.name.value, phone.value)
+
+    def _ensure_phone_owner(self, record_name: str, new_name: str, phone: str) -> None:
+        # Сам запис (або його попередня версія) не вважається дублем
+        owners = [
+            owner
+            for owner in self._phone_owners(phone)
+            if owner not in (record_name, new_name)
+        ]
+        if owners:
+            raise AlreadyExistsError(
+                f"Phone '{phone}' already belongs to '{owners[0]}'"
+            )
+
+    @staticmethod
+    def _birthday_window(today: date, days: int) -> list[tuple[int, int]]:
+        window: dict[tuple[int, int], None] = {}
+        for offset in range(min(days, 366) + 1):
+            current = today + timedelta(days=offset)
+            window[(current.month, current.day)] = None
+            # 29 лютого у невисокосний рік святкують 28 лютого
+            if (current.month, current.day) == (2, 28) and not isleap(current.year):
+                window[(2, 29)] = None
+        return list(window)
+
     def _validate_record_arguments(self, record_name: str, record_phone: str) -> None:
         self._validate_record_name(record_name)
 
@@ -25,6 +25,9 @@ class PhoneValidationPolicy:
         ),
     }
 
+    # Роздільники, які користувачі ставлять між групами цифр
+    _SEPARATORS: Pattern[str] = re.compile(r"[\s\-().]")
+
     @classmethod
     def set_region(cls, region: str) -> None:
         key = (region or "").upper()
@@ -45,3 +48,24 @@ class PhoneValidationPolicy:
     def error_message(cls, value: str) -> str:
         hint = cls._MESSAGES.get(cls._region, "")
         return f"Invalid {cls._region} phone number: '{value}'. {hint}"
+
+    @classmethod
+    def canonicalize(cls, value: str) -> str | None:
+        """E.164 form of a phone valid in the current region, None otherwise."""
+        compact = cls._SEPARATORS.sub("", value)
+        if not cls._PATTERNS[cls._region].match(compact):
+            return None
+
+        digits = compact.lstrip("+")
+        if cls._region == "UA":
+            # 0XXXXXXXXX, 380XXXXXXXXX та +380XXXXXXXXX — той самий номер
+            return f"+38{digits[-10:]}"
+        if cls._region == "US":
+            # Без коду регіону номер неможливо звести до E.164
+            return f"+1{digits[-10:]}" if len(digits) >= 10 else None
+        return f"+{digits}"
+
+    @classmethod
+    def phone_key(cls, value: str) -> str:
+        """Lookup key: E.164 when possible, the number without separators otherwise."""
+        return cls.canonicalize(value) or cls._SEPARATORS.sub("", value)
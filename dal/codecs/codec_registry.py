@@ -0,0 +1,27 @@
+from typing import Iterable
+
+from dal.codecs.i_compact_codec import ICompactCodec
+from dal.exceptions.invalid_error import InvalidError
+
+
+class CodecRegistry:
+    """Compact codecs a snapshot reader can decode, keyed by ``codec_id``.
+
+    Snapshots keep the id of the codec they were written with, so reading
+    does not depend on the codec currently configured for writing.
+    """
+
+    def __init__(self, codecs: Iterable[ICompactCodec] = ()) -> None:
+        self._codecs = {codec.codec_id: codec for codec in codecs}
+
+    def resolve(self, codec_id: str | None) -> ICompactCodec | None:
+        if codec_id is None:
+            return None
+
+        codec = self._codecs.get(codec_id)
+        if codec is None:
+            known = ", ".join(self._codecs) or "none"
+            raise InvalidError(
+                f"Snapshot uses codec '{codec_id}', known codecs: {known}"
+            )
+        return codec
@@ -0,0 +1,23 @@
+from typing import Iterable
+
+from dal.codecs.i_compact_codec import ICompactCodec
+from dal.codecs.string_table import StringTable
+
+type CompactFrame = tuple[list[str], list[tuple[str, tuple]]]
+
+
+def encode_frame[Item](
+    codec: ICompactCodec[Item], items: Iterable[tuple[str, Item]]
+) -> CompactFrame:
+    # Одна таблиця рядків на кадр — кадри декодуються незалежно
+    strings = StringTable()
+    rows = [(key, codec.encode(item, strings)) for key, item in items]
+    return strings.strings, rows
+
+
+def decode_frame[Item](
+    codec: ICompactCodec[Item], frame: CompactFrame
+) -> list[tuple[str, Item]]:
+    strings, rows = frame
+    decode = codec.decode
+    return [(key, decode(row, strings)) for key, row in rows]
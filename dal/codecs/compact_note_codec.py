@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+from dal.codecs.field_factory import restore_field
+from dal.codecs.i_compact_codec import ICompactCodec
+from dal.codecs.string_table import StringTable
+from dal.entities.content import Content
+from dal.entities.name import Name
+from dal.entities.note import Note
+from dal.entities.tag import Tag
+from dal.entities.title import Title
+
+NO_REF = -1
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+class CompactNoteCodec(ICompactCodec[Note]):
+    """Note as ``(name, title, content, created_at, updated_at, tags)``.
+
+    Timestamps are microseconds since the epoch; tags are flattened pairs of
+    string-table refs for the name and color.
+    """
+
+    name = "note"
+    version = 1
+
+    def encode(self, note: Note, strings: StringTable) -> tuple:
+        tags: list[int] = []
+        for tag in note.tags:
+            tags += (
+                strings.ref(tag.value),
+                strings.ref(tag.color) if tag.color else NO_REF,
+            )
+
+        return (
+            note.name.value,
+            note.title.value,
+            note.content.value,
+            (note.created_at - EPOCH) // MICROSECOND,
+            (note.updated_at - EPOCH) // MICROSECOND if note.updated_at else None,
+            tuple(tags),
+        )
+
+    def decode(self, row: tuple, strings: list[str]) -> Note:
+        name, title, content, created_at, updated_at, tags = row
+
+        note = Note.__new__(Note)
+        note.name = restore_field(Name, name)
+        note.title = restore_field(Title, title)
+        note.content = restore_field(Content, content)
+        note.created_at = EPOCH + created_at * MICROSECOND
+        note.updated_at = (
+            EPOCH + updated_at * MICROSECOND if updated_at is not None else None
+        )
+        note.tags = [
+            self._decode_tag(strings, value_ref, color_ref)
+            for value_ref, color_ref in zip(tags[::2], tags[1::2])
+        ]
+        return note
+
+    @staticmethod
+    def _decode_tag(strings: list[str], value_ref: int, color_ref: int) -> Tag:
+        color = strings[color_ref] if color_ref != NO_REF else None
+        return Tag.intern(strings[value_ref], color)
@@ -0,0 +1,57 @@
+from datetime import date
+
+from dal.codecs.field_factory import restore_field
+from dal.codecs.i_compact_codec import ICompactCodec
+from dal.codecs.string_table import StringTable
+from dal.entities.address import Address
+from dal.entities.birthday import Birthday
+from dal.entities.email import Email
+from dal.entities.name import Name
+from dal.entities.phone import Phone
+from dal.entities.record import Record
+
+NO_REF = -1
+
+
+class CompactRecordCodec(ICompactCodec[Record]):
+    """Record as ``(name, phones, emails, birthday, address)``.
+
+    Emails are stored as ``local`` plus a string-table ref of the domain,
+    the birthday as a date ordinal (0 when unset).
+    """
+
+    name = "record"
+    version = 1
+
+    def encode(self, record: Record, strings: StringTable) -> tuple:
+        emails: list[str | int] = []
+        for email in record.emails:
+            local, at, domain = email.value.rpartition("@")
+            if at:
+                emails += (local, strings.ref(domain))
+            else:
+                emails += (email.value, NO_REF)
+
+        return (
+            record.name.value,
+            tuple(phone.value for phone in record.phones),
+            tuple(emails),
+            record.birthday.value.toordinal() if record.birthday else 0,
+            record.address.value if record.address else None,
+        )
+
+    def decode(self, row: tuple, strings: list[str]) -> Record:
+        name, phones, emails, birthday, address = row
+
+        record = Record.__new__(Record)
+        record.name = restore_field(Name, name)
+        record.phones = [restore_field(Phone, value) for value in phones]
+        record.emails = []
+        for local, ref in zip(emails[::2], emails[1::2]):
+            value = local if ref == NO_REF else f"{local}@{strings[ref]}"
+            record.emails.append(restore_field(Email, value))
+        record.birthday = (
+            restore_field(Birthday, date.fromordinal(birthday)) if birthday else None
+        )
+        record.address = restore_field(Address, address) if address else None
+        return record
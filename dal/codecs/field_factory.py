@@ -0,0 +1,10 @@
+from typing import Any
+
+from dal.entities.field import Field
+
+
+def restore_field[F: Field](cls: type[F], value: Any) -> F:
+    # Дані вже пройшли валідацію під час створення, тому конструктор не викликаємо
+    field = cls.__new__(cls)
+    field.value = value
+    return field
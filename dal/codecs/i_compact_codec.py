@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+
+from dal.codecs.string_table import StringTable
+
+
+class ICompactCodec[Item](ABC):
+    # Назва й версія зберігаються у файлі; несумісні знімки відхиляються
+    name: str
+    version: int
+
+    @property
+    def codec_id(self) -> str:
+        return f"{self.name}/{self.version}"
+
+    @abstractmethod
+    def encode(self, item: Item, strings: StringTable) -> tuple:
+        pass
+
+    @abstractmethod
+    def decode(self, row: tuple, strings: list[str]) -> Item:
+        pass
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IEntityCodec[Item](ABC):
+    @abstractmethod
+    def encode(self, item: Item) -> dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def decode(self, data: dict[str, Any]) -> Item:
+        pass
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Any
+
+from dal.codecs.field_factory import restore_field
+from dal.codecs.i_entity_codec import IEntityCodec
+from dal.entities.content import Content
+from dal.entities.name import Name
+from dal.entities.note import Note
+from dal.entities.tag import Tag
+from dal.entities.title import Title
+
+
+class NoteCodec(IEntityCodec[Note]):
+    def encode(self, note: Note) -> dict[str, Any]:
+        return {
+            "name": note.name.value,
+            "title": note.title.value,
+            "content": note.content.value,
+            "created_at": note.created_at.isoformat(),
+            "updated_at": note.updated_at.isoformat() if note.updated_at else None,
+            "tags": [[tag.value, tag.color] for tag in note.tags],
+        }
+
+    def decode(self, data: dict[str, Any]) -> Note:
+        note = Note.__new__(Note)
+        note.name = restore_field(Name, data["name"])
+        note.title = restore_field(Title, data["title"])
+        note.content = restore_field(Content, data["content"])
+        note.created_at = datetime.fromisoformat(data["created_at"])
+
+        updated_at = data.get("updated_at")
+        note.updated_at = datetime.fromisoformat(updated_at) if updated_at else None
+
+        note.tags = [
+            Tag.intern(value, color) for value, color in data.get("tags") or []
+        ]
+        return note
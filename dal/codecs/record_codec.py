@@ -0,0 +1,37 @@
+from datetime import date
+from typing import Any
+
+from dal.codecs.field_factory import restore_field
+from dal.codecs.i_entity_codec import IEntityCodec
+from dal.entities.address import Address
+from dal.entities.birthday import Birthday
+from dal.entities.email import Email
+from dal.entities.name import Name
+from dal.entities.phone import Phone
+from dal.entities.record import Record
+
+
+class RecordCodec(IEntityCodec[Record]):
+    def encode(self, record: Record) -> dict[str, Any]:
+        return {
+            "name": record.name.value,
+            "phones": [phone.value for phone in record.phones],
+            "emails": [email.value for email in record.emails],
+            "birthday": record.birthday.value.isoformat() if record.birthday else None,
+            "address": record.address.value if record.address else None,
+        }
+
+    def decode(self, data: dict[str, Any]) -> Record:
+        record = Record.__new__(Record)
+        record.name = restore_field(Name, data["name"])
+        record.phones = [restore_field(Phone, value) for value in data["phones"]]
+        record.emails = [restore_field(Email, value) for value in data["emails"]]
+
+        birthday = data.get("birthday")
+        record.birthday = (
+            restore_field(Birthday, date.fromisoformat(birthday)) if birthday else None
+        )
+
+        address = data.get("address")
+        record.address = restore_field(Address, address) if address else None
+        return record
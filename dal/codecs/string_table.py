@@ -0,0 +1,18 @@
+class StringTable:
+    """Deduplicates repeated strings of one encoded unit into integer refs."""
+
+    def __init__(self, strings: list[str] | None = None) -> None:
+        self.strings: list[str] = strings if strings is not None else []
+        self._refs: dict[str, int] = {
+            value: ref for ref, value in enumerate(self.strings)
+        }
+
+    def ref(self, value: str) -> int:
+        ref = self._refs.get(value)
+        if ref is None:
+            ref = self._refs[value] = len(self.strings)
+            self.strings.append(value)
+        return ref
+
+    def get(self, ref: int) -> str:
+        return self.strings[ref]
@@ -2,6 +2,8 @@ from dal.entities.field import Field
 
 
 class Address(Field):
+    __slots__ = ()
+
     MIN_LEN = 3
     MAX_LEN = 255
 
@@ -5,6 +5,8 @@ from dal.exceptions.invalid_error import InvalidError
 
 
 class Birthday(Field):
+    __slots__ = ()
+
     DATE_FORMAT = "%d.%m.%Y"
 
     def __init__(self, value: str | datetime | date):
@@ -4,6 +4,8 @@ from dal.entities.field import Field
 
 
 class Email(Field):
+    __slots__ = ()
+
     # Шаблон:
     #   - дозволяє нормальні символи в локальній частині
     #   - вимагає @
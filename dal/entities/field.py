@@ -1,7 +1,11 @@
 from typing import Any
 
+from dal.entities.slotted_entity import SlottedEntity
+
+
+class Field(SlottedEntity):
+    __slots__ = ("value",)
 
-class Field:
     def __init__(self, value: Any):
         self.value = value
 
@@ -1,13 +1,26 @@
+import sys
+from bisect import bisect_left
 from datetime import datetime
-from typing import Sequence
+from typing import Iterable, Sequence
 
 from dal.entities.content import Content
 from dal.entities.name import Name
+from dal.entities.slotted_entity import SlottedEntity
 from dal.entities.tag import Tag
 from dal.entities.title import Title
 
 
-class Note:
+class Note(SlottedEntity):
+    __slots__ = (
+        "name",
+        "title",
+        "content",
+        "created_at",
+        "updated_at",
+        "_tags",
+        "_tags_by_key",
+    )
+
     DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
     def __init__(
@@ -22,11 +35,24 @@ class Note:
         self.content = Content(content)
         self.created_at = datetime.now()
         self.updated_at: datetime | None = None
-        self.tags: list[Tag] = []
+        self.tags = []
 
         if tags:
             self.set_tags(tags)
 
+    @property
+    def tags(self) -> list[Tag]:
+        # Список упорядкований за tag_key; змінювати його лише через методи нотатки
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags: Iterable[Tag]) -> None:
+        # Сюди потрапляють і теги зі знімків — повертаємо спільні екземпляри
+        self._tags: list[Tag] = []
+        self._tags_by_key: dict[str, Tag] = {}
+        for tag in tags:
+            self._insert_tag(Tag.intern(tag.value, tag.color))
+
     def __hash__(self) -> int:
         return hash((self.name, self.title, self.content, tuple(self.tags)))
 
@@ -65,33 +91,30 @@ class Note:
     def set_tags(self, tags: Sequence[Tag | tuple[str, str | None] | str]) -> "Note":
         self.tags = []
         for raw in tags:
-            self._append_tag(raw)
-        self._sort_tags()
+            self._insert_tag(self._build_tag(raw))
         return self
 
     def add_tag(
         self, tag: Tag | tuple[str, str | None] | str, color: str | None = None
     ) -> "Note":
         normalized = self._build_tag(tag, color)
-        index = self._find_tag_index(normalized.value)
-        if index is not None:
-            existing = self.tags[index]
-            if normalized.color:
-                existing.color = normalized.color
-        else:
-            self.tags.append(normalized)
-        self._sort_tags()
+        existing = self._tags_by_key.get(self.tag_key(normalized.value))
+        if existing is None:
+            self._insert_tag(normalized)
+        elif normalized.color:
+            # Теги спільні й незмінні — замінюємо тег, а не змінюємо його колір
+            self._replace_tag(Tag.intern(existing.value, normalized.color))
         return self
 
     def remove_tag(self, tag_name: str) -> bool:
-        index = self._find_tag_index(tag_name)
-        if index is None:
+        key = self.tag_key(tag_name)
+        if self._tags_by_key.pop(key, None) is None:
             return False
-        self.tags.pop(index)
+        self._tags.pop(self._tag_position(key))
         return True
 
     def has_tag(self, tag_name: str) -> bool:
-        return self._find_tag_index(tag_name) is not None
+        return self.tag_key(tag_name) in self._tags_by_key
 
     def tag_names(self) -> list[str]:
         return [tag.value for tag in self.tags]
@@ -103,10 +126,9 @@ class Note:
         primary = self.primary_tag()
         return primary.value.lower() if primary else "~"
 
-    def _append_tag(self, tag: Tag | tuple[str, str | None] | str) -> None:
-        normalized = self._build_tag(tag)
-        if self._find_tag_index(normalized.value) is None:
-            self.tags.append(normalized)
+    @staticmethod
+    def tag_key(tag_name: str) -> str:
+        return tag_name.strip().casefold()
 
     @staticmethod
     def _build_tag(
@@ -114,22 +136,28 @@ class Note:
     ) -> Tag:
         if isinstance(tag, Tag):
             resolved_color = tag.color if tag.color is not None else color
-            return Tag(tag.value, resolved_color)
+            return Tag.intern(tag.value, resolved_color)
 
         if isinstance(tag, tuple):
             name, maybe_color = tag
             if maybe_color is None:
                 maybe_color = color
-            return Tag(name, maybe_color)
+            return Tag.intern(name, maybe_color)
+
+        return Tag.intern(str(tag), color)
 
-        return Tag(str(tag), color)
+    def _insert_tag(self, tag: Tag) -> None:
+        # Перший тег з такою назвою лишається — як і до впорядкованої мапи
+        key = sys.intern(self.tag_key(tag.value))
+        if key in self._tags_by_key:
+            return
+        self._tags_by_key[key] = tag
+        self._tags.insert(self._tag_position(key), tag)
 
-    def _find_tag_index(self, tag_name: str) -> int | None:
-        normalized = tag_name.lower().strip()
-        for idx, tag in enumerate(self.tags):
-            if tag.value.lower() == normalized:
-                return idx
-        return None
+    def _replace_tag(self, tag: Tag) -> None:
+        key = self.tag_key(tag.value)
+        self._tags_by_key[key] = tag
+        self._tags[self._tag_position(key)] = tag
 
-    def _sort_tags(self) -> None:
-        self.tags.sort(key=lambda tag: tag.value.lower())
+    def _tag_position(self, key: str) -> int:
+        return bisect_left(self._tags, key, key=lambda tag: self.tag_key(tag.value))
@@ -2,6 +2,8 @@ from dal.entities.field import Field
 
 
 class Phone(Field):
+    __slots__ = ()
+
     def __init__(self, value: str):
         if not isinstance(value, str):
             raise TypeError(f"Phone value should be str not {type(value).__name__}")
@@ -5,11 +5,14 @@ from dal.entities.birthday import Birthday
 from dal.entities.email import Email
 from dal.entities.name import Name
 from dal.entities.phone import Phone
+from dal.entities.slotted_entity import SlottedEntity
 from dal.exceptions.invalid_error import InvalidError
 from dal.exceptions.not_found_error import NotFoundError
 
 
-class Record:
+class Record(SlottedEntity):
+    __slots__ = ("name", "phones", "emails", "birthday", "address")
+
     def __init__(
         self,
         name: str,
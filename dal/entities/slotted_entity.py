@@ -0,0 +1,51 @@
+from functools import cache
+from typing import Any
+
+
+@cache
+def _state_names(cls: type) -> tuple[str, ...]:
+    names: list[str] = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+        # Властивість із сеттером — стан, що зберігається в прихованих слотах
+        names.extend(
+            name
+            for name, attribute in base.__dict__.items()
+            if isinstance(attribute, property) and attribute.fset is not None
+        )
+    # Слоти з підкресленням службові або похідні — у знімок не потрапляють
+    return tuple(name for name in names if not name.startswith("_"))
+
+
+class SlottedEntity:
+    """Base for entities stored in ``__slots__`` instead of a per-instance dict.
+
+    Pickles keep the pre-slots format — a plain ``{attribute: value}`` state —
+    so snapshots written before the switch load, and new ones stay readable by
+    older versions of the app.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Ключ кешу — сам клас; його хеш не залежить від __hash__ екземплярів
+        cls: type = type(self)
+        return {
+            name: getattr(self, name)
+            for name in _state_names(cls)
+            if hasattr(self, name)
+        }
+
+    def __setstate__(self, state: Any) -> None:
+        # Стан слотів, збережений стандартним pickle, — кортеж (dict, slots)
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+
+        cls: type = type(self)
+        names = _state_names(cls)
+        for name, value in state.items():
+            # Атрибути, яких більше немає в класі, відкидаємо
+            if name in names:
+                object.__setattr__(self, name, value)
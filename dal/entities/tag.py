@@ -1,7 +1,21 @@
+import threading
+from typing import Any
+from weakref import WeakValueDictionary
+
 from dal.entities.field import Field
 
 
 class Tag(Field):
+    """Tag value and color; instances are immutable and shared via ``intern``."""
+
+    __slots__ = ("color", "__weakref__")
+
+    # Спільні екземпляри за (назва, колір); тег зникає, щойно його не має жодна нотатка
+    _interned: "WeakValueDictionary[tuple[str, str | None], Tag]" = (
+        WeakValueDictionary()
+    )
+    _intern_lock = threading.Lock()
+
     def __init__(self, value: str, color: str | None = None):
         if not isinstance(value, str):
             raise TypeError(f"Tag value should be str not {type(value).__name__}")
@@ -21,10 +35,32 @@ class Tag(Field):
         else:
             self.color = None
 
+    @classmethod
+    def intern(cls, value: str, color: str | None = None) -> "Tag":
+        key = (value, color)
+        tag = cls._interned.get(key)
+        if tag is not None:
+            return tag
+
+        # Валідація лише для нової пари — повторні звернення не створюють об'єктів
+        created = cls(value, color)
+        with cls._intern_lock:
+            tag = cls._interned.setdefault((created.value, created.color), created)
+            cls._interned[key] = tag
+        return tag
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Один екземпляр спільний для багатьох нотаток — змінювати його не можна
+        if hasattr(self, name):
+            raise AttributeError(f"Tag is immutable, cannot change '{name}'")
+        super().__setattr__(name, value)
+
     def __str__(self):
         return f"{self.value} ({self.color})" if self.color else self.value
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Tag):
             return super().__eq__(other)
         return self.value == other.value and self.color == other.color
@@ -0,0 +1,24 @@
+import os
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+TMP_SUFFIX = ".tmp"
+
+
+def atomic_write[T](filepath: Path, write: Callable[[BinaryIO], T]) -> T:
+    """Writes ``filepath`` through a synced temporary file and an atomic rename.
+
+    Returns what ``write`` returned.
+    """
+    # Файл з'являється під своїм ім'ям лише повністю записаним на диск
+    tmp_path = filepath.with_name(f".{filepath.name}{TMP_SUFFIX}")
+    try:
+        with tmp_path.open("wb") as file:
+            result = write(file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return result
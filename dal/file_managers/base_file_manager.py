@@ -0,0 +1,182 @@
+import hashlib
+import io
+import os
+import time
+from abc import abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator
+
+from dal.file_managers.atomic_file import TMP_SUFFIX, atomic_write
+from dal.file_managers.compression import Compression, CompressionReport
+from dal.file_managers.i_file_manager import IFileManager
+from dal.file_managers.snapshot_manifest import SnapshotEntry, SnapshotManifest
+
+DEFAULT_BASE_DIR = Path("files")
+
+
+class HashingWriter(io.RawIOBase):
+    """Write-only stream that hashes bytes on their way to ``target``."""
+
+    def __init__(self, target: BinaryIO) -> None:
+        super().__init__()
+        self._target = target
+        self.digest = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        written = self._target.write(data) or 0
+        # Частковий запис буфер повторить — хешуємо лише те, що вже у файлі
+        self.digest.update(memoryview(data)[:written])
+        return written
+
+
+class BaseFileManager[Data](IFileManager[Data]):
+    extension = ""
+
+    def __init__(
+        self, base_dir: Path = DEFAULT_BASE_DIR, compression: Compression | None = None
+    ):
+        self.base_dir = base_dir
+        self.compression = compression
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_tmp_files()
+        self.manifest = SnapshotManifest(self.base_dir, self.extension)
+
+    def flush(self) -> None:
+        # Базові менеджери пишуть одразу — відкладених збережень немає
+        pass
+
+    def delete(self, name: str) -> None:
+        self.flush()
+        filepath = self._normalize_name(name)
+        if filepath.exists():
+            filepath.unlink()
+        self.manifest.remove(filepath.name)
+
+    def get_all_names(self) -> list[str]:
+        self.flush()
+        return self.manifest.names()
+
+    def get_entries(self) -> list[SnapshotEntry]:
+        # Без flush: фонове прибирання не повинно передчасно закривати групу
+        return self.manifest.entries()
+
+    def get_latest_name(self) -> str | None:
+        self.flush()
+        latest = self.manifest.latest()
+        return latest.name if latest else None
+
+    def has_file_with_name(self, name: str) -> bool:
+        self.flush()
+        return self._normalize_name(name).exists()
+
+    def benchmark_compression(
+        self, data: Data, candidates: list[Compression]
+    ) -> list[CompressionReport]:
+        reports: list[CompressionReport] = []
+        for compression in [None, *candidates]:
+            # Лише в пам'яті: порівнюємо серіалізацію й стиснення, а не диск
+            buffer = io.BytesIO()
+            started = time.perf_counter()
+            if compression is None:
+                self._serialize(data, buffer)
+            else:
+                with compression.writer(buffer) as file:
+                    self._serialize(data, file)
+            save_seconds = time.perf_counter() - started
+            size = buffer.tell()
+
+            buffer.seek(0)
+            started = time.perf_counter()
+            with Compression.reader(buffer) as file:
+                self._deserialize(file)
+            load_seconds = time.perf_counter() - started
+
+            reports.append(
+                CompressionReport(compression, size, save_seconds, load_seconds)
+            )
+        return reports
+
+    @abstractmethod
+    def _serialize(self, data: Data, file: BinaryIO) -> None:
+        pass
+
+    @abstractmethod
+    def _deserialize(self, file: BinaryIO) -> Data:
+        pass
+
+    def _normalize_name(self, name: str) -> Path:
+        name_path = Path(name)
+        if name_path.suffix != self.extension:
+            name_path = name_path.with_suffix(self.extension)
+        return self.base_dir / name_path.name
+
+    def _is_taken(self, filepath: Path) -> bool:
+        return filepath.exists()
+
+    def _generate_unique_filename(self, name: str) -> Path:
+        base_path = self._normalize_name(name)
+        if not self._is_taken(base_path):
+            return base_path
+
+        base = base_path.stem
+        ext = base_path.suffix
+
+        counter = 1
+        while True:
+            new_name = self.base_dir / f"{base}_{counter}{ext}"
+            if not self._is_taken(new_name):
+                return new_name
+            counter += 1
+
+    def _atomic_write(
+        self,
+        filepath: Path,
+        write: Callable[[BinaryIO], object],
+        *,
+        sync_dir: bool = True,
+    ) -> str:
+        """Writes the file atomically and returns the sha256 of its bytes."""
+
+        def write_hashed(target: BinaryIO) -> str:
+            # Контрольна сума рахується під час запису — без перечитування файлу
+            hashing = HashingWriter(target)
+            with io.BufferedWriter(hashing) as file:
+                if self.compression is None:
+                    write(file)
+                else:
+                    with self.compression.writer(file) as compressed:
+                        write(compressed)
+            return hashing.digest.hexdigest()
+
+        checksum = atomic_write(filepath, write_hashed)
+        if sync_dir:
+            self._sync_dir()
+        return checksum
+
+    @contextmanager
+    def _open_for_read(self, filepath: Path) -> Iterator[BinaryIO]:
+        # Стиснення визначаємо за заголовком файлу, а не за налаштуваннями
+        with filepath.open("rb") as raw:
+            with Compression.reader(raw) as file:
+                yield file
+
+    def _sync_dir(self) -> None:
+        try:
+            fd = os.open(self.base_dir, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            # Не всі платформи дозволяють fsync каталогу
+            pass
+        finally:
+            os.close(fd)
+
+    def _remove_stale_tmp_files(self) -> None:
+        for path in self.base_dir.glob(f".*{self.extension}{TMP_SUFFIX}"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,113 @@
+import bz2
+import gzip
+import io
+import lzma
+import struct
+from typing import BinaryIO, cast
+
+from dal.exceptions.invalid_error import InvalidError
+
+MAGIC = b"CMPR"
+# MAGIC, метод, рівень
+HEADER = struct.Struct("<4sBB")
+METHODS = {"zlib": 1, "bz2": 2, "lzma": 3}
+LEVEL_RANGES = {"zlib": range(0, 10), "bz2": range(1, 10), "lzma": range(0, 10)}
+DEFAULT_LEVELS = {"zlib": 6, "bz2": 9, "lzma": 6}
+# lzma з рівнями 7–9 потребує сотні МБ пам'яті — у порівнянні не беремо
+BENCHMARK_LEVELS = {"zlib": (1, 6, 9), "bz2": (1, 9), "lzma": (0, 6)}
+
+
+class Compression:
+    """Stdlib compression applied to a whole snapshot file behind a header."""
+
+    def __init__(self, method: str, level: int | None = None) -> None:
+        if method not in METHODS:
+            raise InvalidError(
+                f"Unknown compression '{method}'. Use one of: {', '.join(METHODS)}"
+            )
+
+        level = DEFAULT_LEVELS[method] if level is None else level
+        if level not in LEVEL_RANGES[method]:
+            levels = LEVEL_RANGES[method]
+            raise InvalidError(
+                f"Compression level for {method} must be {levels[0]}–{levels[-1]}"
+            )
+
+        self.method = method
+        self.level = level
+
+    def __str__(self) -> str:
+        return f"{self.method}:{self.level}"
+
+    @classmethod
+    def parse(cls, spec: str | None) -> "Compression | None":
+        spec = (spec or "").strip().lower()
+        if spec in {"", "none"}:
+            return None
+
+        method, _, level = spec.partition(":")
+        if level and not level.isdigit():
+            raise InvalidError(f"Invalid compression level '{level}'")
+        return cls(method, int(level) if level else None)
+
+    @classmethod
+    def benchmark_candidates(cls) -> list["Compression"]:
+        return [
+            cls(method, level)
+            for method, levels in BENCHMARK_LEVELS.items()
+            for level in levels
+        ]
+
+    def writer(self, raw: BinaryIO) -> BinaryIO:
+        raw.write(HEADER.pack(MAGIC, METHODS[self.method], self.level))
+        stream: io.BufferedIOBase
+        if self.method == "zlib":
+            # DEFLATE у gzip-обгортці: потоковий запис і читання з коробки
+            stream = gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=self.level, mtime=0
+            )
+        elif self.method == "bz2":
+            stream = bz2.BZ2File(raw, "wb", compresslevel=self.level)
+        else:
+            stream = lzma.LZMAFile(raw, "wb", preset=self.level)
+        # Потоки stdlib мають увесь потрібний файловий інтерфейс, але не BinaryIO
+        return cast(BinaryIO, stream)
+
+    @staticmethod
+    def reader(raw: BinaryIO) -> BinaryIO:
+        """Returns a decompressing reader, or ``raw`` for uncompressed files."""
+        start = raw.tell()
+        header = raw.read(HEADER.size)
+        if len(header) < HEADER.size or header[: len(MAGIC)] != MAGIC:
+            raw.seek(start)
+            return raw
+
+        _magic, method_id, _level = HEADER.unpack(header)
+        stream: io.BufferedIOBase
+        if method_id == METHODS["zlib"]:
+            stream = gzip.GzipFile(fileobj=raw, mode="rb")
+        elif method_id == METHODS["bz2"]:
+            stream = bz2.BZ2File(raw, "rb")
+        elif method_id == METHODS["lzma"]:
+            stream = lzma.LZMAFile(raw, "rb")
+        else:
+            raise InvalidError(f"Unknown compression method id {method_id}")
+        return cast(BinaryIO, stream)
+
+
+class CompressionReport:
+    def __init__(
+        self,
+        compression: Compression | None,
+        size: int,
+        save_seconds: float,
+        load_seconds: float,
+    ) -> None:
+        self.compression = compression
+        self.size = size
+        self.save_seconds = save_seconds
+        self.load_seconds = load_seconds
+
+    @property
+    def label(self) -> str:
+        return str(self.compression) if self.compression else "none"
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+
+
+class IDeltaFileManager[Key, Item](ABC):
+    @abstractmethod
+    def save_delta(
+        self, changed: Mapping[Key, Item], deleted: list[Key], parent: str, name: str
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def encode_delta(
+        self, changed: Mapping[Key, Item], deleted: list[Key], parent: str
+    ) -> bytes:
+        pass
+
+    @abstractmethod
+    def get_delta_parent(self, name: str) -> str | None:
+        pass
+
+    @abstractmethod
+    def get_delta_parents(self) -> dict[str, str]:
+        """Maps every delta snapshot to its parent without reading the files."""
+        pass
+
+    @abstractmethod
+    def load_delta(self, name: str) -> tuple[dict[Key, Item], list[Key]]:
+        pass
+
+    @abstractmethod
+    def rebase(self, data: Mapping[Key, Item], name: str) -> None:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class IEncodingFileManager[Data](ABC):
+    """``save`` split in two: serialization and the write of its bytes."""
+
+    @abstractmethod
+    def encode(self, data: Data) -> bytes:
+        pass
+
+    @abstractmethod
+    def save_encoded(self, payload: bytes, name: str) -> str:
+        pass
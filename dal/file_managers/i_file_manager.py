@@ -1,15 +1,24 @@
 from abc import ABC, abstractmethod
 
+from dal.file_managers.compression import Compression, CompressionReport
+from dal.file_managers.snapshot_manifest import SnapshotEntry
+
 
 class IFileManager[Data](ABC):
+    extension: str
+
     @abstractmethod
-    def save(self, data: Data, name: str) -> None:
+    def save(self, data: Data, name: str) -> str:
         pass
 
     @abstractmethod
     def load(self, name: str) -> Data:
         pass
 
+    @abstractmethod
+    def flush(self) -> None:
+        pass
+
     @abstractmethod
     def delete(self, name: str) -> None:
         pass
@@ -18,6 +27,20 @@ class IFileManager[Data](ABC):
     def get_all_names(self) -> list[str]:
         pass
 
+    @abstractmethod
+    def get_entries(self) -> list[SnapshotEntry]:
+        pass
+
+    @abstractmethod
+    def get_latest_name(self) -> str | None:
+        pass
+
     @abstractmethod
     def has_file_with_name(self, name: str) -> bool:
         pass
+
+    @abstractmethod
+    def benchmark_compression(
+        self, data: Data, candidates: list[Compression]
+    ) -> list[CompressionReport]:
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Iterator
+
+
+class ILazySnapshot[Key, Item](Mapping[Key, Item], ABC):
+    @abstractmethod
+    def iter_meta(self) -> Iterator[tuple[Key, int]]:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class ILazyFileManager[Key, Item](ABC):
+    @abstractmethod
+    def open_lazy(self, name: str) -> ILazySnapshot[Key, Item] | None:
+        pass
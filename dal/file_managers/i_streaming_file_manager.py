@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+
+class IStreamingFileManager[Key, Item](ABC):
+    @abstractmethod
+    def load_batches(self, name: str) -> Iterator[list[tuple[Key, Item]]]:
+        pass
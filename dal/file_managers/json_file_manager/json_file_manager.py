@@ -0,0 +1,94 @@
+import io
+import json
+from pathlib import Path
+from typing import BinaryIO
+
+from dal.codecs.i_entity_codec import IEntityCodec
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.base_file_manager import DEFAULT_BASE_DIR, BaseFileManager
+from dal.file_managers.compression import Compression
+
+FORMAT_NAME = "assistant-bot/jsonl"
+FORMAT_VERSION = 1
+
+
+class JsonFileManager[Item](BaseFileManager[dict[str, Item]]):
+    extension = ".jsonl"
+
+    def __init__(
+        self,
+        codec: IEntityCodec[Item],
+        base_dir: Path = DEFAULT_BASE_DIR,
+        compression: Compression | None = None,
+    ):
+        super().__init__(base_dir, compression)
+        self.codec = codec
+
+    def save(self, data: dict[str, Item], name: str) -> str:
+        filepath = self._generate_unique_filename(str(name))
+        checksum = self._atomic_write(
+            filepath, lambda file: self._serialize(data, file)
+        )
+        self.manifest.record(filepath, checksum)
+        return filepath.name
+
+    def load(self, name: str) -> dict[str, Item]:
+        filepath = self._normalize_name(name)
+        if not filepath.exists():
+            raise FileNotFoundError(f"File '{filepath}' not found")
+
+        with self._open_for_read(filepath) as file:
+            return self._read_lines(file, filepath.name)
+
+    def _serialize(self, data: dict[str, Item], raw_file: BinaryIO) -> None:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        file = io.TextIOWrapper(raw_file, encoding="utf-8", newline="\n")
+        try:
+            header = {"format": FORMAT_NAME, "version": FORMAT_VERSION}
+            file.write(encoder.encode(header))
+            file.write("\n")
+            # Записуємо по одному запису в рядок, не будуючи весь документ
+            for key, item in data.items():
+                file.write(encoder.encode([key, self.codec.encode(item)]))
+                file.write("\n")
+        finally:
+            # Відв'язуємо обгортку, щоб файл закрив той, хто його відкрив
+            file.detach()
+
+    def _deserialize(self, file: BinaryIO) -> dict[str, Item]:
+        return self._read_lines(file, "snapshot")
+
+    def _read_lines(self, raw_file: BinaryIO, file_name: str) -> dict[str, Item]:
+        decoder = json.JSONDecoder()
+        result: dict[str, Item] = {}
+        file = io.TextIOWrapper(raw_file, encoding="utf-8")
+        try:
+            self._check_header(file.readline(), file_name)
+            for line_number, line in enumerate(file, start=2):
+                if not line.strip():
+                    continue
+                try:
+                    key, payload = decoder.decode(line)
+                    result[key] = self.codec.decode(payload)
+                except (ValueError, KeyError, TypeError) as e:
+                    raise InvalidError(
+                        f"File '{file_name}' is corrupted at line {line_number}: {e}"
+                    )
+        finally:
+            file.detach()
+        return result
+
+    @staticmethod
+    def _check_header(line: str, file_name: str) -> None:
+        try:
+            header = json.loads(line)
+        except ValueError:
+            header = None
+
+        if not isinstance(header, dict) or header.get("format") != FORMAT_NAME:
+            raise InvalidError(f"File '{file_name}' is not a JSON Lines snapshot")
+
+        if header.get("version") != FORMAT_VERSION:
+            raise InvalidError(
+                f"Unsupported snapshot version {header.get('version')} in '{file_name}'"
+            )
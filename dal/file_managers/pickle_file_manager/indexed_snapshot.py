@@ -0,0 +1,199 @@
+import mmap
+import pickle
+import struct
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, cast
+
+from dal.codecs.codec_registry import CodecRegistry
+from dal.codecs.i_compact_codec import ICompactCodec
+from dal.codecs.string_table import StringTable
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.i_lazy_file_manager import ILazySnapshot
+from dal.storages.lazy_dict import LazyDict
+
+MAGIC = b"PKLIDX\x00\x01"
+# offsets_offset, meta_offset, keys_offset, count
+FOOTER = struct.Struct("<QQQQ")
+KEY_SEPARATOR = b"\x00"
+
+type IndexMeta = Callable[[Any], int]
+
+
+def write_indexed(
+    file: BinaryIO,
+    data: Mapping,
+    index_meta: IndexMeta | None = None,
+    codec: ICompactCodec | None = None,
+) -> None:
+    """Writes per-item pickles followed by a key/offset/meta index and a footer.
+
+    ``index_meta`` maps an item to a small non-negative integer kept in the
+    index, so callers can build secondary indexes without unpickling items.
+    With a ``codec`` every item is stored as its own ``(strings, row)`` pair.
+    """
+    file.write(MAGIC)
+    position = len(MAGIC)
+    codec_id = codec.codec_id if codec else None
+    if codec_id is not None:
+        header = pickle.dumps({"codec": codec_id})
+        file.write(header)
+        position += len(header)
+    offsets = array("Q", [position])
+    meta = array("I")
+    keys: list[bytes] = []
+
+    source = _untouched_source(data, codec_id)
+    is_materialized = data.is_materialized if isinstance(data, LazyDict) else None
+    for key in data:
+        if (
+            is_materialized is not None
+            and source is not None
+            and not is_materialized(key)
+        ):
+            # Незмінений запис копіюємо з вихідного знімка як є
+            blob: bytes | memoryview = source.raw(key)
+            item_meta = source.meta(key)
+        else:
+            item = data[key]
+            blob = pickle.dumps(
+                _encode_item(item, codec), protocol=pickle.HIGHEST_PROTOCOL
+            )
+            item_meta = index_meta(item) if index_meta else 0
+        file.write(blob)
+        position += len(blob)
+        offsets.append(position)
+        meta.append(item_meta)
+        keys.append(key.encode("utf-8"))
+
+    # Масиви вирівнюємо на 8 байт, щоб читати їх із mmap без копіювання
+    padding = -position % 8
+    file.write(b"\x00" * padding)
+    offsets_offset = position + padding
+    file.write(offsets.tobytes())
+    meta_offset = offsets_offset + len(offsets) * offsets.itemsize
+    file.write(meta.tobytes())
+    keys_offset = meta_offset + len(meta) * meta.itemsize
+    file.write(KEY_SEPARATOR.join(keys))
+    file.write(FOOTER.pack(offsets_offset, meta_offset, keys_offset, len(keys)))
+
+
+def _encode_item(item: Any, codec: ICompactCodec | None) -> Any:
+    if codec is None:
+        return item
+    strings = StringTable()
+    row = codec.encode(item, strings)
+    return strings.strings, row
+
+
+def _untouched_source(data: Mapping, codec_id: str | None) -> "IndexedSnapshot | None":
+    # Сирі байти придатні лише для того самого кодека
+    if (
+        isinstance(data, LazyDict)
+        and isinstance(data.snapshot, IndexedSnapshot)
+        and data.snapshot.codec_id == codec_id
+    ):
+        return data.snapshot
+    return None
+
+
+def is_indexed(file: BinaryIO) -> bool:
+    start = file.tell()
+    marker = file.read(len(MAGIC))
+    file.seek(start)
+    return marker == MAGIC
+
+
+class IndexedSnapshot[Item](ILazySnapshot[str, Item]):
+    """Read-only mapping over an indexed snapshot opened with ``mmap``.
+
+    Opening only maps the file; the key index is decoded on first use and
+    each item is unpickled on access.
+    """
+
+    def __init__(self, filepath: Path, codecs: CodecRegistry = CodecRegistry()) -> None:
+        with filepath.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        if view[: len(MAGIC)] != MAGIC:
+            view.release()
+            self._mmap.close()
+            raise pickle.UnpicklingError(
+                f"'{filepath.name}' is not an indexed snapshot"
+            )
+
+        footer_offset = len(view) - FOOTER.size
+        offsets_offset, meta_offset, keys_offset, count = FOOTER.unpack_from(
+            view, footer_offset
+        )
+        self._view = view
+        self._offsets = view[offsets_offset:meta_offset].cast("Q")
+        self._meta = view[meta_offset:keys_offset].cast("I")
+
+        self.codec_id = _read_codec_id(view[len(MAGIC) : self._offsets[0]])
+        try:
+            self._codec = codecs.resolve(self.codec_id)
+        except InvalidError:
+            self.close()
+            raise
+
+        self._keys_range = (keys_offset, footer_offset)
+        self._count: int = count
+        self._index: dict[str, int] | None = None
+
+    @property
+    def _positions(self) -> dict[str, int]:
+        # Індекс імен будуємо при першому зверненні — відкриття лише мапить файл
+        if self._index is None:
+            start, end = self._keys_range
+            names = (
+                str(self._view[start:end], "utf-8").split("\x00") if self._count else []
+            )
+            self._index = dict(zip(names, range(self._count)))
+        return self._index
+
+    def __getitem__(self, key: str) -> Item:
+        position = self._positions[key]
+        start = self._offsets[position]
+        end = self._offsets[position + 1]
+        item = pickle.loads(self._mmap[start:end])
+        if self._codec is None:
+            return cast(Item, item)
+        strings, row = item
+        return cast(Item, self._codec.decode(row, strings))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def iter_meta(self) -> Iterator[tuple[str, int]]:
+        return zip(self._positions, self._meta)
+
+    def meta(self, key: str) -> int:
+        meta: int = self._meta[self._positions[key]]
+        return meta
+
+    def raw(self, key: str) -> memoryview:
+        position = self._positions[key]
+        return self._view[self._offsets[position] : self._offsets[position + 1]]
+
+    def close(self) -> None:
+        self._offsets.release()
+        self._meta.release()
+        self._view.release()
+        self._mmap.close()
+
+
+def _read_codec_id(header: memoryview) -> str | None:
+    # Знімки без кодека не мають заголовка між MAGIC і першим записом
+    if not header:
+        return None
+    codec_id: str = pickle.loads(header)["codec"]
+    return codec_id
@@ -0,0 +1,55 @@
+import pickle
+from collections.abc import Mapping
+from typing import BinaryIO, Iterable
+
+from dal.codecs.codec_registry import CodecRegistry
+from dal.codecs.i_compact_codec import ICompactCodec
+from dal.file_managers.pickle_file_manager.pickle_stream import (
+    is_stream,
+    read_batches,
+    write_stream,
+)
+
+# Дельта-знімок: заголовок з батьківським знімком, далі змінені записи потоком
+MAGIC = b"PKLDLTA\x01"
+
+
+def is_delta(file: BinaryIO) -> bool:
+    start = file.tell()
+    marker = file.read(len(MAGIC))
+    file.seek(start)
+    return marker == MAGIC
+
+
+def write_delta(
+    file: BinaryIO,
+    parent: str,
+    changed: Mapping,
+    deleted: Iterable,
+    batch_size: int,
+    codec: ICompactCodec | None = None,
+) -> None:
+    file.write(MAGIC)
+    pickle.dump({"parent": parent, "deleted": list(deleted)}, file)
+    write_stream(file, changed, batch_size, codec)
+
+
+def read_parent(file: BinaryIO) -> str:
+    """Reads only the header; expects the delta at its ``MAGIC``."""
+    file.read(len(MAGIC))
+    parent: str = pickle.load(file)["parent"]
+    return parent
+
+
+def read_delta(
+    file: BinaryIO, codecs: CodecRegistry = CodecRegistry()
+) -> tuple[str, dict, list]:
+    file.read(len(MAGIC))
+    header = pickle.load(file)
+
+    changed: dict = {}
+    if not is_stream(file):
+        raise pickle.UnpicklingError("Delta snapshot has no record stream")
+    for batch in read_batches(file, codecs):
+        changed.update(batch)
+    return header["parent"], changed, header["deleted"]
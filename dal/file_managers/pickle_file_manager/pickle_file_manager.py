@@ -1,61 +1,301 @@
+import io
 import pickle
+import threading
+from collections.abc import Mapping
+from contextlib import contextmanager
 from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator
 
-from dal.file_managers.i_file_manager import IFileManager
+from dal.codecs.codec_registry import CodecRegistry
+from dal.codecs.i_compact_codec import ICompactCodec
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.base_file_manager import DEFAULT_BASE_DIR, BaseFileManager
+from dal.file_managers.compression import Compression
+from dal.file_managers.i_delta_file_manager import IDeltaFileManager
+from dal.file_managers.i_encoding_file_manager import IEncodingFileManager
+from dal.file_managers.i_lazy_file_manager import ILazyFileManager
+from dal.file_managers.i_streaming_file_manager import IStreamingFileManager
+from dal.file_managers.pickle_file_manager.indexed_snapshot import (
+    IndexedSnapshot,
+    IndexMeta,
+    is_indexed,
+    write_indexed,
+)
+from dal.file_managers.pickle_file_manager.pickle_delta import (
+    is_delta,
+    read_delta,
+    read_parent,
+    write_delta,
+)
+from dal.file_managers.pickle_file_manager.pickle_stream import (
+    DEFAULT_BATCH_SIZE,
+    gc_paused,
+    is_stream,
+    read_batches,
+    write_stream,
+)
 
-DEFAULT_BASE_DIR = Path("files")
 
+class PickleFileManager[Data](
+    BaseFileManager[Data],
+    IEncodingFileManager[Data],
+    IStreamingFileManager,
+    ILazyFileManager,
+    IDeltaFileManager,
+):
+    extension = ".pkl"
 
-class PickleFileManager[Data](IFileManager[Data]):
-    def __init__(self, base_dir: Path = DEFAULT_BASE_DIR):
-        self.base_dir = base_dir
-        self.base_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(
+        self,
+        base_dir: Path = DEFAULT_BASE_DIR,
+        group_commit_window: float = 0.0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        indexed: bool = False,
+        index_meta: IndexMeta | None = None,
+        codec: ICompactCodec | None = None,
+        decoders: Iterable[ICompactCodec] = (),
+        compression: Compression | None = None,
+    ):
+        self.group_commit_window = group_commit_window
+        # 0 — старий формат: увесь знімок одним pickle
+        self.batch_size = batch_size
+        # Індексований формат відкривається через mmap без розпаковки записів
+        self.indexed = indexed
+        self.index_meta = index_meta
+        # Компактний кодек замість pickle самих сутностей
+        self.codec = codec
+        # Знімок читається кодеком зі свого заголовка, а не поточним для запису
+        self.codecs = CodecRegistry([*decoders, codec] if codec else decoders)
+        self._pending: dict[Path, tuple[bytes, str | None]] = {}
+        self._commit_lock = threading.RLock()
+        self._commit_timer: threading.Timer | None = None
+        super().__init__(base_dir, compression)
 
-    def save(self, data, name: str) -> None:
-        filename = str(name)
-        filepath = self._generate_unique_filename(filename)
-        with filepath.open("wb") as file:
-            pickle.dump(data, file)
+    def save(self, data, name: str) -> str:
+        return self._save_with(str(name), lambda file: self._write(data, file), None)
 
-    def load(self, name: str):
+    def encode(self, data) -> bytes:
+        buffer = io.BytesIO()
+        self._write(data, buffer)
+        return buffer.getvalue()
+
+    def save_encoded(self, payload: bytes, name: str) -> str:
+        # Батько дельти — у заголовку байтів, які вже є в пам'яті
+        header = io.BytesIO(payload)
+        parent = read_parent(header) if is_delta(header) else None
+        if self.group_commit_window > 0:
+            return self._queue(str(name), payload, parent)
+        return self._save_with(str(name), lambda file: file.write(payload), parent)
+
+    def save_delta(
+        self, changed: Mapping, deleted: list, parent: str, name: str
+    ) -> str:
+        return self._save_with(
+            str(name),
+            lambda file: self._write_delta(changed, deleted, parent, file),
+            parent,
+        )
+
+    def encode_delta(self, changed: Mapping, deleted: list, parent: str) -> bytes:
+        buffer = io.BytesIO()
+        self._write_delta(changed, deleted, parent, buffer)
+        return buffer.getvalue()
+
+    def get_delta_parent(self, name: str) -> str | None:
+        self.flush()
+        entry = self.manifest.get(self._normalize_name(name).name)
+        if entry is not None and entry.parent_known:
+            return entry.parent
+        return self._read_delta_parent(name)
+
+    def get_delta_parents(self) -> dict[str, str]:
+        # Без flush: фонове прибирання не повинно передчасно закривати групу
+        parents: dict[str, str] = {}
+        for entry in self.manifest.entries():
+            parent = (
+                entry.parent
+                if entry.parent_known
+                else self._read_delta_parent(entry.name)
+            )
+            if parent is not None:
+                parents[entry.name] = parent
+        with self._commit_lock:
+            for filepath, (_payload, parent) in self._pending.items():
+                if parent is not None:
+                    parents[filepath.name] = parent
+        return parents
+
+    def load_delta(self, name: str) -> tuple[dict, list]:
+        with self._open(name) as file:
+            if not is_delta(file):
+                raise InvalidError(f"File '{name}' is not a delta snapshot")
+            _parent, changed, deleted = read_delta(file, self.codecs)
+            return changed, deleted
+
+    def rebase(self, data: Mapping, name: str) -> None:
+        self.flush()
         filepath = self._normalize_name(name)
         if not filepath.exists():
             raise FileNotFoundError(f"File '{filepath}' not found")
-        with filepath.open("rb") as file:
-            return pickle.load(file)
+        # Той самий стан під тим самим ім'ям, але вже без залежності від батька
+        checksum = self._atomic_write(filepath, lambda file: self._write(data, file))
+        self.manifest.record(filepath, checksum)
 
-    def delete(self, name: str) -> None:
+    def _read_delta_parent(self, name: str) -> str | None:
+        # Файл з'явився повз менеджер — читаємо заголовок один раз і запам'ятовуємо
         filepath = self._normalize_name(name)
-        if filepath.exists():
-            filepath.unlink()
-
-    def get_all_names(self) -> list[str]:
-        return [
-            f.name
-            for f in self.base_dir.iterdir()
-            if f.is_file() and f.suffix == ".pkl"
-        ]
-
-    def has_file_with_name(self, name: str) -> bool:
-        return self._normalize_name(name).exists()
-
-    def _normalize_name(self, name: str) -> Path:
-        name_path = Path(name)
-        if name_path.suffix != ".pkl":
-            name_path = name_path.with_suffix(".pkl")
-        return self.base_dir / name_path.name
-
-    def _generate_unique_filename(self, name: str) -> Path:
-        base_path = self._normalize_name(name)
-        if not base_path.exists():
-            return base_path
-
-        base = base_path.stem
-        ext = base_path.suffix
-
-        counter = 1
-        while True:
-            new_name = self.base_dir / f"{base}_{counter}{ext}"
-            if not new_name.exists():
-                return new_name
-            counter += 1
+        try:
+            with self._open_for_read(filepath) as file:
+                parent = read_parent(file) if is_delta(file) else None
+        except FileNotFoundError:
+            return None
+        self.manifest.set_parent(filepath.name, parent)
+        return parent
+
+    def _save_with(
+        self,
+        filename: str,
+        write: Callable[[BinaryIO], object],
+        parent: str | None,
+    ) -> str:
+        if self.group_commit_window <= 0:
+            filepath = self._generate_unique_filename(filename)
+            checksum = self._atomic_write(filepath, write)
+            self.manifest.record(filepath, checksum, parent)
+            return filepath.name
+
+        # Серіалізуємо одразу, щоб зафіксувати стан на момент виклику
+        buffer = io.BytesIO()
+        write(buffer)
+        return self._queue(filename, buffer.getvalue(), parent)
+
+    def _queue(self, filename: str, payload: bytes, parent: str | None) -> str:
+        with self._commit_lock:
+            filepath = self._normalize_name(filename)
+            if filepath not in self._pending:
+                filepath = self._generate_unique_filename(filename)
+            # Повторне збереження того ж знімка у вікні замінює попереднє
+            self._pending[filepath] = (payload, parent)
+
+            if self._commit_timer is None:
+                self._commit_timer = threading.Timer(
+                    self.group_commit_window, self._flush_in_background
+                )
+                self._commit_timer.start()
+
+        return filepath.name
+
+    def flush(self) -> None:
+        """Writes grouped saves; a failed write stays pending and is re-raised."""
+        with self._commit_lock:
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+
+            if not self._pending:
+                return
+
+            try:
+                for filepath, (payload, parent) in list(self._pending.items()):
+                    checksum = self._atomic_write(
+                        filepath, lambda file: file.write(payload), sync_dir=False
+                    )
+                    self.manifest.record(filepath, checksum, parent)
+                    # Знімаємо з черги лише записане — решта дочекається повтору
+                    del self._pending[filepath]
+            finally:
+                # Одна синхронізація каталогу на всю групу перейменувань
+                self._sync_dir()
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            # save() уже повернув ім'я — дані лишаються в черзі, а помилку
+            # отримає наступний flush (зокрема при виході)
+            pass
+
+    def load(self, name: str):
+        with self._open(name) as file:
+            self._reject_delta(file, name)
+            if is_indexed(file):
+                snapshot: IndexedSnapshot = IndexedSnapshot(
+                    self._normalize_name(name), self.codecs
+                )
+                try:
+                    return dict(snapshot.items())
+                finally:
+                    snapshot.close()
+            return self._deserialize(file)
+
+    def load_batches(self, name: str) -> Iterator[list[tuple]]:
+        with self._open(name) as file:
+            self._reject_delta(file, name)
+            if is_indexed(file):
+                yield list(self.load(name).items())
+                return
+            if is_stream(file):
+                yield from read_batches(file, self.codecs)
+                return
+
+            data = pickle.load(file)
+            if not isinstance(data, dict):
+                type_name = type(data).__name__
+                raise InvalidError(
+                    f"Invalid state type: expected dict, got {type_name}"
+                )
+            yield list(data.items())
+
+    def open_lazy(self, name: str) -> IndexedSnapshot | None:
+        with self._open(name) as file:
+            if not is_indexed(file):
+                return None
+        return IndexedSnapshot(self._normalize_name(name), self.codecs)
+
+    @contextmanager
+    def _open(self, name: str) -> Iterator[BinaryIO]:
+        self.flush()
+        filepath = self._normalize_name(name)
+        if not filepath.exists():
+            raise FileNotFoundError(f"File '{filepath}' not found")
+        with self._open_for_read(filepath) as file:
+            yield file
+
+    @staticmethod
+    def _reject_delta(file: BinaryIO, name: str) -> None:
+        if is_delta(file):
+            raise InvalidError(
+                f"File '{name}' is a delta snapshot and loads only with its base"
+            )
+
+    def _write(self, data, file: BinaryIO) -> None:
+        # Стиснений файл не можна відобразити через mmap — тоді пишемо потоком
+        if self.indexed and self.compression is None and isinstance(data, Mapping):
+            write_indexed(file, data, self.index_meta, self.codec)
+        else:
+            self._serialize(data, file)
+
+    def _write_delta(
+        self, changed: Mapping, deleted: list, parent: str, file: BinaryIO
+    ) -> None:
+        batch_size = self.batch_size or DEFAULT_BATCH_SIZE
+        write_delta(file, parent, changed, deleted, batch_size, self.codec)
+
+    def _serialize(self, data, file: BinaryIO) -> None:
+        if self.batch_size > 0 and isinstance(data, Mapping):
+            write_stream(file, data, self.batch_size, self.codec)
+        else:
+            pickle.dump(data, file)
+
+    def _deserialize(self, file: BinaryIO):
+        if not is_stream(file):
+            with gc_paused():
+                return pickle.load(file)
+
+        data: dict = {}
+        for batch in read_batches(file, self.codecs):
+            data.update(batch)
+        return data
+
+    def _is_taken(self, filepath: Path) -> bool:
+        return filepath in self._pending or super()._is_taken(filepath)
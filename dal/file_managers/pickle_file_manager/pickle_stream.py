@@ -0,0 +1,80 @@
+import gc
+import pickle
+from collections.abc import Mapping
+from contextlib import contextmanager
+from itertools import islice
+from typing import BinaryIO, Iterator
+
+from dal.codecs.codec_registry import CodecRegistry
+from dal.codecs.compact_frame import decode_frame, encode_frame
+from dal.codecs.i_compact_codec import ICompactCodec
+
+# Заголовок потокового формату; старі знімки починаються з байта протоколу
+MAGIC = b"PKLSTRM\x01"
+DEFAULT_BATCH_SIZE = 1000
+
+
+def is_stream(file: BinaryIO) -> bool:
+    start = file.tell()
+    marker = file.read(len(MAGIC))
+    if marker == MAGIC:
+        return True
+    file.seek(start)
+    return False
+
+
+def write_stream(
+    file: BinaryIO, data: Mapping, batch_size: int, codec: ICompactCodec | None = None
+) -> None:
+    """Writes ``data`` as a header followed by independently pickled batches.
+
+    With a ``codec`` each batch is a compact frame with its own string table.
+    """
+    file.write(MAGIC)
+    header = {
+        "count": len(data),
+        "batch_size": batch_size,
+        "codec": codec.codec_id if codec else None,
+    }
+    pickle.dump(header, file)
+
+    items = iter(data.items())
+    while batch := list(islice(items, batch_size)):
+        frame = encode_frame(codec, batch) if codec else batch
+        pickle.dump(frame, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def read_batches(
+    file: BinaryIO, codecs: CodecRegistry = CodecRegistry()
+) -> Iterator[list[tuple]]:
+    """Yields batches one by one; expects the stream after ``MAGIC``."""
+    header = pickle.load(file)
+    remaining = header["count"]
+    codec = codecs.resolve(header.get("codec"))
+
+    while remaining > 0:
+        with gc_paused():
+            batch = pickle.load(file)
+            if codec is not None:
+                batch = decode_frame(codec, batch)
+        remaining -= len(batch)
+        yield batch
+
+    if remaining < 0:
+        raise pickle.UnpicklingError("Snapshot has more records than its header")
+
+
+@contextmanager
+def gc_paused():
+    """Defers cyclic GC while a batch of new long-lived objects is created.
+
+    Records contain no reference cycles, so the collector passes triggered by
+    the allocations only rescan the growing heap.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
@@ -0,0 +1,240 @@
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from dal.file_managers.atomic_file import atomic_write
+
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+class SnapshotEntry:
+    def __init__(
+        self,
+        name: str,
+        timestamp: datetime | None,
+        size: int,
+        checksum: str | None = None,
+        parent: str | None = None,
+        parent_known: bool = False,
+    ):
+        self.name = name
+        self.timestamp = timestamp
+        self.size = size
+        self.checksum = checksum
+        # Базовий знімок дельти; None — повний знімок, якщо parent_known
+        self.parent = parent
+        self.parent_known = parent_known
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            "size": self.size,
+            "checksum": self.checksum,
+            "parent": self.parent,
+            "parent_known": self.parent_known,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "SnapshotEntry":
+        timestamp = raw.get("timestamp")
+        return cls(
+            raw["name"],
+            datetime.fromisoformat(timestamp) if timestamp else None,
+            int(raw["size"]),
+            raw.get("checksum"),
+            raw.get("parent"),
+            bool(raw.get("parent_known", False)),
+        )
+
+
+class SnapshotManifest:
+    """Persistent index of snapshot files in one directory.
+
+    Saves and deletes made through the file manager update it directly and
+    take the directory mtime they caused as known; any other change to the
+    directory is picked up by comparing its mtime. The manifest itself lives
+    in a subdirectory, so rewriting it does not touch that mtime.
+    """
+
+    def __init__(self, base_dir: Path, extension: str):
+        self.base_dir = base_dir
+        self.extension = extension
+        self.filepath = base_dir / ".manifest" / f"manifest{extension}.json"
+        self._lock = threading.RLock()
+        self._entries: dict[str, SnapshotEntry] = {}
+        self._dir_mtime_ns: int | None = None
+        self._sorted_names: list[str] | None = None
+        self._latest: SnapshotEntry | None = None
+        self._latest_known = False
+        self._read()
+
+    def names(self) -> list[str]:
+        with self._lock:
+            self._revalidate()
+            if self._sorted_names is None:
+                self._sorted_names = sorted(self._entries)
+            return list(self._sorted_names)
+
+    def entries(self) -> list[SnapshotEntry]:
+        with self._lock:
+            self._revalidate()
+            return list(self._entries.values())
+
+    def get(self, name: str) -> SnapshotEntry | None:
+        with self._lock:
+            self._revalidate()
+            return self._entries.get(name)
+
+    def latest(self) -> SnapshotEntry | None:
+        with self._lock:
+            self._revalidate()
+            if not self._latest_known:
+                self._latest = max(
+                    self._entries.values(), key=self._latest_key, default=None
+                )
+                self._latest_known = True
+            return self._latest
+
+    def record(
+        self, filepath: Path, checksum: str, parent: str | None = None
+    ) -> SnapshotEntry:
+        entry = SnapshotEntry(
+            filepath.name,
+            parse_timestamp(filepath.name),
+            filepath.stat().st_size,
+            checksum,
+            parent,
+            parent_known=True,
+        )
+
+        with self._lock:
+            self._revalidate_before_own_change()
+            self._entries[entry.name] = entry
+            self._sorted_names = None
+            if self._latest_known and (
+                self._latest is None
+                or self._latest_key(entry) > self._latest_key(self._latest)
+            ):
+                self._latest = entry
+            self._write()
+        return entry
+
+    def set_parent(self, name: str, parent: str | None) -> None:
+        """Remembers the delta parent read from the header of a foreign file."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry.parent_known:
+                return
+            entry.parent = parent
+            entry.parent_known = True
+            self._write()
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            self._revalidate_before_own_change()
+            removed = self._entries.pop(name, None)
+            if removed is None:
+                # Каталог усе одно міг змінитися — запам'ятовуємо його mtime
+                self._write()
+                return
+
+            self._sorted_names = None
+            if self._latest is removed:
+                self._latest_known = False
+            self._write()
+
+    def _revalidate(self) -> None:
+        try:
+            mtime_ns = self.base_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        if mtime_ns is not None and mtime_ns == self._dir_mtime_ns:
+            return
+
+        self._rescan()
+        self._write()
+
+    def _revalidate_before_own_change(self) -> None:
+        # Mtime каталогу змінив сам менеджер — він уже записав або видалив
+        # файл; повне сканування потрібне, лише якщо маніфест ще не звірено
+        if self._dir_mtime_ns is None:
+            self._rescan()
+
+    def _rescan(self) -> None:
+        entries: dict[str, SnapshotEntry] = {}
+        if self.base_dir.exists():
+            for path in self.base_dir.iterdir():
+                if path.suffix != self.extension or not path.is_file():
+                    continue
+
+                size = path.stat().st_size
+                known = self._entries.get(path.name)
+                if known is not None and known.size == size:
+                    entries[path.name] = known
+                else:
+                    # Файл з'явився повз менеджер — контрольну суму не знаємо
+                    entries[path.name] = SnapshotEntry(
+                        path.name, parse_timestamp(path.name), size
+                    )
+
+        self._entries = entries
+        self._sorted_names = None
+        self._latest_known = False
+
+    def _read(self) -> None:
+        try:
+            raw = json.loads(self.filepath.read_text(encoding="utf-8"))
+            entries = [SnapshotEntry.from_dict(item) for item in raw["entries"]]
+            self._dir_mtime_ns = raw.get("dir_mtime_ns")
+        except (OSError, ValueError, KeyError, TypeError):
+            # Відсутній або пошкоджений маніфест буде перебудовано з каталогу
+            return
+
+        self._entries = {entry.name: entry for entry in entries}
+
+    def _write(self) -> None:
+        if not self.base_dir.exists():
+            return
+
+        # Створення підкаталогу змінює mtime каталогу — лише перед його читанням
+        self.filepath.parent.mkdir(exist_ok=True)
+        self._dir_mtime_ns = self.base_dir.stat().st_mtime_ns
+
+        entries = [entry.to_dict() for entry in self._entries.values()]
+        payload = json.dumps(
+            {"dir_mtime_ns": self._dir_mtime_ns, "entries": entries}
+        ).encode("utf-8")
+        atomic_write(self.filepath, lambda file: file.write(payload))
+
+    @staticmethod
+    def _latest_key(entry: SnapshotEntry) -> tuple[bool, datetime, str]:
+        # Знімки без мітки часу поступаються будь-якому датованому
+        return (
+            entry.timestamp is not None,
+            entry.timestamp or datetime.min,
+            entry.name,
+        )
+
+
+def parse_timestamp(name: str) -> datetime | None:
+    if "." not in name:
+        return None
+    base, _ext = name.rsplit(".", 1)
+
+    parts = base.split("_")
+    if len(parts) < 3:
+        return None
+
+    date_part, time_part = parts[-2], parts[-1]
+    if len(date_part) != 8 or len(time_part) != 6:
+        return None
+    if not (date_part + time_part).isdigit():
+        return None
+
+    try:
+        return datetime.strptime(f"{date_part}_{time_part}", TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
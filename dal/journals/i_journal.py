@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+
+class IJournal[Key, Item](ABC):
+    @abstractmethod
+    def append(self, entries: list[tuple[Key, Item | None]]) -> None:
+        pass
+
+    @abstractmethod
+    def read(self) -> list[tuple[Key, Item | None]]:
+        pass
+
+    @abstractmethod
+    def reset(self, base_name: str | None) -> None:
+        pass
+
+    @abstractmethod
+    def get_base_name(self) -> str | None:
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        pass
@@ -0,0 +1,86 @@
+import os
+import pickle
+from pathlib import Path
+
+from dal.journals.i_journal import IJournal
+
+DEFAULT_JOURNAL_NAME = "journal.log"
+
+
+class PickleJournal[Key, Item](IJournal[Key, Item]):
+    def __init__(self, base_dir: Path, file_name: str = DEFAULT_JOURNAL_NAME):
+        self.base_dir = base_dir
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.filepath = self.base_dir / file_name
+        self._base_name: str | None = None
+        self._count: int | None = None
+
+    def append(self, entries: list[tuple[Key, Item | None]]) -> None:
+        if not entries:
+            return
+
+        current = self.count()
+        if not self.filepath.exists():
+            self.reset(self._base_name)
+
+        with self.filepath.open("ab") as file:
+            for key, item in entries:
+                pickle.dump((key, item), file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        self._count = current + len(entries)
+
+    def read(self) -> list[tuple[Key, Item | None]]:
+        return self._scan()
+
+    def reset(self, base_name: str | None) -> None:
+        tmp_path = self.filepath.with_name(f"{self.filepath.name}.tmp")
+        with tmp_path.open("wb") as file:
+            pickle.dump({"base": base_name}, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.filepath)
+
+        self._base_name = base_name
+        self._count = 0
+
+    def get_base_name(self) -> str | None:
+        if self._count is None:
+            self._scan()
+        return self._base_name
+
+    def count(self) -> int:
+        if self._count is None:
+            self._scan()
+        return self._count or 0
+
+    def _scan(self) -> list[tuple[Key, Item | None]]:
+        entries: list[tuple[Key, Item | None]] = []
+
+        if not self.filepath.exists():
+            self._base_name = None
+            self._count = 0
+            return entries
+
+        with self.filepath.open("r+b") as file:
+            try:
+                header = pickle.load(file)
+            except (EOFError, pickle.UnpicklingError):
+                header = {}
+            self._base_name = header.get("base") if isinstance(header, dict) else None
+
+            size = self.filepath.stat().st_size
+            valid_offset = file.tell()
+            while valid_offset < size:
+                try:
+                    key, item = pickle.load(file)
+                except (EOFError, pickle.UnpicklingError, ValueError, TypeError):
+                    # Обрізаний кадр після збою — відкидаємо хвіст журналу
+                    file.truncate(valid_offset)
+                    break
+                entries.append((key, item))
+                valid_offset = file.tell()
+
+        self._count = len(entries)
+        return entries
@@ -1,24 +1,49 @@
 from collections import UserDict
-from typing import Callable
+from collections.abc import MutableMapping
+from datetime import date
+from typing import Callable, Iterable, cast
 
 from dal.entities.record import Record
 from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.i_lazy_file_manager import ILazySnapshot
+from dal.storages.i_batch_importable_storage import IBatchImportableStorage
+from dal.storages.i_birthday_indexed_storage import IBirthdayIndexedStorage
+from dal.storages.i_lazy_importable_storage import ILazyImportableStorage
 from dal.storages.i_serializable_storage import ISerializableStorage
 from dal.storages.i_storage import IStorage
+from dal.storages.lazy_dict import LazyDict
+from dal.storages.observable_storage import ObservableStorage
 
 
 class AddressBookStorage(
-    UserDict, IStorage[str, Record], ISerializableStorage[dict[str, Record]]
+    ObservableStorage[str, Record],
+    UserDict,
+    IStorage[str, Record],
+    ISerializableStorage[dict[str, Record]],
+    IBirthdayIndexedStorage[Record],
+    IBatchImportableStorage[str, Record],
+    ILazyImportableStorage[str, Record],
 ):
+    # UserDict оголошує dict, а після лінивого завантаження тут LazyDict
+    data: MutableMapping[str, Record]  # type: ignore[assignment]
+
     def __init__(self):
+        # (місяць, день) -> імена; dict як впорядкована множина
+        self._birthday_buckets: dict[tuple[int, int], dict[str, None]] = {}
+        self._birthday_keys: dict[str, tuple[int, int]] = {}
+        self._pending_birthdays: ILazySnapshot[str, Record] | None = None
         super().__init__()
 
     def add(self, record: Record) -> Record:
         self.data[record.name.value] = record
+        self._index_birthday(record.name.value, record)
+        self._notify("add", record.name.value, record)
         return record
 
     def update_item(self, record_name: str, new_record: Record) -> Record:
         self.data[record_name] = new_record
+        self._index_birthday(record_name, new_record)
+        self._notify("update", record_name, new_record)
         return new_record
 
     def find(self, record_name: str) -> Record | None:
@@ -28,7 +53,9 @@ class AddressBookStorage(
         return list(self.data.values())
 
     def delete(self, record_name: str) -> None:
-        self.data.pop(record_name, None)
+        if self.data.pop(record_name, None) is not None:
+            self._unindex_birthday(record_name)
+            self._notify("delete", record_name)
 
     def has(self, record_name: str) -> bool:
         return record_name in self.data
@@ -36,8 +63,17 @@ class AddressBookStorage(
     def filter(self, predicate: Callable[[Record], bool]) -> list[Record]:
         return [record for record in self.data.values() if predicate(record)]
 
+    def find_by_birthdays(self, month_days: Iterable[tuple[int, int]]) -> list[Record]:
+        self._ensure_birthday_index()
+        results: list[Record] = []
+        for month_day in dict.fromkeys(month_days):
+            for record_name in self._birthday_buckets.get(month_day, ()):
+                results.append(self.data[record_name])
+        return results
+
     def export_state(self) -> dict[str, Record]:
-        return self.data
+        # LazyDict віддаємо як є — менеджери файлів працюють із Mapping
+        return cast(dict[str, Record], self.data)
 
     def import_state(self, state: dict[str, Record]) -> None:
         if not isinstance(state, dict):
@@ -46,4 +82,112 @@ class AddressBookStorage(
                 f"Invalid state type: expected dict[str, Record], got {type_name}"
             )
 
+        previous = self.data
         self.data = state
+        self._pending_birthdays = None
+        self._birthday_buckets.clear()
+        self._birthday_keys.clear()
+        for record_name, record in state.items():
+            self._index_birthday(record_name, record)
+        self._notify("import")
+        self._close_lazy(previous)
+
+    def import_batches(self, batches: Iterable[list[tuple[str, Record]]]) -> None:
+        previous = (self.data, self._birthday_buckets, self._birthday_keys)
+        previous_pending = self._pending_birthdays
+        self.data, self._birthday_buckets, self._birthday_keys = {}, {}, {}
+        self._pending_birthdays = None
+        # Попередній стан більше не дійсний — слухачі скидають свої індекси
+        self._notify("import")
+        try:
+            for batch in batches:
+                # Кожна порція одразу доступна для пошуку та підказок
+                self.data.update(batch)
+                for record_name, record in batch:
+                    self._index_birthday(record_name, record)
+        except Exception:
+            # Обірване завантаження не повинно лишати половину книги
+            self.data, self._birthday_buckets, self._birthday_keys = previous
+            self._pending_birthdays = previous_pending
+            self._notify("import")
+            raise
+        # Одна подія на все завантаження, а не перебудова індексів на кожну порцію
+        self._notify("import")
+        self._close_lazy(previous[0])
+
+    def import_lazy(self, snapshot: ILazySnapshot[str, Record]) -> None:
+        previous = self.data
+        self.data = LazyDict(snapshot)
+        self._birthday_buckets = {}
+        self._birthday_keys = {}
+        # Індекс днів народження збудуємо з метаданих знімка при першій потребі
+        self._pending_birthdays = snapshot
+        self._notify("import")
+        self._close_lazy(previous)
+
+    def release_lazy(self) -> None:
+        data = self.data
+        if not isinstance(data, LazyDict):
+            return
+
+        # Індекс днів народження ще читає метадані знімка — будуємо його до закриття
+        self._ensure_birthday_index()
+        self.data = data.materialize()
+        data.close()
+
+    @staticmethod
+    def birthday_meta(record: Record) -> int:
+        """Index metadata for lazy snapshots: birthday as MMDD, 0 when unset."""
+        if record.birthday is None:
+            return 0
+        birthday: date = record.birthday.value
+        return birthday.month * 100 + birthday.day
+
+    @staticmethod
+    def _close_lazy(data: MutableMapping[str, Record]) -> None:
+        # Замінений лінивий стан більше не читається — звільняємо mmap
+        if isinstance(data, LazyDict):
+            data.close()
+
+    def _ensure_birthday_index(self) -> None:
+        snapshot = self._pending_birthdays
+        if snapshot is None:
+            return
+
+        self._pending_birthdays = None
+        # Записи не розпаковуються — день народження зберігається в індексі знімка
+        # Один кортеж і один кошик на день — без алокацій на кожен запис
+        by_code: dict[int, tuple[tuple[int, int], dict[str, None]]] = {}
+        birthday_keys = self._birthday_keys
+        for record_name, code in snapshot.iter_meta():
+            if not code:
+                continue
+            entry = by_code.get(code)
+            if entry is None:
+                month_day = divmod(code, 100)
+                bucket = self._birthday_buckets.setdefault(month_day, {})
+                entry = by_code[code] = (month_day, bucket)
+            entry[1][record_name] = None
+            birthday_keys[record_name] = entry[0]
+
+    def _index_birthday(self, record_name: str, record: Record) -> None:
+        self._unindex_birthday(record_name)
+
+        birthday = record.birthday.value if record.birthday else None
+        if birthday is None:
+            return
+
+        month_day = (birthday.month, birthday.day)
+        self._birthday_buckets.setdefault(month_day, {})[record_name] = None
+        self._birthday_keys[record_name] = month_day
+
+    def _unindex_birthday(self, record_name: str) -> None:
+        self._ensure_birthday_index()
+        month_day = self._birthday_keys.pop(record_name, None)
+        if month_day is None:
+            return
+
+        bucket = self._birthday_buckets[month_day]
+        bucket.pop(record_name, None)
+        if not bucket:
+            del self._birthday_buckets[month_day]
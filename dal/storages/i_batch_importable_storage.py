@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class IBatchImportableStorage[Key, Item](ABC):
+    @abstractmethod
+    def import_batches(self, batches: Iterable[list[tuple[Key, Item]]]) -> None:
+        pass
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class IBirthdayIndexedStorage[Item](ABC):
+    @abstractmethod
+    def find_by_birthdays(self, month_days: Iterable[tuple[int, int]]) -> list[Item]:
+        pass
@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+
+class IDurableStorage(ABC):
+    @abstractmethod
+    def close(self) -> None:
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from dal.file_managers.i_lazy_file_manager import ILazySnapshot
+
+
+class ILazyImportableStorage[Key, Item](ABC):
+    @abstractmethod
+    def import_lazy(self, snapshot: ILazySnapshot[Key, Item]) -> None:
+        pass
+
+    @abstractmethod
+    def release_lazy(self) -> None:
+        """Loads the rest of a lazy snapshot into memory and closes it."""
+        pass
@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+
+class IPhoneIndexedStorage[Item](ABC):
+    @abstractmethod
+    def find_by_phone(self, phone: str) -> list[Item]:
+        pass
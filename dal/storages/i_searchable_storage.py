@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+
+class ISearchableStorage[Item](ABC):
+    @abstractmethod
+    def search(self, tokens: list[str]) -> list[Item]:
+        pass
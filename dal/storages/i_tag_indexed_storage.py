@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+
+class ITagIndexedStorage[Item](ABC):
+    @abstractmethod
+    def find_by_tag(self, tag_name: str) -> list[Item]:
+        pass
@@ -0,0 +1,75 @@
+from collections.abc import Mapping, MutableMapping
+from typing import Iterator
+
+from dal.file_managers.i_lazy_file_manager import ILazySnapshot
+
+
+class LazyDict[Key, Item](MutableMapping[Key, Item]):
+    """Mutable view over a lazy snapshot that caches items on first access.
+
+    Writes and deletes are kept as a delta in memory; the snapshot itself is
+    never changed, and its key index is used as is.
+    """
+
+    def __init__(self, snapshot: Mapping[Key, Item]) -> None:
+        self.snapshot = snapshot
+        self._cache: dict[Key, Item] = {}
+        self._added: dict[Key, None] = {}
+        self._removed: set[Key] = set()
+
+    @property
+    def materialized_count(self) -> int:
+        return len(self._cache)
+
+    def is_materialized(self, key: Key) -> bool:
+        return key in self._cache
+
+    def materialize(self) -> dict[Key, Item]:
+        return {key: self[key] for key in self}
+
+    def close(self) -> None:
+        # Знімок із файлу тримає mmap і дескриптор, доки його не закрити
+        if isinstance(self.snapshot, ILazySnapshot):
+            self.snapshot.close()
+
+    def __getitem__(self, key: Key) -> Item:
+        item = self._cache.get(key)
+        if item is not None:
+            return item
+        if key in self._removed or key not in self.snapshot:
+            raise KeyError(key)
+
+        item = self._cache[key] = self.snapshot[key]
+        return item
+
+    def __setitem__(self, key: Key, item: Item) -> None:
+        self._cache[key] = item
+        if key in self.snapshot:
+            self._removed.discard(key)
+        else:
+            self._added[key] = None
+
+    def __delitem__(self, key: Key) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        self._cache.pop(key, None)
+        if key in self._added:
+            del self._added[key]
+        else:
+            self._removed.add(key)
+
+    def __iter__(self) -> Iterator[Key]:
+        if self._removed:
+            yield from (key for key in self.snapshot if key not in self._removed)
+        else:
+            yield from self.snapshot
+        yield from self._added
+
+    def __len__(self) -> int:
+        return len(self.snapshot) - len(self._removed) + len(self._added)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._added:
+            return True
+        return key in self.snapshot and key not in self._removed
@@ -1,26 +1,45 @@
 from collections import UserDict
-from typing import Callable
+from collections.abc import MutableMapping
+from typing import Callable, Iterable, cast
 
 from dal.entities.note import Note
 from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.i_lazy_file_manager import ILazySnapshot
+from dal.storages.i_batch_importable_storage import IBatchImportableStorage
+from dal.storages.i_lazy_importable_storage import ILazyImportableStorage
 from dal.storages.i_serializable_storage import ISerializableStorage
 from dal.storages.i_storage import IStorage
+from dal.storages.lazy_dict import LazyDict
+from dal.storages.observable_storage import ObservableStorage
 
 
-class NoteStorage(UserDict, IStorage[str, Note], ISerializableStorage[dict[str, Note]]):
+class NoteStorage(
+    ObservableStorage[str, Note],
+    UserDict,
+    IStorage[str, Note],
+    ISerializableStorage[dict[str, Note]],
+    IBatchImportableStorage[str, Note],
+    ILazyImportableStorage[str, Note],
+):
+    # UserDict оголошує dict, а після лінивого завантаження тут LazyDict
+    data: MutableMapping[str, Note]  # type: ignore[assignment]
+
     def add(self, note: Note) -> Note:
         self.data[note.name.value] = note
+        self._notify("add", note.name.value, note)
         return note
 
     def update_item(self, note_name: str, note: Note) -> Note:
         self.data[note_name] = note
+        self._notify("update", note_name, note)
         return note
 
     def find(self, note_name: str) -> Note | None:
         return self.data.get(note_name)
 
     def delete(self, note_name: str) -> None:
-        self.data.pop(note_name, None)
+        if self.data.pop(note_name, None) is not None:
+            self._notify("delete", note_name)
 
     def has(self, note_name: str) -> bool:
         return note_name in self.data
@@ -32,7 +51,8 @@ class NoteStorage(UserDict, IStorage[str, Note], ISerializableStorage[dict[str,
         return [note for note in self.data.values() if predicate(note)]
 
     def export_state(self) -> dict[str, Note]:
-        return self.data
+        # LazyDict віддаємо як є — менеджери файлів працюють із Mapping
+        return cast(dict[str, Note], self.data)
 
     def import_state(self, state: dict[str, Note]) -> None:
         if not isinstance(state, dict):
@@ -41,4 +61,39 @@ class NoteStorage(UserDict, IStorage[str, Note], ISerializableStorage[dict[str,
                 f"Invalid state type: expected dict[str, Note], got {type_name}"
             )
 
+        previous = self.data
         self.data = state
+        self._notify("import")
+        self._close_lazy(previous)
+
+    def import_batches(self, batches: Iterable[list[tuple[str, Note]]]) -> None:
+        previous = self.data
+        self.data = {}
+        self._notify("import")
+        try:
+            for batch in batches:
+                self.data.update(batch)
+        except Exception:
+            self.data = previous
+            self._notify("import")
+            raise
+        self._notify("import")
+        self._close_lazy(previous)
+
+    def import_lazy(self, snapshot: ILazySnapshot[str, Note]) -> None:
+        previous = self.data
+        self.data = LazyDict(snapshot)
+        self._notify("import")
+        self._close_lazy(previous)
+
+    def release_lazy(self) -> None:
+        data = self.data
+        if isinstance(data, LazyDict):
+            self.data = data.materialize()
+            data.close()
+
+    @staticmethod
+    def _close_lazy(data: MutableMapping[str, Note]) -> None:
+        # Замінений лінивий стан більше не читається — звільняємо mmap
+        if isinstance(data, LazyDict):
+            data.close()
@@ -0,0 +1,36 @@
+from collections.abc import MutableMapping
+from typing import Callable, Literal
+
+type StorageEvent = Literal["add", "update", "delete", "import"]
+type StorageListener[Key, Item] = Callable[
+    [StorageEvent, Key | None, Item | None], None
+]
+
+
+class ObservableStorage[Key, Item]:
+    # Звичайний dict або LazyDict поверх лінивого знімка
+    data: MutableMapping[Key, Item]
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._listeners: list[StorageListener[Key, Item]] = []
+        self._version = 0
+        super().__init__(*args, **kwargs)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def subscribe(self, listener: StorageListener[Key, Item]) -> None:
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: StorageListener[Key, Item]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(
+        self, event: StorageEvent, key: Key | None = None, item: Item | None = None
+    ) -> None:
+        self._version += 1
+        for listener in list(self._listeners):
+            listener(event, key, item)
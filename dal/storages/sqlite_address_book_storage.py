@@ -0,0 +1,278 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+from dal.codecs.record_codec import RecordCodec
+from dal.entities.record import Record
+from dal.exceptions.invalid_error import InvalidError
+from dal.storages.i_birthday_indexed_storage import IBirthdayIndexedStorage
+from dal.storages.i_durable_storage import IDurableStorage
+from dal.storages.i_phone_indexed_storage import IPhoneIndexedStorage
+from dal.storages.i_searchable_storage import ISearchableStorage
+from dal.storages.i_serializable_storage import ISerializableStorage
+from dal.storages.i_storage import IStorage
+from dal.storages.observable_storage import ObservableStorage
+from dal.storages.sqlite_text_search import SqliteTextSearch
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    name TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    birthday_month INTEGER,
+    birthday_day INTEGER,
+    search_text TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_records_birthday
+    ON records (birthday_month, birthday_day);
+
+CREATE TABLE IF NOT EXISTS phones (
+    record_name TEXT NOT NULL REFERENCES records (name) ON DELETE CASCADE,
+    phone TEXT NOT NULL,
+    normalized TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_phones_normalized ON phones (normalized);
+CREATE INDEX IF NOT EXISTS idx_phones_record ON phones (record_name);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# SQLite обмежує кількість параметрів у запиті
+_MAX_QUERY_PARAMS = 500
+
+
+class SqliteAddressBookStorage(
+    ObservableStorage[str, Record],
+    IStorage[str, Record],
+    ISerializableStorage[dict[str, Record]],
+    IBirthdayIndexedStorage[Record],
+    IPhoneIndexedStorage[Record],
+    ISearchableStorage[Record],
+    IDurableStorage,
+):
+    """SQLite-backed address book with phone, birthday and text lookups.
+
+    ``phone_key`` maps a phone to the value stored in ``phones.normalized``;
+    ``phone_key_scheme`` names it, so a changed scheme (e.g. another phone
+    region) re-keys the stored phones on open. ``search_strings`` and
+    ``search_scheme`` do the same for the free-text search.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        codec: RecordCodec | None = None,
+        phone_key: Callable[[str], str] | None = None,
+        phone_key_scheme: str = "digits",
+        search_strings: Callable[[Record], Iterable[str]] | None = None,
+        search_scheme: str = "fields",
+    ):
+        super().__init__()
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._codec = codec or RecordCodec()
+        self._phone_key = phone_key or self._normalize_phone
+        self._search_strings = search_strings or self._record_strings
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.executescript(_SCHEMA)
+        self._refresh_phone_keys(phone_key_scheme)
+        self._text_search = SqliteTextSearch(self._connection, "records")
+        with self._lock:
+            self._text_search.refresh(
+                search_scheme, lambda payload: self._search_text(self._decode(payload))
+            )
+
+    def add(self, record: Record) -> Record:
+        with self._lock, self._connection:
+            self._write(record.name.value, record)
+        self._notify("add", record.name.value, record)
+        return record
+
+    def update_item(self, record_name: str, new_record: Record) -> Record:
+        with self._lock, self._connection:
+            self._write(record_name, new_record)
+        self._notify("update", record_name, new_record)
+        return new_record
+
+    def find(self, record_name: str) -> Record | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM records WHERE name = ?", (record_name,)
+            ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def all_values(self) -> list[Record]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT payload FROM records ORDER BY rowid"
+            ).fetchall()
+        return [self._decode(payload) for (payload,) in rows]
+
+    def delete(self, record_name: str) -> None:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT rowid FROM records WHERE name = ?", (record_name,)
+            ).fetchone()
+            if row is not None:
+                self._text_search.remove(row[0])
+                self._connection.execute("DELETE FROM records WHERE rowid = ?", row)
+        if row is not None:
+            self._notify("delete", record_name)
+
+    def has(self, record_name: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM records WHERE name = ?", (record_name,)
+            ).fetchone()
+        return row is not None
+
+    def filter(self, predicate: Callable[[Record], bool]) -> list[Record]:
+        return [record for record in self.all_values() if predicate(record)]
+
+    def find_by_birthdays(self, month_days: Iterable[tuple[int, int]]) -> list[Record]:
+        pairs = list(dict.fromkeys(month_days))
+        buckets: dict[tuple[int, int], list[str]] = {}
+
+        for start in range(0, len(pairs), _MAX_QUERY_PARAMS // 2):
+            chunk = pairs[start : start + _MAX_QUERY_PARAMS // 2]
+            condition = " OR ".join(
+                "(birthday_month = ? AND birthday_day = ?)" for _ in chunk
+            )
+            params = [value for pair in chunk for value in pair]
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT birthday_month, birthday_day, payload FROM records "
+                    f"WHERE {condition} ORDER BY rowid",
+                    params,
+                ).fetchall()
+            for month, day, payload in rows:
+                buckets.setdefault((month, day), []).append(payload)
+
+        return [
+            self._decode(payload) for pair in pairs for payload in buckets.get(pair, ())
+        ]
+
+    def find_by_phone(self, phone: str) -> list[Record]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT r.payload FROM phones p "
+                "JOIN records r ON r.name = p.record_name "
+                "WHERE p.normalized = ? ORDER BY r.rowid",
+                (self._phone_key(phone),),
+            ).fetchall()
+        return [self._decode(payload) for (payload,) in rows]
+
+    def search(self, tokens: list[str]) -> list[Record]:
+        with self._lock:
+            payloads = self._text_search.search(tokens)
+        return [self._decode(payload) for payload in payloads]
+
+    def export_state(self) -> dict[str, Record]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name, payload FROM records ORDER BY rowid"
+            ).fetchall()
+        return {name: self._decode(payload) for name, payload in rows}
+
+    def import_state(self, state: dict[str, Record]) -> None:
+        if not isinstance(state, dict):
+            type_name = type(state).__name__
+            raise InvalidError(
+                f"Invalid state type: expected dict[str, Record], got {type_name}"
+            )
+
+        with self._lock, self._connection:
+            self._text_search.clear()
+            self._connection.execute("DELETE FROM records")
+            for record_name, record in state.items():
+                self._write(record_name, record)
+        self._notify("import")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _write(self, record_name: str, record: Record) -> None:
+        payload = json.dumps(self._codec.encode(record), ensure_ascii=False)
+        birthday = record.birthday.value if record.birthday else None
+        month = birthday.month if birthday else None
+        day = birthday.day if birthday else None
+
+        updated = self._connection.execute(
+            "UPDATE records SET payload = ?, birthday_month = ?, birthday_day = ? "
+            "WHERE name = ?",
+            (payload, month, day, record_name),
+        )
+        if not updated.rowcount:
+            self._connection.execute(
+                "INSERT INTO records (name, payload, birthday_month, birthday_day) "
+                "VALUES (?, ?, ?, ?)",
+                (record_name, payload, month, day),
+            )
+
+        self._connection.execute(
+            "DELETE FROM phones WHERE record_name = ?", (record_name,)
+        )
+        self._connection.executemany(
+            "INSERT INTO phones (record_name, phone, normalized) VALUES (?, ?, ?)",
+            [
+                (record_name, phone.value, self._phone_key(phone.value))
+                for phone in record.phones
+            ],
+        )
+
+        (rowid,) = self._connection.execute(
+            "SELECT rowid FROM records WHERE name = ?", (record_name,)
+        ).fetchone()
+        self._text_search.write(rowid, self._search_text(record))
+
+    def _refresh_phone_keys(self, scheme: str) -> None:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = 'phone_key_scheme'"
+            ).fetchone()
+            if row is not None and row[0] == scheme:
+                return
+
+            # Ключі збережено за іншою схемою — перераховуємо для всіх номерів
+            rows = self._connection.execute(
+                "SELECT rowid, phone FROM phones"
+            ).fetchall()
+            self._connection.executemany(
+                "UPDATE phones SET normalized = ? WHERE rowid = ?",
+                [(self._phone_key(phone), rowid) for rowid, phone in rows],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) "
+                "VALUES ('phone_key_scheme', ?)",
+                (scheme,),
+            )
+
+    def _search_text(self, record: Record) -> str:
+        # Рядки через перенос — токен без пробілів не перетне межу між ними
+        return "\n".join(self._search_strings(record)).lower()
+
+    def _decode(self, payload: str) -> Record:
+        return self._codec.decode(json.loads(payload))
+
+    @staticmethod
+    def _normalize_phone(phone: str) -> str:
+        return "".join(ch for ch in phone if ch.isdigit())
+
+    @staticmethod
+    def _record_strings(record: Record) -> list[str]:
+        strings = [record.name.value]
+        strings.extend(phone.value for phone in record.phones)
+        strings.extend(email.value for email in record.emails)
+        if record.birthday is not None:
+            strings.extend([str(record.birthday), str(record.birthday.value)])
+        if record.address is not None:
+            strings.append(record.address.value)
+        return strings
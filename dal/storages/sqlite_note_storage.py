@@ -0,0 +1,210 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+from dal.codecs.note_codec import NoteCodec
+from dal.entities.note import Note
+from dal.exceptions.invalid_error import InvalidError
+from dal.storages.i_durable_storage import IDurableStorage
+from dal.storages.i_searchable_storage import ISearchableStorage
+from dal.storages.i_serializable_storage import ISerializableStorage
+from dal.storages.i_storage import IStorage
+from dal.storages.i_tag_indexed_storage import ITagIndexedStorage
+from dal.storages.observable_storage import ObservableStorage
+from dal.storages.sqlite_text_search import SqliteTextSearch
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    name TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    search_text TEXT NOT NULL DEFAULT ''
+);
+
+CREATE TABLE IF NOT EXISTS note_tags (
+    note_name TEXT NOT NULL REFERENCES notes (name) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    normalized TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_note_tags_normalized ON note_tags (normalized);
+CREATE INDEX IF NOT EXISTS idx_note_tags_note ON note_tags (note_name);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class SqliteNoteStorage(
+    ObservableStorage[str, Note],
+    IStorage[str, Note],
+    ISerializableStorage[dict[str, Note]],
+    ISearchableStorage[Note],
+    ITagIndexedStorage[Note],
+    IDurableStorage,
+):
+    """SQLite-backed notes with full-text search and a tag index.
+
+    ``search_strings`` yields the searchable strings of a note, the same ones
+    the in-memory search matches; ``search_scheme`` names them, so a changed
+    scheme rebuilds the stored search texts on open.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        codec: NoteCodec | None = None,
+        search_strings: Callable[[Note], Iterable[str]] | None = None,
+        search_scheme: str = "fields",
+    ):
+        super().__init__()
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._codec = codec or NoteCodec()
+        self._search_strings = search_strings or self._note_strings
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.executescript(_SCHEMA)
+        self._text_search = SqliteTextSearch(self._connection, "notes")
+        with self._lock:
+            self._text_search.refresh(
+                search_scheme, lambda payload: self._search_text(self._decode(payload))
+            )
+
+    def add(self, note: Note) -> Note:
+        with self._lock, self._connection:
+            self._write(note.name.value, note)
+        self._notify("add", note.name.value, note)
+        return note
+
+    def update_item(self, note_name: str, note: Note) -> Note:
+        with self._lock, self._connection:
+            self._write(note_name, note)
+        self._notify("update", note_name, note)
+        return note
+
+    def find(self, note_name: str) -> Note | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM notes WHERE name = ?", (note_name,)
+            ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def delete(self, note_name: str) -> None:
+        with self._lock, self._connection:
+            deleted = self._remove(note_name)
+        if deleted:
+            self._notify("delete", note_name)
+
+    def has(self, note_name: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM notes WHERE name = ?", (note_name,)
+            ).fetchone()
+        return row is not None
+
+    def all_values(self) -> list[Note]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT payload FROM notes ORDER BY rowid"
+            ).fetchall()
+        return [self._decode(payload) for (payload,) in rows]
+
+    def filter(self, predicate: Callable[[Note], bool]) -> list[Note]:
+        return [note for note in self.all_values() if predicate(note)]
+
+    def search(self, tokens: list[str]) -> list[Note]:
+        with self._lock:
+            payloads = self._text_search.search(tokens)
+        return [self._decode(payload) for payload in payloads]
+
+    def find_by_tag(self, tag_name: str) -> list[Note]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT n.payload FROM note_tags t "
+                "JOIN notes n ON n.name = t.note_name "
+                "WHERE t.normalized = ? ORDER BY n.rowid",
+                (tag_name.strip().lower(),),
+            ).fetchall()
+        return [self._decode(payload) for (payload,) in rows]
+
+    def export_state(self) -> dict[str, Note]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name, payload FROM notes ORDER BY rowid"
+            ).fetchall()
+        return {name: self._decode(payload) for name, payload in rows}
+
+    def import_state(self, state: dict[str, Note]) -> None:
+        if not isinstance(state, dict):
+            type_name = type(state).__name__
+            raise InvalidError(
+                f"Invalid state type: expected dict[str, Note], got {type_name}"
+            )
+
+        with self._lock, self._connection:
+            self._text_search.clear()
+            self._connection.execute("DELETE FROM notes")
+            for note_name, note in state.items():
+                self._write(note_name, note)
+        self._notify("import")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _write(self, note_name: str, note: Note) -> None:
+        payload = json.dumps(self._codec.encode(note), ensure_ascii=False)
+
+        updated = self._connection.execute(
+            "UPDATE notes SET payload = ? WHERE name = ?", (payload, note_name)
+        )
+        if not updated.rowcount:
+            self._connection.execute(
+                "INSERT INTO notes (name, payload) VALUES (?, ?)",
+                (note_name, payload),
+            )
+
+        (rowid,) = self._connection.execute(
+            "SELECT rowid FROM notes WHERE name = ?", (note_name,)
+        ).fetchone()
+        self._text_search.write(rowid, self._search_text(note))
+
+        self._connection.execute(
+            "DELETE FROM note_tags WHERE note_name = ?", (note_name,)
+        )
+        self._connection.executemany(
+            "INSERT INTO note_tags (note_name, tag, normalized) VALUES (?, ?, ?)",
+            [(note_name, tag.value, tag.value.lower()) for tag in note.tags],
+        )
+
+    def _remove(self, note_name: str) -> bool:
+        row = self._connection.execute(
+            "SELECT rowid FROM notes WHERE name = ?", (note_name,)
+        ).fetchone()
+        if row is None:
+            return False
+
+        self._text_search.remove(row[0])
+        self._connection.execute("DELETE FROM notes WHERE rowid = ?", row)
+        return True
+
+    def _decode(self, payload: str) -> Note:
+        return self._codec.decode(json.loads(payload))
+
+    def _search_text(self, note: Note) -> str:
+        # Рядки через перенос — токен без пробілів не перетне межу між ними
+        return "\n".join(self._search_strings(note)).lower()
+
+    @staticmethod
+    def _note_strings(note: Note) -> list[str]:
+        strings = [note.name.value, note.title.value, note.content.value]
+        strings.append(str(note.created_at))
+        if note.updated_at is not None:
+            strings.append(str(note.updated_at))
+        strings.extend(str(tag) for tag in note.tags)
+        return strings
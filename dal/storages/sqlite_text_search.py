@@ -0,0 +1,145 @@
+import sqlite3
+from typing import Callable
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5 (
+    search_text, tokenize = 'trigram'
+);
+"""
+
+# Триграмний токенізатор не може використати індекс для коротших токенів
+_MIN_INDEXED_TOKEN = 3
+
+
+class SqliteTextSearch:
+    """Substring search over the ``search_text`` column of one SQLite table.
+
+    Tokens of three characters and more go through an FTS5 trigram table,
+    shorter ones (or all of them without FTS5) through ``LIKE``. The text
+    format is named by ``scheme``; a changed scheme rebuilds the stored texts.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, table: str) -> None:
+        self._connection = connection
+        self._table = table
+        self._fts_table = f"{table}_fts"
+        self._ensure_column()
+        self.has_fts = self._create_fts()
+
+    def refresh(self, scheme: str, search_text: Callable[[str], str]) -> None:
+        """Recomputes every text from its row payload if ``scheme`` changed."""
+        key = f"{self._table}_search_scheme"
+        with self._connection:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[0] == scheme:
+                return
+
+            rows = self._connection.execute(
+                f"SELECT rowid, payload FROM {self._table}"
+            ).fetchall()
+            if self.has_fts:
+                # Стара таблиця могла мати інші колонки — створюємо наново
+                self._connection.execute(f"DROP TABLE {self._fts_table}")
+                self._connection.execute(_FTS_SCHEMA.format(table=self._fts_table))
+            for rowid, payload in rows:
+                self.write(rowid, search_text(payload))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, scheme),
+            )
+
+    def write(self, rowid: int, text: str) -> None:
+        self._connection.execute(
+            f"UPDATE {self._table} SET search_text = ? WHERE rowid = ?", (text, rowid)
+        )
+        if self.has_fts:
+            self.remove(rowid)
+            self._connection.execute(
+                f"INSERT INTO {self._fts_table} (rowid, search_text) VALUES (?, ?)",
+                (rowid, text),
+            )
+
+    def remove(self, rowid: int) -> None:
+        if self.has_fts:
+            self._connection.execute(
+                f"DELETE FROM {self._fts_table} WHERE rowid = ?", (rowid,)
+            )
+
+    def clear(self) -> None:
+        if self.has_fts:
+            self._connection.execute(f"DELETE FROM {self._fts_table}")
+
+    def search(self, tokens: list[str]) -> list[str]:
+        """Returns payloads of rows whose text contains every token."""
+        if not tokens:
+            return []
+
+        def is_indexed(token: str) -> bool:
+            return self.has_fts and len(token) >= _MIN_INDEXED_TOKEN
+
+        long_tokens = [t for t in tokens if is_indexed(t)]
+        like_tokens = [t for t in tokens if not is_indexed(t)]
+
+        conditions: list[str] = []
+        params: list[str] = []
+
+        if long_tokens:
+            conditions.append(f"{self._fts_table} MATCH ?")
+            params.append(" AND ".join(self._quote(t) for t in long_tokens))
+
+        for token in like_tokens:
+            # LIKE у SQLite ігнорує регістр лише для ASCII — текст уже в нижньому
+            conditions.append("t.search_text LIKE ? ESCAPE '\\'")
+            params.append(f"%{self._escape_like(token.lower())}%")
+
+        where = " AND ".join(conditions)
+        if long_tokens:
+            query = (
+                f"SELECT t.payload FROM {self._fts_table} f "
+                f"JOIN {self._table} t ON t.rowid = f.rowid "
+                f"WHERE {where} ORDER BY f.rank"
+            )
+        else:
+            query = (
+                f"SELECT t.payload FROM {self._table} t WHERE {where} ORDER BY t.rowid"
+            )
+
+        return [payload for (payload,) in self._connection.execute(query, params)]
+
+    def _ensure_column(self) -> None:
+        columns = {
+            row[1]
+            for row in self._connection.execute(f"PRAGMA table_info({self._table})")
+        }
+        if "search_text" in columns:
+            return
+
+        # Старі бази без колонки: тексти заповнить refresh
+        with self._connection:
+            self._connection.execute(
+                f"ALTER TABLE {self._table} "
+                "ADD COLUMN search_text TEXT NOT NULL DEFAULT ''"
+            )
+            self._connection.execute(
+                "DELETE FROM meta WHERE key = ?", (f"{self._table}_search_scheme",)
+            )
+
+    def _create_fts(self) -> bool:
+        try:
+            self._connection.executescript(_FTS_SCHEMA.format(table=self._fts_table))
+            # Таблиця могла лишитися від збірки з FTS5 — перевіряємо, що модуль є
+            self._connection.execute(f"SELECT rowid FROM {self._fts_table} LIMIT 0")
+        except sqlite3.OperationalError:
+            # SQLite зібрано без FTS5 — пошук працює через LIKE
+            return False
+        return True
+
+    @staticmethod
+    def _quote(token: str) -> str:
+        return '"' + token.replace('"', '""') + '"'
+
+    @staticmethod
+    def _escape_like(token: str) -> str:
+        return token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
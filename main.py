@@ -1,25 +1,41 @@
+import threading
+
 from colorama import Fore, Style
 from colorama import init as colorama_init
 from prompt_toolkit import PromptSession
 
 from bll.configs.config import get_config
 from bll.helpers.prompt_completer import PromptCompleter
+from bll.helpers.search_helper import SearchHelper
 from bll.registries.file_service_registry import FileServiceRegistry
+from bll.services.autosave_service.autosave_service import AutosaveService
 from bll.services.command_service.command_service import CommandService
 from bll.services.file_service.file_service import FileService
+from bll.services.file_service.retention_policy import RetentionPolicy
+from bll.services.file_service.startup_loader import StartupLoader
 from bll.services.input_service.input_service import InputService
 from bll.services.note_service.note_service import NoteService
 from bll.services.record_service.record_service import RecordService
 from bll.validation_policies.phone_validation_policy import PhoneValidationPolicy
+from dal.codecs.compact_note_codec import CompactNoteCodec
+from dal.codecs.compact_record_codec import CompactRecordCodec
+from dal.codecs.note_codec import NoteCodec
+from dal.codecs.record_codec import RecordCodec
 from dal.entities.note import Note
 from dal.entities.record import Record
 from dal.exceptions.already_exists_error import AlreadyExistsError
 from dal.exceptions.exit_bot_error import ExitBotError
 from dal.exceptions.invalid_error import InvalidError
 from dal.exceptions.not_found_error import NotFoundError
+from dal.file_managers.compression import Compression
+from dal.file_managers.i_file_manager import IFileManager
+from dal.file_managers.json_file_manager.json_file_manager import JsonFileManager
 from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.journals.pickle_journal.pickle_journal import PickleJournal
 from dal.storages.address_book_storage import AddressBookStorage
 from dal.storages.note_storage import NoteStorage
+from dal.storages.sqlite_address_book_storage import SqliteAddressBookStorage
+from dal.storages.sqlite_note_storage import SqliteNoteStorage
 
 
 def main() -> None:
@@ -29,16 +45,95 @@ def main() -> None:
 
     PhoneValidationPolicy.set_region(config.phone_region)
 
-    book_storage = AddressBookStorage()
-    note_storage = NoteStorage()
+    book_storage: AddressBookStorage | SqliteAddressBookStorage
+    note_storage: NoteStorage | SqliteNoteStorage
+    if config.storage == "sqlite":
+        book_storage = SqliteAddressBookStorage(
+            config.contacts_db_path,
+            phone_key=PhoneValidationPolicy.phone_key,
+            phone_key_scheme=f"e164:{PhoneValidationPolicy.get_region()}",
+            search_strings=SearchHelper.collect_strings,
+            search_scheme="search-helper",
+        )
+        note_storage = SqliteNoteStorage(
+            config.notes_db_path,
+            search_strings=SearchHelper.collect_strings,
+            search_scheme="search-helper",
+        )
+    else:
+        book_storage = AddressBookStorage()
+        note_storage = NoteStorage()
+
+    contact_file_manager: IFileManager[dict[str, Record]]
+    note_file_manager: IFileManager[dict[str, Note]]
+    compression = Compression.parse(config.compression)
+    if config.backend == "json":
+        contact_file_manager = JsonFileManager[Record](
+            RecordCodec(), config.contacts_dir, compression
+        )
+        note_file_manager = JsonFileManager[Note](
+            NoteCodec(), config.notes_dir, compression
+        )
+    else:
+        indexed = config.snapshot_format == "indexed"
+        compact = config.snapshot_codec == "compact"
+        record_codec = CompactRecordCodec()
+        note_codec = CompactNoteCodec()
+        contact_file_manager = PickleFileManager[dict[str, Record]](
+            config.contacts_dir,
+            group_commit_window=config.group_commit_window,
+            indexed=indexed,
+            index_meta=AddressBookStorage.birthday_meta,
+            codec=record_codec if compact else None,
+            decoders=[record_codec],
+            compression=compression,
+        )
+        note_file_manager = PickleFileManager[dict[str, Note]](
+            config.notes_dir,
+            group_commit_window=config.group_commit_window,
+            indexed=indexed,
+            codec=note_codec if compact else None,
+            decoders=[note_codec],
+            compression=compression,
+        )
+
+    contact_journal = None
+    note_journal = None
+    if config.persistence_mode == "journal":
+        contact_journal = PickleJournal[str, Record](config.contacts_dir)
+        note_journal = PickleJournal[str, Note](config.notes_dir)
+
+    retention_settings = config.retention_settings
+    retention_policy = (
+        RetentionPolicy.from_settings(retention_settings)
+        if retention_settings is not None
+        else None
+    )
+    delta_chain_limit = (
+        config.delta_chain_length if config.persistence_mode == "delta" else 0
+    )
 
-    contact_file_manager = PickleFileManager[dict[str, Record]](config.contacts_dir)
-    note_file_manager = PickleFileManager[dict[str, Note]](config.notes_dir)
+    # Знімок для автозбереження копіюється між командами — він завжди цілісний
+    command_lock = threading.RLock()
 
     contact_file_service = FileService[dict[str, Record]](
-        contact_file_manager, book_storage
+        contact_file_manager,
+        book_storage,
+        journal=contact_journal,
+        checkpoint_interval=config.checkpoint_interval,
+        retention_policy=retention_policy,
+        delta_chain_limit=delta_chain_limit,
+        state_lock=command_lock,
+    )
+    note_file_service = FileService[dict[str, Note]](
+        note_file_manager,
+        note_storage,
+        journal=note_journal,
+        checkpoint_interval=config.checkpoint_interval,
+        retention_policy=retention_policy,
+        delta_chain_limit=delta_chain_limit,
+        state_lock=command_lock,
     )
-    note_file_service = FileService[dict[str, Note]](note_file_manager, note_storage)
 
     record_service = RecordService(book_storage)
     note_service = NoteService(note_storage)
@@ -47,11 +142,14 @@ def main() -> None:
 
     input_service = InputService()
 
+    startup_loader = StartupLoader(file_service_registry)
+
     command_service = CommandService(
         record_service=record_service,
         file_service_registry=file_service_registry,
         note_service=note_service,
         input_service=input_service,
+        startup_loader=startup_loader,
     )
 
     completer = PromptCompleter(
@@ -60,23 +158,36 @@ def main() -> None:
         note_service=note_service,
     )
 
-    session: PromptSession = PromptSession(completer=completer)
+    autosave_service = None
+    if config.autosave_interval and config.storage != "sqlite":
+        autosave_service = AutosaveService(
+            file_service_registry, command_lock, config.autosave_interval
+        )
+
+    session: PromptSession = PromptSession(
+        completer=completer,
+        bottom_toolbar=autosave_service.describe_status if autosave_service else None,
+    )
 
     print("\n🤖 Welcome to the Assistant Bot!")
     print(f"Type '{Fore.CYAN}help{Style.RESET_ALL}' to see available commands.\n")
 
-    for key, service in file_service_registry.get_all().items():
-        try:
-            latest_file_name = service.get_latest_file_name()
-            if latest_file_name:
-                service.load_by_name(latest_file_name)
-                print(f"📂 {key} loaded last saved state from '{latest_file_name}'")
-            else:
-                print(f"📂 {key} no saved state found — starting empty.")
-        except Exception as e:
-            print(f"⚠️ {key} could not load previous state: {e}")
+    if config.storage == "sqlite":
+        print(f"📂 contacts served from '{config.contacts_db_path}'")
+        print(f"📂 notes served from '{config.notes_db_path}'")
+    else:
+        # Завантаження йдуть у фоні — prompt доступний одразу
+        startup_loader.start()
+        print("📂 Loading saved state in the background…")
+
+    if autosave_service is not None:
+        # Автозбереження не повинно змагатися з початковим завантаженням
+        startup_loader.when_ready(autosave_service.start)
 
     while True:
+        for report in startup_loader.pop_finished_reports():
+            print(report)
+
         try:
             user_input = session.prompt("Enter a command: ")
 
@@ -84,7 +195,8 @@ def main() -> None:
                 continue
 
             command_name, arguments = input_service.handle(user_input)
-            result = command_service.execute(command_name, arguments)
+            with command_lock:
+                result = command_service.execute(command_name, arguments)
             if result is not None:
                 print(result)
 
@@ -97,11 +209,14 @@ def main() -> None:
             print(f"{Fore.RED}{nf}{Style.RESET_ALL}")
         except KeyboardInterrupt:
             try:
-                result = command_service.execute("exit", [])
+                with command_lock:
+                    result = command_service.execute("exit", [])
                 if result:
                     print(result)
             except ExitBotError as eb:
                 print(f"{Fore.RED}{eb}{Style.RESET_ALL}")
+            except InvalidError as ic:
+                print(f"{Fore.RED}{ic}{Style.RESET_ALL}")
             break
         except ExitBotError as eb:
             print(f"{Fore.RED}{eb}{Style.RESET_ALL}")
@@ -110,6 +225,9 @@ def main() -> None:
             print(f"💥 {Fore.RED}Unexpected error: {ex}{Style.RESET_ALL}")
             break
 
+    if autosave_service is not None:
+        autosave_service.stop()
+
 
 if __name__ == "__main__":
     main()
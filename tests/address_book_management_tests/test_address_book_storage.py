@@ -85,3 +85,59 @@ def test_export_and_import_state(storage):
 def test_import_invalid_state_type_raises(storage):
     with pytest.raises(InvalidError):
         storage.import_state(["not", "a", "dict"])
+
+
+def test_version_grows_on_every_mutation(storage):
+    versions = [storage.version]
+
+    storage.add(Record("John", "+380991112233"))
+    versions.append(storage.version)
+    storage.update_item("John", Record("John", "+380987654321"))
+    versions.append(storage.version)
+    storage.delete("John")
+    versions.append(storage.version)
+    storage.import_state({})
+    versions.append(storage.version)
+
+    assert versions == sorted(set(versions))
+
+
+def test_reads_and_missing_delete_keep_version(storage):
+    storage.add(Record("John", "+380991112233"))
+    version = storage.version
+
+    storage.find("John")
+    storage.all_values()
+    storage.delete("Ghost")
+
+    assert storage.version == version
+
+
+def test_birthday_index_follows_mutations(storage):
+    storage.add(Record("John", "+380991112233", birthday="05.11.2000"))
+    storage.add(Record("Jane", "+380987654321", birthday="05.11.1995"))
+    storage.add(Record("Mark", "+380931234567"))
+
+    assert [r.name.value for r in storage.find_by_birthdays([(11, 5)])] == [
+        "John",
+        "Jane",
+    ]
+
+    storage.update_item("John", Record("John", "+380991112233", birthday="06.11.2000"))
+    storage.delete("Jane")
+
+    assert storage.find_by_birthdays([(11, 5)]) == []
+    assert [r.name.value for r in storage.find_by_birthdays([(11, 6)])] == ["John"]
+
+
+def test_birthday_index_returns_results_in_window_order(storage):
+    storage.import_state(
+        {
+            "A": Record("A", "+380991112233", birthday="03.01.2000"),
+            "B": Record("B", "+380987654321", birthday="01.01.2000"),
+        }
+    )
+
+    found = storage.find_by_birthdays([(1, 1), (1, 2), (1, 3), (1, 1)])
+
+    assert [r.name.value for r in found] == ["B", "A"]
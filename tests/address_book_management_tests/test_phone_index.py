@@ -0,0 +1,157 @@
+import pytest
+
+from bll.services.record_service.record_service import RecordService
+from bll.validation_policies.phone_validation_policy import PhoneValidationPolicy
+from dal.entities.record import Record
+from dal.exceptions.already_exists_error import AlreadyExistsError
+from dal.storages.address_book_storage import AddressBookStorage
+from dal.storages.sqlite_address_book_storage import SqliteAddressBookStorage
+
+
+@pytest.fixture
+def storage():
+    return AddressBookStorage()
+
+
+@pytest.fixture
+def service(storage):
+    return RecordService(storage)
+
+
+@pytest.mark.parametrize(
+    "region, value, expected",
+    [
+        ("UA", "0501234567", "+380501234567"),
+        ("UA", "+380501234567", "+380501234567"),
+        ("UA", "380501234567", "+380501234567"),
+        ("UA", "050-123-45-67", "+380501234567"),
+        ("UA", "(050) 123 45 67", "+380501234567"),
+        ("UA", "12345", None),
+        ("US", "(555) 123-4567", "+15551234567"),
+        ("US", "+1 555 123 4567", "+15551234567"),
+        ("US", "123-4567", None),
+        ("INTL", "+44 20 7946 0958", "+442079460958"),
+    ],
+)
+def test_canonicalize(monkeypatch, region, value, expected):
+    monkeypatch.setattr(PhoneValidationPolicy, "_region", region)
+
+    assert PhoneValidationPolicy.canonicalize(value) == expected
+
+
+def test_phone_key_falls_back_to_compact_number():
+    assert PhoneValidationPolicy.phone_key("12-34 5") == "12345"
+
+
+def test_find_by_phone_matches_any_format(service):
+    service.save(Record("John", "0501234567"))
+    service.save(Record("Jane", "+380665554433"))
+
+    for phone in ["0501234567", "+380501234567", "050-123-45-67", "380501234567"]:
+        assert [r.name.value for r in service.find_by_phone(phone)] == ["John"]
+    assert service.find_by_phone("0991112233") == []
+
+
+def test_index_follows_storage_changes(service, storage):
+    service.save(Record("John", "0501234567"))
+    assert service.find_by_phone("0501234567")
+
+    service.update("John", Record("John", "0991112233"))
+    assert service.find_by_phone("0501234567") == []
+    assert service.find_by_phone("+380991112233")[0].name.value == "John"
+
+    service.rename("John", "Johnny")
+    assert service.find_by_phone("0991112233")[0].name.value == "Johnny"
+
+    service.delete("Johnny")
+    assert service.find_by_phone("0991112233") == []
+
+    storage.import_state({"Solo": Record("Solo", "0671112233")})
+    assert service.find_by_phone("+380671112233")[0].name.value == "Solo"
+
+
+def test_duplicate_phone_is_rejected_on_save(service):
+    service.save(Record("John", "0501234567"))
+
+    with pytest.raises(AlreadyExistsError, match="John"):
+        service.save(Record("Jane", "+38 (050) 123-45-67"))
+    assert not service.has("Jane")
+
+
+def test_duplicate_phone_is_rejected_on_update(service):
+    service.save(Record("John", "0501234567"))
+    service.save(Record("Jane", "0991112233"))
+
+    with pytest.raises(AlreadyExistsError):
+        service.update("Jane", Record("Jane", "0991112233", "+380501234567"))
+    with pytest.raises(AlreadyExistsError):
+        service.update("John", Record("John", "0501234567", "050-123-45-67"))
+
+    # Власні номери запису дублями не вважаються
+    service.update("John", Record("John", "+380501234567", "0671112233"))
+    assert service.find_by_phone("0671112233")[0].name.value == "John"
+
+
+def test_region_change_rebuilds_keys(monkeypatch, service):
+    service.save(Record("John", "(555) 123-4567"))
+    assert service.find_by_phone("+1 555 123 4567") == []
+
+    monkeypatch.setattr(PhoneValidationPolicy, "_region", "US")
+    assert service.find_by_phone("+1 555 123 4567")[0].name.value == "John"
+
+
+def test_taken_phone_is_rejected_before_builder_changes_record(service):
+    service.save(Record("A", "+380501234567"))
+    service.save(Record("B", "0991112233"))
+
+    with pytest.raises(AlreadyExistsError, match="'A'"):
+        service.ensure_phone_available("B", "050-123-45-67")
+    with pytest.raises(AlreadyExistsError):
+        service.ensure_phone_available("B", "+380991112233")
+
+    assert [phone.value for phone in service.get_by_name("B").phones] == ["0991112233"]
+    assert [r.name.value for r in service.find_by_phone("0501234567")] == ["A"]
+    service.ensure_phone_available("B", "0671112233")
+
+
+def test_legacy_shared_phone_does_not_block_updates(service, storage):
+    # Спільний номер, збережений до появи перевірки
+    storage.add(Record("Mom", "0441234567"))
+    storage.add(Record("Dad", "0441234567"))
+
+    service.update("Mom", Record("Mom", "0441234567", "0671112233"))
+    renamed = service.rename("Dad", "Father")
+
+    assert renamed.name.value == "Father"
+    assert [r.name.value for r in service.find_by_phone("0441234567")] == [
+        "Mom",
+        "Father",
+    ]
+    with pytest.raises(AlreadyExistsError):
+        service.update("Mom", Record("Mom", "0441234567", "0671112233", "0441234567"))
+
+
+def test_rename_to_existing_name_keeps_record(service):
+    service.save(Record("John", "0501234567"))
+    service.save(Record("Jane", "0991112233"))
+
+    with pytest.raises(AlreadyExistsError):
+        service.rename("John", "Jane")
+
+    assert service.get_by_name("John").phones[0].value == "0501234567"
+    assert service.find_by_phone("0501234567")[0].name.value == "John"
+
+
+def test_sqlite_storage_keeps_its_own_phone_index(tmp_path):
+    storage = SqliteAddressBookStorage(
+        tmp_path / "contacts.db", phone_key=PhoneValidationPolicy.phone_key
+    )
+    service = RecordService(storage)
+    service.save(Record("John", "0501234567"))
+
+    assert service._phone_index is None
+    for phone in ["0501234567", "+380501234567", "050-123-45-67"]:
+        assert [r.name.value for r in service.find_by_phone(phone)] == ["John"]
+    with pytest.raises(AlreadyExistsError, match="John"):
+        service.save(Record("Jane", "+380501234567"))
+    storage.close()
@@ -1,5 +1,6 @@
 import pytest
 
+from bll.helpers.search_helper import SearchHelper
 from bll.services.record_service.record_service import RecordService
 from dal.entities.record import Record
 from dal.exceptions.invalid_error import InvalidError
@@ -51,3 +52,41 @@ def test_search_no_results(service):
 def test_search_empty_query_raises(service):
     with pytest.raises(InvalidError):
         service.search("  ")
+
+
+def test_search_index_follows_updates_renames_and_deletes(service):
+    setup_data(service)
+    assert [r.name.value for r in service.search("doe")] == ["John Doe"]
+
+    updated = service.get_by_name("John Doe").update().add_phone("+380931234567")
+    service.update("John Doe", updated.build())
+    assert [r.name.value for r in service.search("093123")] == ["John Doe"]
+
+    service.rename("John Doe", "Johnny Bravo")
+    assert service.search("doe") == []
+    assert [r.name.value for r in service.search("bravo 1122")] == ["Johnny Bravo"]
+
+    service.delete("Jane Smith")
+    assert service.search("smith") == []
+
+
+def test_search_index_rebuilds_after_import(service):
+    setup_data(service)
+    service.search("john")
+
+    service.storage.import_state({"Bob": Record("Bob Marley", "+380501234567")})
+
+    assert service.search("john") == []
+    assert [r.name.value for r in service.search("marl")] == ["Bob Marley"]
+
+
+def test_search_index_matches_full_scan_and_keeps_order(service):
+    setup_data(service)
+    service.save(Record("Johanna", "+380501112233"))
+
+    for query in ["jo", "11", "j 33", "0", "smith 29"]:
+        tokens = SearchHelper.prepare_tokens(query)
+        expected = service.storage.filter(
+            lambda r: SearchHelper.match_all_tokens(r, tokens)
+        )
+        assert service.search(query) == expected
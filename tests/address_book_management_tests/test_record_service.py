@@ -54,6 +54,40 @@ def test_rename_record(service):
     assert service.has("Johnny")
 
 
+@pytest.mark.parametrize(
+    "new_name, error", [("  ", ValueError), (None, InvalidError), (42, InvalidError)]
+)
+def test_rename_rejects_invalid_name_before_changes(service, new_name, error):
+    service.save(Record("John", "1234567890"))
+
+    with pytest.raises(error):
+        service.rename("John", new_name)
+
+    assert service.get_by_name("John").name.value == "John"
+    assert [record.name.value for record in service.get_all()] == ["John"]
+
+
+def test_rename_keeps_record_intact_when_storage_fails(service, monkeypatch):
+    service.save(Record("John", "1234567890"))
+
+    def fail(record):
+        raise OSError("disk is full")
+
+    monkeypatch.setattr(service.storage, "add", fail)
+    with pytest.raises(OSError):
+        service.rename("John", "Johnny")
+
+    assert service.get_by_name("John").name.value == "John"
+    assert not service.has("Johnny")
+
+
+def test_rename_to_same_name_keeps_record(service):
+    service.save(Record("John", "1234567890"))
+
+    assert service.rename("John", "John").name.value == "John"
+    assert service.has("John")
+
+
 def test_delete_record(service):
     record = Record("Jane", "1112223333")
     service.save(record)
@@ -110,3 +144,31 @@ def test_get_with_upcoming_birthdays_days_param(service):
     upcoming5 = service.get_with_upcoming_birthdays(days=5)
     names5 = [r.name.value for r in upcoming5]
     assert "Near" in names5 and "Far" not in names5
+
+
+def test_upcoming_birthdays_are_sorted_by_next_date(service):
+    today = date.today().replace(year=2000)
+    service.save(Record("Later", "1234567890", birthday=today + timedelta(days=4)))
+    service.save(Record("Sooner", "0987654321", birthday=today + timedelta(days=1)))
+
+    upcoming = service.get_with_upcoming_birthdays(days=7)
+
+    assert [r.name.value for r in upcoming] == ["Sooner", "Later"]
+
+
+def test_upcoming_birthdays_rejects_non_positive_days(service):
+    with pytest.raises(InvalidError):
+        service.get_with_upcoming_birthdays(days=0)
+
+
+def test_birthday_calendar_groups_by_day_and_shifts_leap_birthdays(service):
+    service.save(Record("Leap", "1234567890", birthday="29.02.2000"))
+    service.save(Record("Bob", "0987654321", birthday="28.02.1990"))
+    service.save(Record("Ann", "1112223333", birthday="28.02.1985"))
+    service.save(Record("March", "4445556666", birthday="01.03.1999"))
+
+    assert service.get_birthday_calendar(2, 2025) == {28: ["Ann", "Bob", "Leap"]}
+    assert service.get_birthday_calendar(2, 2024) == {
+        28: ["Ann", "Bob"],
+        29: ["Leap"],
+    }
@@ -0,0 +1,211 @@
+from datetime import date, timedelta
+
+import pytest
+
+from bll.helpers.search_helper import SearchHelper
+from bll.services.file_service.file_service import FileService
+from bll.services.record_service.record_service import RecordService
+from dal.entities.record import Record
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.storages.address_book_storage import AddressBookStorage
+from dal.storages.sqlite_address_book_storage import SqliteAddressBookStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    sqlite_storage = SqliteAddressBookStorage(tmp_path / "contacts.db")
+    yield sqlite_storage
+    sqlite_storage.close()
+
+
+def test_add_and_find_record(storage):
+    rec = Record("John", "+380991112233", emails=["john@example.com"])
+    storage.add(rec)
+
+    found = storage.find("John")
+
+    assert found == rec
+    assert found.emails[0].value == "john@example.com"
+    assert storage.find("Ghost") is None
+
+
+def test_update_keeps_order_and_replaces_phones(storage):
+    storage.add(Record("A", "+380991112233"))
+    storage.add(Record("B", "+380987654321"))
+
+    storage.update_item("A", Record("A", "+380931234567"))
+
+    assert [r.name.value for r in storage.all_values()] == ["A", "B"]
+    assert storage.find_by_phone("+380991112233") == []
+    assert storage.find_by_phone("+380931234567")[0].name.value == "A"
+
+
+def test_delete_and_has(storage):
+    storage.add(Record("Jane", "+380931234567"))
+    assert storage.has("Jane")
+
+    storage.delete("Jane")
+
+    assert not storage.has("Jane")
+    assert storage.find_by_phone("+380931234567") == []
+
+
+def test_find_by_normalized_phone(storage):
+    storage.add(Record("John", "050-123-45-67", emails=["John@Example.com"]))
+
+    assert storage.find_by_phone("0501234567")[0].name.value == "John"
+
+
+def test_filter_records(storage):
+    storage.add(Record("A", "+380991112233"))
+    storage.add(Record("B", "+380987654321"))
+
+    result = storage.filter(lambda r: "9911" in r.phones[0].value)
+
+    assert [r.name.value for r in result] == ["A"]
+
+
+def test_find_by_birthdays(storage):
+    storage.add(Record("May", "+380991112233", birthday="05.05.1990"))
+    storage.add(Record("June", "+380991112234", birthday="06.06.1990"))
+    storage.add(Record("NoBirthday", "+380991112235"))
+
+    result = storage.find_by_birthdays([(5, 5), (7, 7)])
+
+    assert [r.name.value for r in result] == ["May"]
+
+
+def test_export_and_import_state(storage):
+    storage.add(Record("John", "+380991112233"))
+
+    storage.import_state({"Mike": Record("Mike", "+380931234567")})
+
+    assert list(storage.export_state()) == ["Mike"]
+    assert not storage.has("John")
+
+
+def test_import_invalid_state_type_raises(storage):
+    with pytest.raises(InvalidError):
+        storage.import_state(["not", "a", "dict"])
+
+
+def test_data_survives_reopen(tmp_path):
+    first = SqliteAddressBookStorage(tmp_path / "contacts.db")
+    first.add(Record("John", "+380991112233", birthday="01.01.2000"))
+    first.close()
+
+    reopened = SqliteAddressBookStorage(tmp_path / "contacts.db")
+
+    assert reopened.find("John").birthday.value == date(2000, 1, 1)
+    reopened.close()
+
+
+def test_version_grows_on_mutations(storage):
+    version = storage.version
+    storage.add(Record("John", "+380991112233"))
+    storage.delete("John")
+
+    assert storage.version == version + 2
+
+
+def test_record_service_upcoming_birthdays_uses_index(storage):
+    service = RecordService(storage)
+    today = date.today()
+    soon = (today + timedelta(days=2)).replace(year=2000)
+    later = (today + timedelta(days=20)).replace(year=2000)
+    service.save(Record("Soon", "+380991112233", birthday=soon))
+    service.save(Record("Later", "+380991112234", birthday=later))
+
+    result = service.get_with_upcoming_birthdays(7)
+
+    assert [r.name.value for r in result] == ["Soon"]
+
+
+def test_birthday_window_includes_leap_day_in_common_year():
+    window = RecordService._birthday_window(date(2025, 2, 27), 2)
+
+    assert window == [(2, 27), (2, 28), (2, 29), (3, 1)]
+
+
+def test_find_by_birthdays_follows_window_order(storage):
+    storage.add(Record("Third", "+380991112233", birthday="03.01.1990"))
+    storage.add(Record("First", "+380991112234", birthday="01.01.1990"))
+
+    result = storage.find_by_birthdays([(1, 1), (1, 2), (1, 3)])
+
+    assert [r.name.value for r in result] == ["First", "Third"]
+
+
+def test_exit_and_autosave_skip_durable_storage(storage, tmp_path):
+    service = FileService(PickleFileManager(tmp_path / "snapshots"), storage)
+    storage.add(Record("John", "+380991112233"))
+
+    assert not service.is_save_able()
+    # Явне збереження все ще робить резервну копію
+    assert service.save_with_name("backup")
+
+
+def test_phone_keys_are_recomputed_when_scheme_changes(tmp_path):
+    first = SqliteAddressBookStorage(tmp_path / "contacts.db")
+    first.add(Record("John", "050-123-45-67"))
+    first.close()
+
+    reopened = SqliteAddressBookStorage(
+        tmp_path / "contacts.db",
+        phone_key=lambda phone: "key:" + "".join(filter(str.isdigit, phone))[-4:],
+        phone_key_scheme="last4",
+    )
+
+    assert reopened.find_by_phone("+380501234567")[0].name.value == "John"
+    assert reopened.find_by_phone("99-4567")[0].name.value == "John"
+    reopened.close()
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["john", "example.com", "0501", "17.05.1990", "1990-05-17", "kyiv 050", "an"],
+)
+def test_search_matches_in_memory_storage(tmp_path, query):
+    sqlite_storage = SqliteAddressBookStorage(
+        tmp_path / "contacts.db",
+        search_strings=SearchHelper.collect_strings,
+        search_scheme="search-helper",
+    )
+    services = [RecordService(AddressBookStorage()), RecordService(sqlite_storage)]
+    try:
+        for service in services:
+            service.storage.add(
+                Record(
+                    "John",
+                    "0501234567",
+                    emails=["John@Example.com"],
+                    birthday="17.05.1990",
+                    address="Kyiv, Khreshchatyk 1",
+                )
+            )
+            service.storage.add(Record("Jane", "+380931234567"))
+
+        in_memory, sqlite = (
+            sorted(record.name.value for record in service.search(query))
+            for service in services
+        )
+        assert sqlite == in_memory
+    finally:
+        sqlite_storage.close()
+
+
+def test_search_does_not_export_database(storage, monkeypatch):
+    storage.add(Record("John", "+380991112233", address="Kyiv"))
+    storage.add(Record("Jane", "+380931234567"))
+    service = RecordService(storage)
+
+    def fail(*args):
+        raise AssertionError("search must not load every record")
+
+    monkeypatch.setattr(storage, "all_values", fail)
+    monkeypatch.setattr(storage, "export_state", fail)
+    storage.delete("Jane")
+
+    assert [record.name.value for record in service.search("KYIV")] == ["John"]
+    assert service.search("jane") == []
@@ -0,0 +1,191 @@
+import threading
+
+import pytest
+
+from bll.registries.file_service_registry import FileServiceRegistry
+from bll.services.autosave_service.autosave_service import AutosaveService
+from bll.services.file_service.file_service import FileService
+from dal.entities.note import Note
+from dal.entities.record import Record
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.storages.address_book_storage import AddressBookStorage
+from dal.storages.note_storage import NoteStorage
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def book():
+    return AddressBookStorage()
+
+
+@pytest.fixture
+def contact_manager(tmp_path):
+    return PickleFileManager[dict[str, Record]](tmp_path / "contacts")
+
+
+@pytest.fixture
+def registry(tmp_path, book, contact_manager):
+    return FileServiceRegistry(
+        FileService(contact_manager, book),
+        FileService(
+            PickleFileManager[dict[str, Note]](tmp_path / "notes"), NoteStorage()
+        ),
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def autosave(registry, clock):
+    service = AutosaveService(
+        registry, threading.RLock(), debounce=2.0, max_delay=10.0, clock=clock
+    )
+    service.run_once()
+    return service
+
+
+def test_saves_only_after_changes_settle(autosave, book, clock, contact_manager):
+    book.add(Record("John", "+380991112233"))
+    assert autosave.run_once() == []
+
+    clock.now = 1.0
+    book.add(Record("Jane", "+380665554433"))
+    assert autosave.run_once() == []
+
+    clock.now = 3.5
+    assert autosave.run_once() == ["contacts"]
+    assert len(contact_manager.get_all_names()) == 1
+    assert autosave.get_last_saved_at("contacts") is not None
+    assert autosave.get_last_saved_at("notes") is None
+
+
+def test_nothing_saved_without_changes(autosave, clock, contact_manager):
+    clock.now = 100.0
+    assert autosave.run_once() == []
+    assert contact_manager.get_all_names() == []
+
+
+def test_continuous_changes_are_saved_after_max_delay(autosave, book, clock):
+    for second in range(12):
+        clock.now = float(second)
+        book.add(Record(f"Contact{second}", "+380991112233"))
+        saved = autosave.run_once()
+        if saved:
+            break
+
+    assert saved == ["contacts"]
+    assert clock.now == 10.0
+
+
+def test_save_waits_for_command_lock(registry, book, clock, contact_manager):
+    lock = threading.RLock()
+    autosave = AutosaveService(registry, lock, debounce=1.0, clock=clock)
+    autosave.run_once()
+    book.add(Record("John", "+380991112233"))
+    autosave.run_once()
+    clock.now = 5.0
+
+    results: list[list[str]] = []
+    with lock:
+        worker = threading.Thread(target=lambda: results.append(autosave.run_once()))
+        worker.start()
+        worker.join(0.1)
+        assert worker.is_alive()
+        assert contact_manager.get_all_names() == []
+
+    worker.join()
+    assert results == [["contacts"]]
+
+
+def test_file_is_written_without_holding_command_lock(tmp_path, book, clock):
+    lock = threading.RLock()
+    manager = PickleFileManager[dict[str, Record]](tmp_path / "contacts")
+    service = FileService(manager, book, state_lock=lock)
+    notes = FileService(
+        PickleFileManager[dict[str, Note]](tmp_path / "notes"),
+        NoteStorage(),
+        state_lock=lock,
+    )
+    autosave = AutosaveService(
+        FileServiceRegistry(service, notes), lock, debounce=1.0, clock=clock
+    )
+    autosave.run_once()
+    book.add(Record("John", "+380991112233"))
+    autosave.run_once()
+    clock.now = 5.0
+
+    writing = threading.Event()
+    release = threading.Event()
+    save_encoded = manager.save_encoded
+
+    def blocking_save(payload, name):
+        writing.set()
+        release.wait(5)
+        return save_encoded(payload, name)
+
+    manager.save_encoded = blocking_save
+    worker = threading.Thread(target=autosave.run_once)
+    worker.start()
+    assert writing.wait(5)
+    # Команда виконується, поки файл ще пишеться, і змінює запис на місці
+    assert lock.acquire(timeout=1)
+    book.add(Record("Jane", "+380665554433"))
+    book["John"].name.value = "Johnny"
+    book["John"].phones.clear()
+    lock.release()
+    release.set()
+    worker.join()
+
+    saved = manager.load(manager.get_latest_name())
+    assert list(saved) == ["John"]
+    assert saved["John"].name.value == "John"
+    assert [phone.value for phone in saved["John"].phones] == ["+380991112233"]
+    assert service.is_save_able()
+
+
+def test_failed_save_is_reported_and_retried(autosave, book, clock, contact_manager):
+    book.add(Record("John", "+380991112233"))
+    autosave.run_once()
+
+    contact_manager.save_encoded = _raise_os_error
+    clock.now = 3.0
+    assert autosave.run_once() == []
+    assert "failed" in autosave.describe_status()
+
+    del contact_manager.save_encoded
+    clock.now = 4.0
+    assert autosave.run_once() == []
+    clock.now = 5.0
+    assert autosave.run_once() == ["contacts"]
+    assert "failed" not in autosave.describe_status()
+
+
+def test_background_thread_saves_changes(registry, book, contact_manager):
+    autosave = AutosaveService(
+        registry, threading.RLock(), debounce=0.02, poll_interval=0.01
+    )
+    autosave.start()
+    try:
+        book.add(Record("John", "+380991112233"))
+        for _ in range(200):
+            if autosave.get_last_saved_at("contacts") is not None:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        autosave.stop()
+
+    assert len(contact_manager.get_all_names()) == 1
+
+
+def _raise_os_error(*_args, **_kwargs):
+    raise OSError("disk full")
@@ -0,0 +1,139 @@
+from datetime import date, datetime
+
+import pytest
+
+from dal.codecs.compact_frame import decode_frame, encode_frame
+from dal.codecs.compact_note_codec import CompactNoteCodec
+from dal.codecs.compact_record_codec import CompactRecordCodec
+from dal.codecs.string_table import StringTable
+from dal.entities.note import Note
+from dal.entities.record import Record
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+
+
+def make_record(name: str = "John") -> Record:
+    return Record(
+        name,
+        "+380991112233",
+        "+380665554433",
+        emails=[f"{name.lower()}@gmail.com", "work@company.ua"],
+        birthday=date(1990, 5, 17),
+        address="Kyiv, Khreshchatyk 1",
+    )
+
+
+def make_note(name: str = "todo") -> Note:
+    note = Note(name, "Shopping", "Buy milk and bread", tags=[("home", "green")])
+    note.add_tag("urgent")
+    note.updated_at = datetime(2024, 3, 1, 12, 30, 15, 123456)
+    return note
+
+
+def test_record_round_trip():
+    codec = CompactRecordCodec()
+    strings = StringTable()
+    record = make_record()
+
+    decoded = codec.decode(codec.encode(record, strings), strings.strings)
+
+    assert decoded == record
+    assert [email.value for email in decoded.emails] == [
+        "john@gmail.com",
+        "work@company.ua",
+    ]
+    assert decoded.birthday.value == date(1990, 5, 17)
+    assert decoded.address.value == "Kyiv, Khreshchatyk 1"
+
+
+def test_record_without_optional_fields_round_trips():
+    codec = CompactRecordCodec()
+    strings = StringTable()
+    record = Record("Jane", "+380991112233")
+
+    decoded = codec.decode(codec.encode(record, strings), strings.strings)
+
+    assert decoded.emails == []
+    assert decoded.birthday is None
+    assert decoded.address is None
+
+
+def test_note_round_trip_keeps_timestamps_and_tags():
+    codec = CompactNoteCodec()
+    strings = StringTable()
+    note = make_note()
+
+    decoded = codec.decode(codec.encode(note, strings), strings.strings)
+
+    assert decoded == note
+    assert decoded.created_at == note.created_at
+    assert decoded.updated_at == note.updated_at
+    assert [(tag.value, tag.color) for tag in decoded.tags] == [
+        ("home", "green"),
+        ("urgent", None),
+    ]
+
+
+def test_frame_shares_repeated_strings():
+    codec = CompactRecordCodec()
+    items = [(f"C{i}", make_record(f"C{i}")) for i in range(50)]
+
+    frame = encode_frame(codec, items)
+
+    assert frame[0] == ["gmail.com", "company.ua"]
+    assert decode_frame(codec, frame) == items
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_file_manager_uses_codec(tmp_path, indexed):
+    manager = PickleFileManager(tmp_path, indexed=indexed, codec=CompactRecordCodec())
+    book = {f"C{i}": make_record(f"C{i}") for i in range(20)}
+    manager.save(book, "book.pkl")
+
+    assert manager.load("book.pkl") == book
+    plain = PickleFileManager(tmp_path / "plain", indexed=indexed)
+    plain.save(book, "book.pkl")
+    compact_size = (tmp_path / "book.pkl").stat().st_size
+    assert compact_size < (tmp_path / "plain" / "book.pkl").stat().st_size / 2
+
+
+def test_snapshots_without_codec_still_load(tmp_path):
+    PickleFileManager(tmp_path).save({"C1": make_record("C1")}, "old.pkl")
+
+    manager = PickleFileManager(tmp_path, codec=CompactRecordCodec())
+    assert manager.load("old.pkl")["C1"] == make_record("C1")
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_codec_mismatch_is_rejected(tmp_path, indexed):
+    manager = PickleFileManager(tmp_path, indexed=indexed, codec=CompactRecordCodec())
+    manager.save({"C1": make_record("C1")}, "book.pkl")
+
+    other = PickleFileManager(tmp_path, indexed=indexed, codec=CompactNoteCodec())
+    with pytest.raises(InvalidError, match="record/1"):
+        other.load("book.pkl")
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_compact_snapshots_load_with_pickle_setting(tmp_path, indexed):
+    codec = CompactRecordCodec()
+    compact = PickleFileManager(tmp_path, indexed=indexed, codec=codec)
+    compact.save({"C1": make_record("C1")}, "book.pkl")
+    compact.save_delta({"C2": make_record("C2")}, ["C1"], "book.pkl", "delta.pkl")
+
+    # Кодек для запису не задано — читаємо кодеком із заголовка знімка
+    plain = PickleFileManager(tmp_path, indexed=indexed, decoders=[codec])
+    assert plain.load("book.pkl") == {"C1": make_record("C1")}
+    assert plain.load_delta("delta.pkl") == ({"C2": make_record("C2")}, ["C1"])
+    snapshot = plain.open_lazy("book.pkl")
+    if snapshot is not None:
+        assert snapshot["C1"] == make_record("C1")
+        snapshot.close()
+
+
+def test_compact_frames_are_plain_tuples(tmp_path):
+    manager = PickleFileManager(tmp_path, codec=CompactRecordCodec())
+    manager.save({"C1": make_record("C1")}, "book.pkl")
+
+    # Кадри не посилаються на класи сутностей
+    assert b"dal.entities" not in (tmp_path / "book.pkl").read_bytes()
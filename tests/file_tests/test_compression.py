@@ -0,0 +1,153 @@
+from datetime import date
+
+import pytest
+
+from dal.codecs.note_codec import NoteCodec
+from dal.codecs.record_codec import RecordCodec
+from dal.entities.note import Note
+from dal.entities.record import Record
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.compression import MAGIC, Compression
+from dal.file_managers.json_file_manager.json_file_manager import JsonFileManager
+from dal.file_managers.pickle_file_manager import pickle_stream
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+
+METHODS = ["zlib", "bz2", "lzma"]
+
+
+def make_records(count: int = 50) -> dict[str, Record]:
+    return {
+        f"User{i}": Record(
+            f"User{i}",
+            f"+38099{i:07d}",
+            emails=[f"user{i}@gmail.com"],
+            birthday=date(1990, 1 + i % 12, 1 + i % 28),
+        )
+        for i in range(count)
+    }
+
+
+def make_notes(count: int = 50) -> dict[str, Note]:
+    return {
+        f"note{i}": Note(f"note{i}", "Shopping", "Buy milk and bread " * 5)
+        for i in range(count)
+    }
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_pickle_round_trip(tmp_path, method):
+    manager = PickleFileManager(tmp_path, compression=Compression(method))
+    data = make_records()
+
+    name = manager.save(data, "contacts.pkl")
+
+    assert (tmp_path / name).read_bytes()[: len(MAGIC)] == MAGIC
+    assert manager.load(name) == data
+    assert [dict(batch) for batch in manager.load_batches(name)] == [data]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_json_round_trip(tmp_path, method):
+    manager = JsonFileManager[Note](NoteCodec(), tmp_path, Compression(method))
+    data = make_notes()
+
+    name = manager.save(data, "notes.json")
+
+    assert (tmp_path / name).read_bytes()[: len(MAGIC)] == MAGIC
+    assert manager.load(name) == data
+
+
+def test_compression_shrinks_repetitive_snapshot(tmp_path):
+    plain = PickleFileManager(tmp_path / "plain")
+    packed = PickleFileManager(tmp_path / "packed", compression=Compression("zlib"))
+    data = make_notes(200)
+
+    plain_name = plain.save(data, "notes.pkl")
+    packed_name = packed.save(data, "notes.pkl")
+
+    plain_size = (tmp_path / "plain" / plain_name).stat().st_size
+    packed_size = (tmp_path / "packed" / packed_name).stat().st_size
+    assert packed_size < plain_size / 2
+
+
+def test_load_auto_detects_compression(tmp_path):
+    data = make_records()
+    plain_name = PickleFileManager(tmp_path).save(data, "plain.pkl")
+    packed_name = PickleFileManager(tmp_path, compression=Compression("lzma")).save(
+        data, "packed.pkl"
+    )
+
+    # Налаштування впливає лише на запис — читаються обидва варіанти
+    assert PickleFileManager(tmp_path).load(packed_name) == data
+    assert (
+        PickleFileManager(tmp_path, compression=Compression("bz2")).load(plain_name)
+        == data
+    )
+
+
+def test_json_load_auto_detects_compression(tmp_path):
+    data = make_records()
+    packed = JsonFileManager[Record](RecordCodec(), tmp_path, Compression("zlib"))
+    plain = JsonFileManager[Record](RecordCodec(), tmp_path)
+
+    assert plain.load(packed.save(data, "packed.json")) == data
+    assert packed.load(plain.save(data, "plain.json")) == data
+
+
+def test_indexed_falls_back_to_stream_when_compressed(tmp_path):
+    manager = PickleFileManager(tmp_path, indexed=True, compression=Compression("zlib"))
+    data = make_records()
+
+    name = manager.save(data, "contacts.pkl")
+
+    assert manager.open_lazy(name) is None
+    with PickleFileManager(tmp_path)._open(tmp_path / name) as file:
+        assert pickle_stream.is_stream(file)
+    assert manager.load(name) == data
+
+
+def test_group_commit_writes_compressed(tmp_path):
+    manager = PickleFileManager(
+        tmp_path, group_commit_window=60, compression=Compression("bz2")
+    )
+    data = make_records(5)
+
+    name = manager.save(data, "contacts.pkl")
+    manager.flush()
+
+    assert (tmp_path / name).read_bytes()[: len(MAGIC)] == MAGIC
+    assert manager.load(name) == data
+
+
+def test_benchmark_reports_baseline_and_candidates(tmp_path):
+    manager = PickleFileManager(tmp_path)
+    candidates = [Compression("zlib", 1), Compression("lzma", 0)]
+
+    reports = manager.benchmark_compression(make_notes(100), candidates)
+
+    assert [report.label for report in reports] == ["none", "zlib:1", "lzma:0"]
+    assert all(report.size < reports[0].size for report in reports[1:])
+    assert all(report.save_seconds >= 0 for report in reports)
+    assert all(report.load_seconds >= 0 for report in reports)
+    assert manager.get_all_names() == []
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("", None),
+        ("none", None),
+        ("zlib", "zlib:6"),
+        ("BZ2:3", "bz2:3"),
+        ("lzma:0", "lzma:0"),
+    ],
+)
+def test_parse(spec, expected):
+    compression = Compression.parse(spec)
+    assert (str(compression) if compression else None) == expected
+
+
+@pytest.mark.parametrize("spec", ["gzip", "zlib:x", "zlib:12", "bz2:0"])
+def test_parse_rejects_invalid_spec(spec):
+    with pytest.raises(InvalidError):
+        Compression.parse(spec)
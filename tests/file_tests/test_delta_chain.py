@@ -0,0 +1,39 @@
+from bll.services.file_service.delta_chain import DeltaChain
+from dal.codecs.record_codec import RecordCodec
+from dal.entities.record import Record
+from dal.file_managers.json_file_manager.json_file_manager import JsonFileManager
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+
+
+def make_record(index: int) -> Record:
+    return Record(f"User{index}", f"+38099{index:07d}")
+
+
+def test_chain_is_disabled_without_delta_manager(tmp_path):
+    chain = DeltaChain(JsonFileManager(RecordCodec(), tmp_path), limit=3)
+    chain.loaded("book.jsonl", [])
+
+    assert not chain.enabled
+    assert not chain.can_extend(1, 10)
+    assert chain.chain_of("book.jsonl") == []
+
+
+def test_saved_reports_when_rebase_is_due(tmp_path):
+    manager = PickleFileManager[dict[str, Record]](tmp_path)
+    chain = DeltaChain(manager, limit=2)
+    base = manager.save({"User0": make_record(0)}, "base.pkl")
+    chain.saved(base, is_delta=False)
+
+    names = [base]
+    for index in range(1, 3):
+        assert chain.can_extend(1, 10)
+        names.append(chain.save({f"User{index}": make_record(index)}, f"d{index}.pkl"))
+        due = chain.saved(names[-1], is_delta=True)
+
+    assert due
+    assert chain.chain_of(names[-1]) == names
+    assert set(chain.reconstruct(names)) == {"User0", "User1", "User2"}
+
+    chain.rebase(names[-1])
+    assert chain.chain_of(names[-1]) == []
+    assert not chain.saved("next.pkl", is_delta=True)
@@ -0,0 +1,184 @@
+import pytest
+
+from bll.services.file_service.file_service import FileService
+from bll.services.file_service.retention_policy import RetentionPolicy
+from dal.entities.record import Record
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.storages.address_book_storage import AddressBookStorage
+
+
+def make_record(index: int) -> Record:
+    return Record(f"User{index}", f"+38099{index:07d}")
+
+
+@pytest.fixture
+def storage():
+    book = AddressBookStorage()
+    for index in range(10):
+        book.add(make_record(index))
+    return book
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PickleFileManager[dict[str, Record]](tmp_path)
+
+
+@pytest.fixture
+def service(manager, storage):
+    return FileService(manager, storage, delta_chain_limit=3)
+
+
+def test_first_save_is_full_and_next_is_delta(service, storage, manager):
+    base = service.save_with_name("base")
+    assert manager.get_delta_parent(base) is None
+
+    storage.add(make_record(100))
+    storage.delete("User0")
+    delta = service.save_with_name("next")
+
+    assert manager.get_delta_parent(delta) == base
+    changed, deleted = manager.load_delta(delta)
+    assert list(changed) == ["User100"]
+    assert deleted == ["User0"]
+
+
+def test_delta_is_smaller_than_full_snapshot(service, storage, manager, tmp_path):
+    base = service.save_with_name("base")
+    storage.add(make_record(100))
+    delta = service.save_with_name("next")
+
+    assert (tmp_path / delta).stat().st_size < (tmp_path / base).stat().st_size
+
+
+def test_load_reconstructs_state_from_chain(service, storage, manager):
+    service.save_with_name("s0")
+    storage.add(make_record(100))
+    service.save_with_name("s1")
+    storage.delete("User1")
+    storage.update_item("User2", Record("User2", "+380661112233"))
+    last = service.save_with_name("s2")
+    expected = dict(storage.export_state())
+
+    restored = AddressBookStorage()
+    FileService(manager, restored).load_by_name(last)
+
+    assert restored.export_state() == expected
+    with pytest.raises(InvalidError):
+        manager.load(last)
+
+
+def test_saves_after_loading_a_delta_chain_to_it(service, storage, manager):
+    service.save_with_name("s0")
+    storage.add(make_record(100))
+    middle = service.save_with_name("s1")
+
+    other = AddressBookStorage()
+    other_service = FileService(manager, other, delta_chain_limit=3)
+    other_service.load_by_name(middle)
+    other.delete("User100")
+    last = other_service.save_with_name("s2")
+
+    assert manager.get_delta_parent(last) == middle
+    assert "User100" not in manager.load_delta(last)[0]
+
+
+def test_long_chain_is_rebased_in_background(service, storage, manager):
+    service.save_with_name("s0")
+    names = []
+    for index in range(3):
+        storage.add(make_record(100 + index))
+        names.append(service.save_with_name(f"s{index + 1}"))
+    service.wait_for_retention()
+
+    assert manager.get_delta_parent(names[-1]) is None
+    assert set(manager.load(names[-1])) == set(storage.export_state())
+
+    storage.add(make_record(200))
+    assert manager.get_delta_parent(service.save_with_name("s4")) == names[-1]
+
+
+def test_large_change_writes_full_snapshot(service, storage, manager):
+    service.save_with_name("s0")
+    for index in range(10):
+        storage.delete(f"User{index}")
+    storage.add(make_record(100))
+
+    assert manager.get_delta_parent(service.save_with_name("s1")) is None
+
+
+def test_import_from_elsewhere_forces_full_snapshot(service, storage, manager):
+    service.save_with_name("s0")
+    storage.import_state({"Solo": Record("Solo", "+380991112233")})
+
+    assert manager.get_delta_parent(service.save_with_name("s1")) is None
+
+
+def test_deleting_base_rebases_dependent_deltas(service, storage, manager):
+    base = service.save_with_name("s0")
+    storage.add(make_record(100))
+    delta = service.save_with_name("s1")
+    expected = set(storage.export_state())
+
+    service.delete_by_name(base)
+
+    assert manager.get_delta_parent(delta) is None
+    assert set(manager.load(delta)) == expected
+
+
+def test_missing_base_is_reported(service, storage, manager):
+    base = service.save_with_name("s0")
+    storage.add(make_record(100))
+    delta = service.save_with_name("s1")
+    manager.delete(base)
+
+    with pytest.raises(InvalidError, match="missing"):
+        FileService(manager, AddressBookStorage()).load_by_name(delta)
+
+
+def test_retention_keeps_ancestors_of_kept_deltas(manager, storage):
+    policy = RetentionPolicy(keep_last=1, keep_hourly=0, keep_daily=0, keep_weekly=0)
+    service = FileService(
+        manager, storage, retention_policy=policy, delta_chain_limit=10
+    )
+    names = [service.save_with_name()]
+    for index in range(2):
+        storage.add(make_record(100 + index))
+        names.append(service.save_with_name())
+    service.wait_for_retention()
+
+    assert set(names) <= set(manager.get_all_names())
+    restored = AddressBookStorage()
+    FileService(manager, restored).load_by_name(names[-1])
+    assert set(restored.export_state()) == set(storage.export_state())
+
+
+def test_retention_takes_delta_parents_from_manifest(manager, storage, monkeypatch):
+    policy = RetentionPolicy(keep_last=1, keep_hourly=0, keep_daily=0, keep_weekly=0)
+    service = FileService(
+        manager, storage, retention_policy=policy, delta_chain_limit=10
+    )
+    service.save_with_name()
+    storage.add(make_record(100))
+    delta = service.save_with_name()
+    service.wait_for_retention()
+
+    def fail_read(_filepath):
+        raise AssertionError("snapshot headers must not be read")
+
+    monkeypatch.setattr(manager, "_open_for_read", fail_read)
+    service.compact()
+    service.delete_by_name(delta)
+
+
+def test_parent_of_foreign_delta_is_read_once(manager, storage, tmp_path):
+    service = FileService(manager, storage, delta_chain_limit=10)
+    base = service.save_with_name("s0")
+    storage.add(make_record(100))
+    delta = service.save_with_name("s1")
+    (tmp_path / "copy.pkl").write_bytes((tmp_path / delta).read_bytes())
+
+    reopened = PickleFileManager[dict[str, Record]](tmp_path)
+    assert reopened.get_delta_parents() == {delta: base, "copy.pkl": base}
+    assert reopened.manifest.get("copy.pkl").parent_known
@@ -0,0 +1,66 @@
+import pytest
+
+from bll.services.file_service.file_service import FileService
+from dal.entities.record import Record
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.storages.address_book_storage import AddressBookStorage
+
+
+@pytest.fixture
+def storage():
+    return AddressBookStorage()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PickleFileManager[dict[str, Record]](tmp_path)
+
+
+@pytest.fixture
+def service(manager, storage):
+    return FileService(manager, storage)
+
+
+def test_empty_storage_is_not_save_able(service):
+    assert not service.is_save_able()
+
+
+def test_mutation_makes_storage_save_able(service, storage):
+    storage.add(Record("John", "+380991112233"))
+    assert service.is_save_able()
+
+    service.save_with_name("backup")
+    assert not service.is_save_able()
+
+    storage.delete("John")
+    storage.add(Record("Jane", "+380665554433"))
+    assert service.is_save_able()
+
+
+def test_save_without_changes_returns_previous_name(service, storage, manager):
+    storage.add(Record("John", "+380991112233"))
+    first = service.save_with_name("backup")
+
+    assert service.save_with_name("other") == first
+    assert manager.get_all_names() == [first]
+
+
+def test_loaded_state_is_not_save_able(service, storage, tmp_path):
+    storage.add(Record("John", "+380991112233"))
+    name = service.save_with_name("backup")
+
+    fresh_storage = AddressBookStorage()
+    fresh_service = FileService(PickleFileManager(tmp_path), fresh_storage)
+    fresh_service.load_by_name(name)
+
+    assert not fresh_service.is_save_able()
+    assert not hasattr(fresh_service, "_last_loaded_bytes")
+
+
+def test_deleting_current_file_makes_state_save_able(service, storage):
+    storage.add(Record("John", "+380991112233"))
+    name = service.save_with_name("backup")
+
+    service.delete_by_name(name)
+
+    assert service.is_save_able()
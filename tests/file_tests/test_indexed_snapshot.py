@@ -0,0 +1,131 @@
+from datetime import date
+
+import pytest
+
+from bll.services.file_service.file_service import FileService
+from dal.entities.record import Record
+from dal.file_managers.pickle_file_manager.indexed_snapshot import IndexedSnapshot
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.storages.address_book_storage import AddressBookStorage
+from dal.storages.lazy_dict import LazyDict
+
+
+def make_book() -> dict[str, Record]:
+    return {
+        "John": Record("John", "+380991112233", birthday=date(1990, 5, 17)),
+        "Jane": Record("Jane", "+380665554433"),
+        "Олена": Record("Олена", "+380501112233", birthday=date(1985, 12, 1)),
+    }
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PickleFileManager[dict[str, Record]](
+        tmp_path, indexed=True, index_meta=AddressBookStorage.birthday_meta
+    )
+
+
+@pytest.fixture
+def storage():
+    return AddressBookStorage()
+
+
+@pytest.fixture
+def service(manager, storage):
+    manager.save(make_book(), "book.pkl")
+    service = FileService(manager, storage)
+    service.load_by_name("book.pkl")
+    return service
+
+
+def test_open_lazy_reads_index_only(manager):
+    manager.save(make_book(), "book.pkl")
+    snapshot = manager.open_lazy("book.pkl")
+
+    assert isinstance(snapshot, IndexedSnapshot)
+    assert list(snapshot) == ["John", "Jane", "Олена"]
+    assert dict(snapshot.iter_meta()) == {"John": 517, "Jane": 0, "Олена": 1201}
+    assert snapshot["Олена"].phones[0].value == "+380501112233"
+    snapshot.close()
+
+
+def test_indexed_snapshot_loads_fully_and_in_batches(manager):
+    manager.save(make_book(), "book.pkl")
+
+    assert list(manager.load("book.pkl")) == ["John", "Jane", "Олена"]
+    assert [len(batch) for batch in manager.load_batches("book.pkl")] == [3]
+
+
+def test_other_formats_are_not_opened_lazily(tmp_path):
+    manager = PickleFileManager(tmp_path)
+    manager.save({"a": 1}, "plain.pkl")
+
+    assert manager.open_lazy("plain.pkl") is None
+
+
+def test_load_materializes_records_on_first_access(service, storage):
+    assert isinstance(storage.data, LazyDict)
+    assert storage.data.materialized_count == 0
+    assert storage.has("Jane")
+
+    first = storage.find("John")
+    assert first is storage.find("John")
+    assert storage.data.materialized_count == 1
+
+
+def test_birthdays_come_from_index_without_unpickling(service, storage):
+    found = storage.find_by_birthdays([(5, 17), (12, 1)])
+
+    assert [record.name.value for record in found] == ["John", "Олена"]
+    assert storage.data.materialized_count == 2
+
+
+def test_changes_on_lazy_storage(service, storage):
+    storage.delete("Jane")
+    storage.add(Record("Mark", "+380671112233"))
+
+    assert not storage.has("Jane")
+    assert storage.find("Jane") is None
+    assert list(storage.data) == ["John", "Олена", "Mark"]
+    assert len(storage.data) == 3
+
+
+def test_save_copies_untouched_records_from_snapshot(service, storage, manager):
+    storage.update_item("John", Record("John", "+380931234567"))
+    saved_name = service.save_with_name("edited")
+
+    # Незмінені записи не розпаковувались під час збереження
+    assert storage.data.materialized_count == 1
+
+    reloaded = manager.load(saved_name)
+    assert reloaded["John"].phones[0].value == "+380931234567"
+    assert reloaded["Олена"].birthday.value == date(1985, 12, 1)
+    assert dict(manager.open_lazy(saved_name).iter_meta())["Олена"] == 1201
+
+
+def test_reload_closes_previous_snapshot(service, storage):
+    previous = storage.data.snapshot
+
+    service.load_by_name("book.pkl")
+
+    assert storage.data.snapshot is not previous
+    with pytest.raises(ValueError):
+        previous["John"]
+    assert storage.find("John").name.value == "John"
+
+
+def test_deleting_loaded_snapshot_releases_mapping(service, storage, manager):
+    snapshot = storage.data.snapshot
+    storage.delete("Jane")
+
+    service.delete_by_name("book.pkl")
+
+    # Відображення закрите до видалення файлу — на Windows інакше помилка
+    with pytest.raises(ValueError):
+        snapshot["John"]
+    assert not manager.has_file_with_name("book.pkl")
+    assert isinstance(storage.data, dict)
+    assert list(storage.data) == ["John", "Олена"]
+    assert [record.name.value for record in storage.find_by_birthdays([(5, 17)])] == [
+        "John"
+    ]
@@ -0,0 +1,117 @@
+import pytest
+
+from bll.services.file_service.file_service import FileService
+from dal.entities.record import Record
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.journals.pickle_journal.pickle_journal import PickleJournal
+from dal.storages.address_book_storage import AddressBookStorage
+
+
+@pytest.fixture
+def storage():
+    return AddressBookStorage()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PickleFileManager[dict[str, Record]](tmp_path)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return PickleJournal[str, Record](tmp_path)
+
+
+@pytest.fixture
+def service(manager, storage, journal):
+    return FileService(manager, storage, journal=journal, checkpoint_interval=3)
+
+
+def test_first_save_writes_checkpoint(service, storage, manager, journal):
+    storage.add(Record("John", "+380991112233"))
+
+    name = service.save_with_name()
+
+    assert manager.has_file_with_name(name)
+    assert journal.get_base_name() == name
+    assert journal.count() == 0
+
+
+def test_next_saves_append_to_journal(service, storage, manager, journal):
+    storage.add(Record("John", "+380991112233"))
+    base = service.save_with_name()
+
+    storage.add(Record("Jane", "+380665554433"))
+    storage.delete("John")
+
+    assert service.is_save_able()
+    assert service.save_with_name() == base
+    assert manager.get_all_names() == [base]
+    assert journal.read()[0][0] == "Jane"
+    assert journal.read()[1] == ("John", None)
+    assert not service.is_save_able()
+
+
+def test_save_without_changes_writes_nothing(service, storage, journal):
+    storage.add(Record("John", "+380991112233"))
+    service.save_with_name()
+
+    service.save_with_name()
+
+    assert journal.count() == 0
+
+
+def test_checkpoint_after_interval(service, storage, manager, journal):
+    storage.add(Record("A", "+380991112233"))
+    service.save_with_name()
+
+    for name in ("B", "C", "D", "E"):
+        storage.add(Record(name, "+380991112233"))
+
+    new_base = service.save_with_name()
+
+    assert journal.get_base_name() == new_base
+    assert journal.count() == 0
+    assert len(manager.get_all_names()) == 2
+
+
+def test_load_replays_journal(tmp_path, service, storage):
+    storage.add(Record("John", "+380991112233"))
+    base = service.save_with_name()
+    storage.add(Record("Jane", "+380665554433"))
+    storage.delete("John")
+    service.save_with_name()
+
+    fresh_storage = AddressBookStorage()
+    fresh_service = FileService(
+        PickleFileManager(tmp_path), fresh_storage, journal=PickleJournal(tmp_path)
+    )
+    fresh_service.load_by_name(base)
+
+    assert fresh_storage.has("Jane")
+    assert not fresh_storage.has("John")
+
+
+def test_loading_other_snapshot_forces_checkpoint(service, storage, manager, journal):
+    storage.add(Record("John", "+380991112233"))
+    first = service.save_with_name("first")
+    storage.add(Record("Jane", "+380665554433"))
+    second = service.save_with_name("second")
+
+    service.load_by_name(first)
+    storage.add(Record("Mike", "+380931234567"))
+    saved = service.save_with_name()
+
+    assert saved not in (first, second)
+    assert journal.get_base_name() == saved
+    assert len(manager.get_all_names()) == 3
+
+
+def test_named_save_without_changes_keeps_journal(service, storage, journal):
+    storage.add(Record("John", "+380991112233"))
+    base = service.save_with_name()
+    storage.add(Record("Jane", "+380665554433"))
+    service.save_with_name()
+
+    assert service.save_with_name("manual") == base
+    assert journal.count() == 1
@@ -0,0 +1,28 @@
+from bll.services.file_service.journal_writer import JournalWriter
+from dal.entities.record import Record
+from dal.journals.pickle_journal.pickle_journal import PickleJournal
+
+
+def test_append_stops_at_checkpoint_interval(tmp_path):
+    writer = JournalWriter(PickleJournal[str, Record](tmp_path), checkpoint_interval=2)
+    assert not writer.accepts("autosave")
+
+    writer.checkpoint("base.pkl")
+    assert writer.accepts("autosave")
+    assert not writer.accepts("manual")
+    assert writer.append({"John": Record("John", "+380991112233")})
+    assert not writer.append({"Jane": None, "Bob": None})
+
+    data = {"Jane": Record("Jane", "+380665554433")}
+    writer.replay(data)
+    assert list(data) == ["Jane", "John"]
+
+
+def test_forgetting_base_requires_new_checkpoint(tmp_path):
+    writer = JournalWriter(PickleJournal[str, Record](tmp_path))
+    writer.checkpoint("base.pkl")
+
+    assert not writer.forget("other.pkl")
+    assert writer.forget("base.pkl")
+    assert writer.get_base_name() is None
+    assert not writer.accepts("autosave")
@@ -0,0 +1,93 @@
+from datetime import date
+
+import pytest
+
+from bll.services.file_service.file_service import FileService
+from dal.codecs.note_codec import NoteCodec
+from dal.codecs.record_codec import RecordCodec
+from dal.entities.note import Note
+from dal.entities.record import Record
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.json_file_manager.json_file_manager import JsonFileManager
+from dal.storages.address_book_storage import AddressBookStorage
+
+
+@pytest.fixture
+def record_manager(tmp_path):
+    return JsonFileManager[Record](RecordCodec(), tmp_path)
+
+
+@pytest.fixture
+def note_manager(tmp_path):
+    return JsonFileManager[Note](NoteCodec(), tmp_path)
+
+
+def test_save_and_load_records(record_manager):
+    record = Record(
+        "Alice",
+        "+380991112233",
+        emails=["alice@example.com"],
+        birthday="01.01.2000",
+        address="Kyiv, Khreshchatyk 1",
+    )
+
+    name = record_manager.save({"Alice": record}, "contacts")
+    loaded = record_manager.load(name)
+
+    restored = loaded["Alice"]
+    assert name == "contacts.jsonl"
+    assert restored == record
+    assert restored.emails[0].value == "alice@example.com"
+    assert restored.birthday.value == date(2000, 1, 1)
+    assert restored.address.value == "Kyiv, Khreshchatyk 1"
+
+
+def test_save_and_load_notes(note_manager):
+    note = Note("n1", "Title", "Content long enough", tags=[("work", "#009688")])
+
+    loaded = note_manager.load(note_manager.save({"n1": note}, "notes"))
+
+    restored = loaded["n1"]
+    assert restored == note
+    assert restored.created_at == note.created_at
+    assert restored.tags[0].color == "#009688"
+
+
+def test_file_is_json_lines_per_record(record_manager, tmp_path):
+    book = {name: Record(name, "+380991112233") for name in ("A", "B", "C")}
+
+    name = record_manager.save(book, "contacts")
+    lines = (tmp_path / name).read_text(encoding="utf-8").splitlines()
+
+    assert len(lines) == 4  # header + 3 records
+
+
+def test_get_all_names_only_returns_jsonl(record_manager, tmp_path):
+    (tmp_path / "old.pkl").write_bytes(b"")
+    record_manager.save({"A": Record("A", "+380991112233")}, "contacts")
+
+    assert record_manager.get_all_names() == ["contacts.jsonl"]
+
+
+def test_load_rejects_foreign_file(record_manager, tmp_path):
+    (tmp_path / "broken.jsonl").write_text("not json\n", encoding="utf-8")
+
+    with pytest.raises(InvalidError):
+        record_manager.load("broken.jsonl")
+
+
+def test_load_missing_file_raises(record_manager):
+    with pytest.raises(FileNotFoundError):
+        record_manager.load("missing.jsonl")
+
+
+def test_file_service_uses_manager_extension(record_manager):
+    storage = AddressBookStorage()
+    storage.add(Record("Alice", "+380991112233"))
+    service = FileService(record_manager, storage)
+
+    name = service.save_with_name("backup")
+
+    assert name.startswith("backup_")
+    assert name.endswith(".jsonl")
+    assert service.get_latest_file_name() == name
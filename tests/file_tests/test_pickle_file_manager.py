@@ -1,6 +1,11 @@
+import pickle
+
 import pytest
 
+from dal.entities.record import Record
 from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.file_managers.pickle_file_manager.pickle_stream import MAGIC
+from dal.storages.address_book_storage import AddressBookStorage
 
 
 @pytest.fixture
@@ -76,3 +81,172 @@ def test_has_file_with_name(manager):
 
     assert manager.has_file_with_name("arr.pkl")
     assert not manager.has_file_with_name("missing.pkl")
+
+
+def test_failed_save_leaves_no_partial_file(manager):
+    with pytest.raises(Exception):
+        manager.save({"bad": lambda x: x}, "broken.pkl")
+
+    assert not manager.has_file_with_name("broken.pkl")
+
+
+def test_save_is_atomic_and_leaves_no_temp_files(manager, temp_dir):
+    manager.save({"x": 1}, "atomic.pkl")
+
+    assert sorted(p.name for p in temp_dir.iterdir() if p.suffix == ".tmp") == []
+    assert manager.load("atomic.pkl") == {"x": 1}
+
+
+def test_stale_temp_files_are_removed_on_start(temp_dir):
+    (temp_dir / ".crashed.pkl.tmp").write_bytes(b"partial")
+
+    restarted = PickleFileManager(base_dir=temp_dir)
+
+    assert not (temp_dir / ".crashed.pkl.tmp").exists()
+    assert restarted.get_all_names() == []
+
+
+def test_group_commit_coalesces_saves_of_same_snapshot(temp_dir, monkeypatch):
+    grouped = PickleFileManager(base_dir=temp_dir, group_commit_window=60)
+    dir_syncs = []
+    monkeypatch.setattr(grouped, "_sync_dir", lambda: dir_syncs.append(1))
+
+    first = grouped.save({"v": 1}, "bulk.pkl")
+    second = grouped.save({"v": 2}, "bulk.pkl")
+    other = grouped.save({"v": 3}, "other.pkl")
+
+    assert first == second == "bulk.pkl"
+    assert not (temp_dir / "bulk.pkl").exists()
+
+    grouped.flush()
+
+    assert grouped.load("bulk.pkl") == {"v": 2}
+    assert grouped.load(other) == {"v": 3}
+    assert dir_syncs == [1]
+
+
+def test_group_commit_snapshots_data_at_save_time(temp_dir):
+    grouped = PickleFileManager(base_dir=temp_dir, group_commit_window=60)
+    data = {"v": 1}
+
+    name = grouped.save(data, "state.pkl")
+    data["v"] = 2
+
+    assert grouped.has_file_with_name(name)
+    assert grouped.load(name) == {"v": 1}
+
+
+def test_group_commit_flushes_after_window(temp_dir):
+    grouped = PickleFileManager(base_dir=temp_dir, group_commit_window=0.05)
+
+    grouped.save({"v": 1}, "timed.pkl")
+    timer = grouped._commit_timer
+    assert not (temp_dir / "timed.pkl").exists()
+    timer.join()
+
+    assert (temp_dir / "timed.pkl").exists()
+
+
+def test_dict_snapshot_is_written_in_batches(temp_dir):
+    manager = PickleFileManager(base_dir=temp_dir, batch_size=2)
+    data = {f"key{i}": i for i in range(5)}
+    manager.save(data, "stream.pkl")
+
+    assert (temp_dir / "stream.pkl").read_bytes().startswith(MAGIC)
+    assert [len(batch) for batch in manager.load_batches("stream.pkl")] == [2, 2, 1]
+    assert manager.load("stream.pkl") == data
+
+
+def test_legacy_single_pickle_snapshot_still_loads(manager, temp_dir):
+    data = {"John": 1, "Jane": 2}
+    (temp_dir / "legacy.pkl").write_bytes(pickle.dumps(data))
+
+    assert manager.load("legacy.pkl") == data
+    assert list(manager.load_batches("legacy.pkl")) == [list(data.items())]
+
+
+def test_non_dict_data_keeps_single_pickle_format(manager, temp_dir):
+    manager.save(["a", "b"], "list.pkl")
+
+    assert not (temp_dir / "list.pkl").read_bytes().startswith(MAGIC)
+    assert manager.load("list.pkl") == ["a", "b"]
+
+
+def test_group_commit_writes_stream_format(temp_dir):
+    manager = PickleFileManager(base_dir=temp_dir, group_commit_window=60, batch_size=1)
+    manager.save({"a": 1, "b": 2}, "group.pkl")
+    manager.flush()
+
+    assert (temp_dir / "group.pkl").read_bytes().startswith(MAGIC)
+    assert manager.load("group.pkl") == {"a": 1, "b": 2}
+
+
+def test_storage_sees_records_while_batches_stream(temp_dir):
+    manager = PickleFileManager(base_dir=temp_dir, batch_size=1)
+    manager.save(
+        {
+            "John": Record("John", "+380991112233"),
+            "Jane": Record("Jane", "+380665554433"),
+        },
+        "book.pkl",
+    )
+    storage = AddressBookStorage()
+    seen: list[int] = []
+
+    def observed_batches():
+        for batch in manager.load_batches("book.pkl"):
+            yield batch
+            seen.append(len(storage.all_values()))
+
+    storage.import_batches(observed_batches())
+
+    assert seen == [1, 2]
+    assert storage.has("John") and storage.has("Jane")
+
+
+def test_streamed_import_notifies_once_per_load(temp_dir):
+    manager = PickleFileManager(base_dir=temp_dir, batch_size=1)
+    manager.save({f"C{i}": Record(f"C{i}", "+380991112233") for i in range(5)}, "b")
+    storage = AddressBookStorage()
+    events: list[str] = []
+    storage.subscribe(lambda event, key, item: events.append(event))
+
+    storage.import_batches(manager.load_batches("b.pkl"))
+
+    assert events == ["import", "import"]
+    assert len(storage.all_values()) == 5
+
+
+def test_truncated_stream_keeps_previous_storage_state(temp_dir):
+    manager = PickleFileManager(base_dir=temp_dir, batch_size=1)
+    manager.save({f"C{i}": Record(f"C{i}", "+380991112233") for i in range(3)}, "b")
+    path = temp_dir / "b.pkl"
+    path.write_bytes(path.read_bytes()[:-20])
+
+    storage = AddressBookStorage()
+    storage.add(Record("Kept", "+380991112233"))
+
+    with pytest.raises((EOFError, pickle.UnpicklingError)):
+        storage.import_batches(manager.load_batches("b.pkl"))
+    assert [record.name.value for record in storage.all_values()] == ["Kept"]
+
+
+def test_failed_group_commit_keeps_data_and_reports_on_flush(temp_dir, monkeypatch):
+    grouped = PickleFileManager(base_dir=temp_dir, group_commit_window=0.05)
+    real_write = grouped._atomic_write
+
+    def failing_write(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(grouped, "_atomic_write", failing_write)
+    grouped.save({"v": 1}, "timed.pkl")
+    grouped._commit_timer.join()
+
+    # Фоновий запис не вдався — дані не загубились і помилка не зникла
+    assert not (temp_dir / "timed.pkl").exists()
+    with pytest.raises(OSError, match="disk full"):
+        grouped.flush()
+
+    monkeypatch.setattr(grouped, "_atomic_write", real_write)
+    grouped.flush()
+    assert grouped.load("timed.pkl") == {"v": 1}
@@ -1,3 +1,4 @@
+import pickle
 from unittest.mock import MagicMock
 
 import pytest
@@ -9,6 +10,7 @@ from dal.exceptions.invalid_error import InvalidError
 @pytest.fixture
 def mock_file_manager():
     fm = MagicMock()
+    fm.extension = ".pkl"
     fm.get_all_names.return_value = ["file1.pkl", "file2.pkl"]
     return fm
 
@@ -54,9 +56,10 @@ def test_save_with_name_empty_data_raises(service, mock_storage):
         service.save_with_name("test")
 
 
-def test_save_with_name_pickle_error(service, mock_storage):
+def test_save_with_name_pickle_error(service, mock_file_manager, mock_storage):
     # lambda неможливо серіалізувати
     mock_storage.export_state.return_value = {"bad": lambda x: x}
+    mock_file_manager.save.side_effect = pickle.PicklingError("Can't pickle lambda")
     with pytest.raises(InvalidError, match="Cannot serialize data"):
         service.save_with_name("broken")
 
@@ -0,0 +1,60 @@
+import pytest
+
+from dal.entities.record import Record
+from dal.journals.pickle_journal.pickle_journal import PickleJournal
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return PickleJournal[str, Record](tmp_path)
+
+
+def test_new_journal_is_empty(journal):
+    assert journal.read() == []
+    assert journal.count() == 0
+    assert journal.get_base_name() is None
+
+
+def test_reset_sets_base_name(journal):
+    journal.reset("autosave_20250101_120000.pkl")
+
+    assert journal.get_base_name() == "autosave_20250101_120000.pkl"
+    assert journal.count() == 0
+
+
+def test_append_and_read_entries(journal):
+    journal.reset("base.pkl")
+    journal.append([("John", Record("John", "+380991112233"))])
+    journal.append([("Jane", None)])
+
+    entries = journal.read()
+
+    assert journal.count() == 2
+    assert entries[0][0] == "John"
+    assert entries[0][1].phones[0].value == "+380991112233"
+    assert entries[1] == ("Jane", None)
+
+
+def test_journal_survives_reopen(tmp_path):
+    PickleJournal(tmp_path).reset("base.pkl")
+    PickleJournal(tmp_path).append([("a", 1), ("b", 2)])
+
+    reopened = PickleJournal(tmp_path)
+
+    assert reopened.get_base_name() == "base.pkl"
+    assert reopened.read() == [("a", 1), ("b", 2)]
+
+
+def test_truncated_tail_is_discarded(tmp_path):
+    journal = PickleJournal(tmp_path)
+    journal.reset("base.pkl")
+    journal.append([("a", 1), ("b", 2)])
+
+    with journal.filepath.open("ab") as file:
+        file.write(b"\x80\x04\x95garbage")
+
+    reopened = PickleJournal(tmp_path)
+    assert reopened.read() == [("a", 1), ("b", 2)]
+
+    reopened.append([("c", 3)])
+    assert PickleJournal(tmp_path).read() == [("a", 1), ("b", 2), ("c", 3)]
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+
+from bll.services.file_service.file_service import FileService
+from bll.services.file_service.retention_policy import RetentionPolicy
+from dal.entities.record import Record
+from dal.file_managers.pickle_file_manager.pickle_file_manager import (
+    PickleFileManager,
+)
+from dal.file_managers.snapshot_manifest import TIMESTAMP_FORMAT, SnapshotEntry
+from dal.storages.address_book_storage import AddressBookStorage
+
+
+def make_entry(timestamp: datetime, size: int = 100, prefix: str = "autosave"):
+    name = f"{prefix}_{timestamp.strftime(TIMESTAMP_FORMAT)}.pkl"
+    return SnapshotEntry(name, timestamp, size)
+
+
+def hourly_entries(count: int, start=datetime(2025, 1, 1, 0, 0, 0)):
+    return [make_entry(start + timedelta(hours=i)) for i in range(count)]
+
+
+def test_keep_last_only():
+    entries = hourly_entries(5)
+    policy = RetentionPolicy(keep_last=2, keep_hourly=0, keep_daily=0, keep_weekly=0)
+
+    expired = policy.select_expired(entries)
+
+    assert [e.name for e in expired] == [e.name for e in entries[:3]]
+
+
+def test_daily_buckets_keep_newest_snapshot_per_day():
+    entries = hourly_entries(72)  # три доби
+    policy = RetentionPolicy(keep_last=0, keep_hourly=0, keep_daily=2, keep_weekly=0)
+
+    kept = {e.name for e in entries} - {e.name for e in policy.select_expired(entries)}
+
+    assert kept == {entries[-1].name, entries[47].name}
+
+
+def test_named_and_protected_snapshots_are_never_expired():
+    entries = hourly_entries(4) + [make_entry(datetime(2024, 1, 1), prefix="backup")]
+    policy = RetentionPolicy(keep_last=1, keep_hourly=0, keep_daily=0, keep_weekly=0)
+
+    expired = policy.select_expired(entries, protected=[entries[0].name])
+
+    assert [e.name for e in expired] == [entries[1].name, entries[2].name]
+
+
+def test_max_bytes_drops_oldest_but_keeps_newest():
+    entries = hourly_entries(5)
+    policy = RetentionPolicy(
+        keep_last=5, keep_hourly=0, keep_daily=0, keep_weekly=0, max_bytes=250
+    )
+
+    expired = policy.select_expired(entries)
+
+    assert [e.name for e in expired] == [e.name for e in entries[:3]]
+
+    tiny_budget = RetentionPolicy(keep_last=5, max_bytes=1).select_expired(entries)
+    assert entries[-1].name not in {e.name for e in tiny_budget}
+
+
+def test_file_service_compacts_in_background_after_save(tmp_path):
+    manager = PickleFileManager(tmp_path)
+    for entry in hourly_entries(5):
+        manager.save({"old": entry.name}, entry.name)
+
+    storage = AddressBookStorage()
+    storage.add(Record("John", "+380991112233"))
+    service = FileService(
+        manager,
+        storage,
+        retention_policy=RetentionPolicy(
+            keep_last=2, keep_hourly=0, keep_daily=0, keep_weekly=0
+        ),
+    )
+
+    saved = service.save_with_name()
+    service.wait_for_retention()
+
+    names = manager.get_all_names()
+    assert saved in names
+    assert len(names) == 2
+
+
+def test_compact_reports_removed_files_and_reclaimed_bytes(tmp_path):
+    manager = PickleFileManager(tmp_path)
+    entries = hourly_entries(3)
+    for entry in entries:
+        manager.save({"John": Record("John", "+380991112233")}, entry.name)
+    expected_bytes = manager.manifest.get(entries[1].name).size
+
+    service = FileService(
+        manager,
+        AddressBookStorage(),
+        retention_policy=RetentionPolicy(
+            keep_last=1, keep_hourly=0, keep_daily=0, keep_weekly=0
+        ),
+    )
+    service.load_by_name(entries[0].name)
+
+    removed, reclaimed = service.compact()
+
+    # Щойно завантажений знімок захищений від видалення
+    assert removed == 1
+    assert reclaimed == expected_bytes
+    assert manager.get_all_names() == [entries[0].name, entries[2].name]
@@ -0,0 +1,151 @@
+import base64
+import gc
+import pickle
+import tracemalloc
+from datetime import date, datetime
+
+import pytest
+
+from dal.entities.address import Address
+from dal.entities.birthday import Birthday
+from dal.entities.content import Content
+from dal.entities.email import Email
+from dal.entities.name import Name
+from dal.entities.note import Note
+from dal.entities.phone import Phone
+from dal.entities.record import Record
+from dal.entities.tag import Tag
+from dal.entities.title import Title
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+
+# {"John": Record, "todo": Note}, збережені класами до переходу на __slots__
+LEGACY_SNAPSHOT = base64.b64decode(
+    "gAWV2gIAAAAAAAB9lCiMBEpvaG6UjBNkYWwuZW50aXRpZXMucmVjb3JklIwGUmVjb3JklJOU"
+    "KYGUfZQojARuYW1llIwRZGFsLmVudGl0aWVzLm5hbWWUjAROYW1llJOUKYGUfZSMBXZhbHVl"
+    "lGgBc2KMBnBob25lc5RdlIwSZGFsLmVudGl0aWVzLnBob25llIwFUGhvbmWUk5QpgZR9lGgN"
+    "jA0rMzgwOTkxMTEyMjMzlHNiYYwGZW1haWxzlF2UjBJkYWwuZW50aXRpZXMuZW1haWyUjAVF"
+    "bWFpbJSTlCmBlH2UaA2MDmpvaG5AZ21haWwuY29tlHNiYYwIYmlydGhkYXmUjBVkYWwuZW50"
+    "aXRpZXMuYmlydGhkYXmUjAhCaXJ0aGRheZSTlCmBlH2UaA2MCGRhdGV0aW1llIwEZGF0ZZST"
+    "lEMEB8YFEZSFlFKUc2KMB2FkZHJlc3OUjBRkYWwuZW50aXRpZXMuYWRkcmVzc5SMB0FkZHJl"
+    "c3OUk5QpgZR9lGgNjBRLeWl2LCBLaHJlc2hjaGF0eWsgMZRzYnVijAR0b2RvlIwRZGFsLmVu"
+    "dGl0aWVzLm5vdGWUjAROb3RllJOUKYGUfZQoaAdoCimBlH2UaA1oMXNijAV0aXRsZZSMEmRh"
+    "bC5lbnRpdGllcy50aXRsZZSMBVRpdGxllJOUKYGUfZRoDYwIU2hvcHBpbmeUc2KMB2NvbnRl"
+    "bnSUjBRkYWwuZW50aXRpZXMuY29udGVudJSMB0NvbnRlbnSUk5QpgZR9lGgNjBJCdXkgbWls"
+    "ayBhbmQgYnJlYWSUc2KMCmNyZWF0ZWRfYXSUaCSMCGRhdGV0aW1llJOUQwoH6AMBDAAAAAAA"
+    "lIWUUpSMCnVwZGF0ZWRfYXSUTowEdGFnc5RdlIwQZGFsLmVudGl0aWVzLnRhZ5SMA1RhZ5ST"
+    "lCmBlH2UKGgNjARob21llIwFY29sb3KUjAVncmVlbpR1YmF1YnUu"
+)
+
+
+class DictField:
+    """Entity field with an instance ``__dict__``, as before ``__slots__``."""
+
+    def __init__(self, value):
+        self.value = value
+
+
+class DictRecord:
+    def __init__(self, name, phones, emails):
+        self.name = DictField(name)
+        self.phones = [DictField(phone) for phone in phones]
+        self.emails = [DictField(email) for email in emails]
+        self.birthday = None
+        self.address = None
+
+
+def loaded_size(payload: bytes) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        data = pickle.loads(payload)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del data
+    return size
+
+
+def make_record() -> Record:
+    return Record(
+        "John",
+        "+380991112233",
+        emails=["john@gmail.com"],
+        birthday=date(1990, 5, 17),
+        address="Kyiv, Khreshchatyk 1",
+    )
+
+
+def make_note() -> Note:
+    note = Note("todo", "Shopping", "Buy milk and bread", tags=[("home", "green")])
+    note.created_at = datetime(2024, 3, 1, 12, 0, 0)
+    return note
+
+
+@pytest.mark.parametrize(
+    "entity",
+    [
+        Name("John"),
+        Phone("+380991112233"),
+        Email("john@gmail.com"),
+        Birthday(date(1990, 5, 17)),
+        Address("Kyiv, Khreshchatyk 1"),
+        Tag("home", "green"),
+        Title("Shopping"),
+        Content("Buy milk and bread"),
+        make_record(),
+        make_note(),
+    ],
+)
+def test_entities_have_no_instance_dict(entity):
+    assert not hasattr(entity, "__dict__")
+    with pytest.raises(AttributeError):
+        entity.unexpected = 1
+
+
+def test_loaded_records_take_less_memory_than_dict_entities():
+    rows = [
+        (f"User{i:05d}", [f"+38099{i:07d}", f"+38050{i:07d}"], [f"u{i}@example.com"])
+        for i in range(2000)
+    ]
+    slotted = pickle.dumps([Record(n, *phones, emails=e) for n, phones, e in rows])
+    with_dict = pickle.dumps([DictRecord(n, phones, e) for n, phones, e in rows])
+
+    # Однакові рядки в обох знімках — різниця лише в накладних витратах об'єктів
+    assert loaded_size(slotted) < 0.75 * loaded_size(with_dict)
+
+
+def test_legacy_pickle_loads_into_slotted_entities():
+    data = pickle.loads(LEGACY_SNAPSHOT)
+
+    record, note = data["John"], data["todo"]
+    assert record == make_record()
+    assert record.emails == ["john@gmail.com"]
+    assert record.birthday.value == date(1990, 5, 17)
+    assert str(record.address) == "Kyiv, Khreshchatyk 1"
+    assert note == make_note()
+    assert note.created_at == datetime(2024, 3, 1, 12, 0, 0)
+    assert note.updated_at is None
+    assert note.tags[0].color == "green"
+
+
+def test_slotted_pickle_keeps_legacy_state_format():
+    record = make_record()
+
+    assert record.__getstate__()["phones"] == record.phones
+    assert pickle.loads(pickle.dumps(record)).__getstate__() == record.__getstate__()
+
+
+def test_unknown_legacy_attributes_are_dropped():
+    phone = Phone.__new__(Phone)
+    phone.__setstate__({"value": "+380991112233", "removed": True})
+
+    assert phone.value == "+380991112233"
+
+
+def test_legacy_snapshot_file_loads(tmp_path):
+    (tmp_path / "legacy.pkl").write_bytes(LEGACY_SNAPSHOT)
+
+    data = PickleFileManager(tmp_path).load("legacy.pkl")
+
+    assert data["John"] == make_record()
+    assert data["todo"] == make_note()
@@ -0,0 +1,149 @@
+import hashlib
+import json
+from datetime import datetime
+
+import pytest
+
+from dal.codecs.record_codec import RecordCodec
+from dal.entities.record import Record
+from dal.file_managers.compression import Compression
+from dal.file_managers.json_file_manager.json_file_manager import JsonFileManager
+from dal.file_managers.pickle_file_manager.pickle_file_manager import (
+    PickleFileManager,
+)
+from dal.file_managers.snapshot_manifest import SnapshotManifest, parse_timestamp
+
+
+def test_save_records_size_checksum_and_timestamp(tmp_path):
+    manager = PickleFileManager(tmp_path)
+
+    name = manager.save({"a": 1}, "autosave_20250101_120000.pkl")
+    entry = manager.manifest.get(name)
+
+    assert entry.size == (tmp_path / name).stat().st_size
+    assert len(entry.checksum) == 64
+    assert entry.timestamp == datetime(2025, 1, 1, 12, 0, 0)
+
+
+def test_latest_and_listing_follow_saves_and_deletes(tmp_path):
+    manager = PickleFileManager(tmp_path)
+    manager.save({"a": 1}, "autosave_20250101_120000.pkl")
+    newest = manager.save({"a": 2}, "autosave_20250301_120000.pkl")
+    manager.save({"a": 3}, "backup.pkl")
+
+    assert manager.get_latest_name() == newest
+    assert manager.get_all_names() == [
+        "autosave_20250101_120000.pkl",
+        "autosave_20250301_120000.pkl",
+        "backup.pkl",
+    ]
+
+    manager.delete(newest)
+
+    assert manager.get_latest_name() == "autosave_20250101_120000.pkl"
+    assert newest not in manager.get_all_names()
+
+
+def test_external_changes_are_detected_by_directory_mtime(tmp_path):
+    manager = PickleFileManager(tmp_path)
+    manager.save({"a": 1}, "autosave_20250101_120000.pkl")
+
+    (tmp_path / "autosave_20260101_120000.pkl").write_bytes(b"external")
+    (tmp_path / "autosave_20250101_120000.pkl").unlink()
+
+    assert manager.get_all_names() == ["autosave_20260101_120000.pkl"]
+    assert manager.get_latest_name() == "autosave_20260101_120000.pkl"
+    assert manager.manifest.get("autosave_20260101_120000.pkl").checksum is None
+
+
+def test_manifest_persists_between_instances(tmp_path):
+    manager = PickleFileManager(tmp_path)
+    name = manager.save({"a": 1}, "autosave_20250101_120000.pkl")
+    checksum = manager.manifest.get(name).checksum
+
+    reopened = SnapshotManifest(tmp_path, ".pkl")
+
+    assert reopened.names() == [name]
+    assert reopened.get(name).checksum == checksum
+
+
+def test_corrupted_manifest_is_rebuilt_from_directory(tmp_path):
+    manager = PickleFileManager(tmp_path)
+    name = manager.save({"a": 1}, "backup.pkl")
+    manager.manifest.filepath.write_text("{not json", encoding="utf-8")
+
+    reopened = SnapshotManifest(tmp_path, ".pkl")
+
+    assert reopened.names() == [name]
+    assert json.loads(reopened.filepath.read_text(encoding="utf-8"))["entries"]
+
+
+def test_parse_timestamp_ignores_non_snapshot_names():
+    assert parse_timestamp("autosave_20250101_120000.pkl") == datetime(
+        2025, 1, 1, 12, 0, 0
+    )
+    assert parse_timestamp("autosave_20250101_120000_1.pkl") is None
+    assert parse_timestamp("backup.pkl") is None
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"indexed": True},
+        {"compression": Compression("zlib")},
+        {"group_commit_window": 60},
+        {"group_commit_window": 60, "compression": Compression("bz2")},
+    ],
+)
+def test_checksum_matches_written_bytes(tmp_path, options):
+    manager = PickleFileManager(tmp_path, **options)
+
+    name = manager.save({"a": 1, "b": 2}, "backup.pkl")
+    manager.flush()
+
+    expected = hashlib.sha256((tmp_path / name).read_bytes()).hexdigest()
+    assert manager.manifest.get(name).checksum == expected
+
+
+def test_json_checksum_matches_written_bytes(tmp_path):
+    manager = JsonFileManager[Record](RecordCodec(), tmp_path)
+
+    name = manager.save({"John": Record("John", "+380991112233")}, "backup.json")
+
+    expected = hashlib.sha256((tmp_path / name).read_bytes()).hexdigest()
+    assert manager.manifest.get(name).checksum == expected
+
+
+def test_own_saves_and_deletes_do_not_rescan_directory(tmp_path, monkeypatch):
+    manager = PickleFileManager(tmp_path)
+    manager.save({"a": 0}, "autosave_20250101_120000.pkl")
+    manager.get_all_names()
+
+    rescans = []
+    rescan = SnapshotManifest._rescan
+
+    def counting_rescan(self):
+        rescans.append(self)
+        rescan(self)
+
+    monkeypatch.setattr(SnapshotManifest, "_rescan", counting_rescan)
+    for day in range(2, 12):
+        name = manager.save({"a": day}, f"autosave_202501{day:02d}_120000.pkl")
+        assert manager.get_latest_name() == name
+    manager.delete(name)
+    assert len(manager.get_all_names()) == 10
+
+    reopened = PickleFileManager(tmp_path)
+    assert len(reopened.get_all_names()) == 10
+    assert rescans == []
+
+
+def test_manifest_is_replaced_atomically(tmp_path):
+    manager = PickleFileManager(tmp_path)
+    manager.save({"a": 1}, "backup.pkl")
+
+    raw = json.loads(manager.manifest.filepath.read_text(encoding="utf-8"))
+
+    assert [entry["name"] for entry in raw["entries"]] == ["backup.pkl"]
+    assert list(manager.manifest.filepath.parent.glob("*.tmp")) == []
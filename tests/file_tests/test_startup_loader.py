@@ -0,0 +1,141 @@
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from bll.registries.file_service_registry import FileServiceRegistry
+from bll.services.command_service.command_service import CommandService
+from bll.services.file_service.file_service import FileService
+from bll.services.file_service.startup_loader import StartupLoader
+from bll.services.note_service.note_service import NoteService
+from bll.services.record_service.record_service import RecordService
+from dal.entities.note import Note
+from dal.entities.record import Record
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.storages.address_book_storage import AddressBookStorage
+from dal.storages.note_storage import NoteStorage
+
+
+class GatedPickleFileManager[Data](PickleFileManager[Data]):
+    def __init__(self, base_dir: Path) -> None:
+        super().__init__(base_dir)
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def load(self, name: str) -> Data:
+        self.gate.wait()
+        data: Data = super().load(name)
+        return data
+
+    def load_batches(self, name: str) -> Iterator[list[tuple]]:
+        self.gate.wait()
+        yield from super().load_batches(name)
+
+
+@pytest.fixture
+def book():
+    return AddressBookStorage()
+
+
+@pytest.fixture
+def notes():
+    return NoteStorage()
+
+
+@pytest.fixture
+def contact_manager(tmp_path):
+    return GatedPickleFileManager[dict[str, Record]](tmp_path / "contacts")
+
+
+@pytest.fixture
+def note_manager(tmp_path):
+    return GatedPickleFileManager[dict[str, Note]](tmp_path / "notes")
+
+
+@pytest.fixture
+def registry(book, notes, contact_manager, note_manager):
+    contact_manager.save({"John": Record("John", "+380991112233")}, "contacts.pkl")
+    note_manager.save({"todo": Note("todo", "Todo", "Buy milk and bread")}, "notes.pkl")
+    return FileServiceRegistry(
+        FileService(contact_manager, book), FileService(note_manager, notes)
+    )
+
+
+@pytest.fixture
+def loader(registry):
+    return StartupLoader(registry)
+
+
+def test_loads_all_services_and_reports_timings(loader, book, notes):
+    loader.start()
+
+    assert loader.wait("contacts").file_name == "contacts.pkl"
+    assert loader.wait("notes").file_name == "notes.pkl"
+    assert "John" in book
+    assert "todo" in notes
+
+    reports = loader.get_reports()
+    assert all(report.elapsed >= 0 for report in reports.values())
+    assert [report.key for report in loader.pop_finished_reports()] == [
+        "contacts",
+        "notes",
+    ]
+    assert loader.pop_finished_reports() == []
+
+
+def test_slow_load_does_not_block_other_storage(loader, contact_manager, notes):
+    contact_manager.gate.clear()
+    loader.start()
+
+    assert loader.wait("notes").error is None
+    assert "todo" in notes
+    assert not loader.is_ready("contacts")
+    assert loader.get_reports()["contacts"] is None
+
+    contact_manager.gate.set()
+    assert loader.wait("contacts").error is None
+
+
+def test_missing_state_is_reported_as_error(tmp_path):
+    registry = FileServiceRegistry(
+        FileService(PickleFileManager(tmp_path / "c"), AddressBookStorage()),
+        FileService(PickleFileManager(tmp_path / "n"), NoteStorage()),
+    )
+    loader = StartupLoader(registry)
+    loader.start()
+
+    report = loader.wait("contacts")
+    assert report.error == "No files available"
+    assert "could not load" in str(report)
+
+
+def test_when_ready_runs_after_all_loads(loader, contact_manager):
+    contact_manager.gate.clear()
+    ready = threading.Event()
+    loader.start()
+    loader.when_ready(ready.set)
+
+    assert not ready.wait(0.05)
+    contact_manager.gate.set()
+    assert ready.wait(5)
+
+
+def test_command_waits_only_for_its_storage(loader, registry, book, notes):
+    contact_manager = registry.get("contacts").file_manager
+    contact_manager.gate.clear()
+    command_service = CommandService(
+        record_service=RecordService(book),
+        note_service=NoteService(notes),
+        input_service=None,
+        file_service_registry=registry,
+        startup_loader=loader,
+    )
+    loader.start()
+
+    assert "todo" in command_service.execute("all-notes", [])
+    assert "still loading" in command_service.execute("load-times", [])
+
+    threading.Timer(0.05, contact_manager.gate.set).start()
+    assert "John" in command_service.execute("all-contacts", [])
+    assert "contacts.pkl" in command_service.execute("load-times", [])
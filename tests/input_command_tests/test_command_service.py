@@ -140,6 +140,9 @@ class FakeRecordService:
     def get_by_name(self, name):
         return self.records.get(name)
 
+    def ensure_phone_available(self, name, phone):
+        pass
+
     def delete(self, name):
         self.records.pop(name, None)
 
@@ -174,6 +177,7 @@ class FakeFileService:
         self.deleted = []
         self.files = ["file1.pkl", "file2.pkl"]
         self._saveable = False
+        self.flushed = False
 
     def is_save_able(self):
         return self._saveable
@@ -192,6 +196,9 @@ class FakeFileService:
     def get_file_list(self):
         return self.files
 
+    def flush(self):
+        self.flushed = True
+
 
 class FakeInputService:
     def __init__(self) -> None:
@@ -366,6 +373,7 @@ def test_exit_bot_with_save(command_service, fake_contact_file_service):
     fake_contact_file_service._saveable = True
     with pytest.raises(ExitBotError):
         command_service.exit_bot()
+    assert fake_contact_file_service.flushed
 
 
 def test_delete_contact(command_service, fake_record_service):
@@ -110,3 +110,20 @@ def test_show_all_notes_sorted_and_filtered(command_service):
     # Filtering by specific tag
     filtered_notes = ns.get_all_sorted_by_tags("a")
     assert [n.name.value for n in filtered_notes] == ["n2"]
+
+
+def test_tag_stats_command(command_service):
+    ns = command_service.note_service
+    ns.add("n1", "T1", "Content long enough", tags=[("work", "red"), "urgent"])
+    ns.add("n2", "T2", "Content long enough", tags=[("Work", "blue")])
+
+    res = command_service.show_tag_stats()
+
+    assert "Tags (2)" in res
+    work_line = next(line for line in res.splitlines() if "work" in line)
+    assert "red" in work_line
+    assert "2" in work_line
+
+
+def test_tag_stats_command_without_tags(command_service):
+    assert "No tags yet" in command_service.show_tag_stats()
@@ -6,6 +6,9 @@ from bll.helpers.prompt_completer import PromptCompleter
 from bll.services.command_service.command_service import CommandService
 from bll.services.note_service.note_service import NoteService
 from bll.services.record_service.record_service import RecordService
+from dal.entities.record import Record
+from dal.storages.address_book_storage import AddressBookStorage
+from dal.storages.note_storage import NoteStorage
 
 
 class FakeCommand:
@@ -242,3 +245,39 @@ def test_delete_note_file_suggests_note_files():
     assert "notes_ideas.pkl" in completions
     assert "contacts_autosave_1.pkl" not in completions
     assert "contacts_backup.pkl" not in completions
+
+
+def _make_storage_backed_completer() -> tuple[PromptCompleter, RecordService]:
+    record_service = RecordService(AddressBookStorage())
+    note_service = NoteService(NoteStorage())
+    record_service.save(Record("Roman", "+380991112233"))
+    note_service.add("Roman", "Plan", "Study plan for week", tags=["todo", "study"])
+
+    completer = PromptCompleter(
+        command_service=cast(CommandService, FakeCommandService()),
+        record_service=record_service,
+        note_service=note_service,
+    )
+    return completer, record_service
+
+
+def test_completion_lists_are_cached_until_storage_changes():
+    completer, record_service = _make_storage_backed_completer()
+
+    collect_completions(completer, "add-phone R")
+    cached = completer._contact_names.get()
+    collect_completions(completer, "add-phone Ro")
+    assert completer._contact_names.get() is cached
+
+    record_service.save(Record("Rosa", "+380991112234"))
+
+    assert collect_completions(completer, "add-phone Ro") == ["Roman", "Rosa"]
+    assert completer._contact_names.get() is not cached
+
+
+def test_storage_backed_lookups_complete_phones_and_note_tags():
+    completer, _ = _make_storage_backed_completer()
+
+    assert collect_completions(completer, "delete-phone Roman +38") == ["+380991112233"]
+    assert collect_completions(completer, "remove-note-tag Roman s") == ["study"]
+    assert collect_completions(completer, "show-notes-by-tag t") == ["todo"]
@@ -74,3 +74,16 @@ def test_search_contacts_flow(bot):
 
     cmd, args = input_service.handle("search-contacts not-found")
     assert "No contacts found" in command_service.execute(cmd, args)
+
+
+def test_find_by_phone_flow(bot):
+    input_service, command_service = bot
+
+    cmd, args = input_service.handle("add-contact John 0991112233")
+    command_service.execute(cmd, args)
+
+    cmd, args = input_service.handle("find-by-phone +38 099 111 22 33")
+    assert "John" in command_service.execute(cmd, args)
+
+    cmd, args = input_service.handle("find-by-phone 0665554433")
+    assert "No contacts with phone" in command_service.execute(cmd, args)
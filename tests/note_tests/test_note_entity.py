@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from dal.entities.note import Note
+from dal.entities.tag import Tag
 
 
 def test_note_init_creates_valid_entities():
@@ -41,3 +42,54 @@ def test_note_update_returns_builder():
     builder = note.update()
     assert hasattr(builder, "set_title")
     assert hasattr(builder, "build")
+
+
+def test_tags_stay_sorted_while_adding_and_removing():
+    note = Note("n", "T", "1234567890", tags=["work", "Home"])
+
+    note.add_tag("urgent").add_tag("alpha").add_tag("Beta")
+    assert note.tag_names() == ["alpha", "Beta", "Home", "urgent", "work"]
+
+    assert note.remove_tag("HOME")
+    assert not note.remove_tag("home")
+    assert note.tag_names() == ["alpha", "Beta", "urgent", "work"]
+
+
+def test_tag_membership_is_case_insensitive():
+    note = Note("n", "T", "1234567890", tags=["Straße"])
+
+    assert note.has_tag("STRASSE")
+    assert note.has_tag("  straße ")
+    assert not note.has_tag("street")
+
+
+def test_add_existing_tag_keeps_name_and_updates_color():
+    note = Note("n", "T", "1234567890", tags=[("Work", "red")])
+
+    note.add_tag("work", "blue")
+    note.add_tag("WORK")
+
+    assert [(tag.value, tag.color) for tag in note.tags] == [("Work", "blue")]
+
+
+def test_legacy_state_with_unsorted_tags_is_migrated():
+    note = Note.__new__(Note)
+    note.__setstate__(
+        {
+            "name": Note("n", "T", "1234567890").name,
+            "tags": [Tag("work"), Tag("Alpha", "red"), Tag("WORK", "blue")],
+        }
+    )
+
+    assert note.tag_names() == ["Alpha", "work"]
+    assert note.has_tag("alpha")
+    assert note.tags[0] is Tag.intern("Alpha", "red")
+
+
+def test_pickle_state_exposes_tags_not_internal_map():
+    note = Note("n", "T", "1234567890", tags=["work"])
+
+    state = note.__getstate__()
+
+    assert state["tags"] == note.tags
+    assert not any(name.startswith("_") for name in state)
@@ -1,6 +1,7 @@
 import pytest
 
 from bll.services.note_service.note_service import NoteService
+from dal.entities.note import Note
 from dal.storages.note_storage import NoteStorage
 
 
@@ -25,6 +26,15 @@ def test_add_note_with_tags_dedup_and_colors(note_service):
     assert color_map["urgent"] is not None
 
 
+def test_tags_dedup_uses_note_tag_key(note_service):
+    note = note_service.add(
+        "n1", "T", "Content long enough", tags=["Straße", "STRASSE"]
+    )
+
+    assert [tag.value for tag in note.tags] == ["Straße"]
+    assert note_service.add("n2", "T", "Content long enough", tags=[]).tags == []
+
+
 def test_add_and_remove_tags(note_service):
     note_service.add("n1", "T", "Content long enough")
 
@@ -80,3 +90,66 @@ def test_search_by_title_content_and_tag(note_service):
     res2 = note_service.search("quarterly")
     names2 = sorted(n.name.value for n in res2)
     assert names2 == ["n1", "n2"]
+
+
+def test_search_index_tracks_note_mutations(note_service):
+    note_service.add("n1", "Shopping", "Buy fresh vegetables", tags=["home"])
+    note_service.add("n2", "Work", "Prepare the slides", tags=["office"])
+    assert [n.name.value for n in note_service.search("veget")] == ["n1"]
+
+    note_service.add_tags("n2", ["urgent"])
+    assert [n.name.value for n in note_service.search("urg slides")] == ["n2"]
+
+    note_service.remove_tag("n1", "home")
+    assert note_service.search("home") == []
+
+    note_service.rename("n1", "groceries")
+    assert [n.name.value for n in note_service.search("grocer")] == ["groceries"]
+
+    note_service.delete("n2")
+    assert note_service.search("slides") == []
+
+
+def test_tag_index_follows_note_changes(note_service):
+    note_service.add("n1", "T1", "Content long enough", tags=["work"])
+    note_service.add("n2", "T2", "Content long enough", tags=["Work", "dev"])
+    note_service.add("n3", "T3", "Content long enough")
+    assert [n.name.value for n in note_service.get_by_tag("WORK")] == ["n1", "n2"]
+
+    note_service.add_tags("n3", ["work"])
+    note_service.remove_tag("n1", "work")
+    note_service.rename("n2", "n2-renamed")
+    note_service.delete("n3")
+
+    assert [n.name.value for n in note_service.get_by_tag("work")] == ["n2-renamed"]
+    assert [(t.value, count) for t, count in note_service.get_tag_stats()] == [
+        ("dev", 1),
+        ("Work", 1),
+    ]
+
+
+def test_tag_index_follows_update_and_import(note_service):
+    note = note_service.add("n1", "T1", "Content long enough", tags=["work"])
+    assert note_service.get_by_tag("work") == [note]
+
+    replacement = Note("n1", "T1", "Content long enough", tags=["home"])
+    note_service.update("n1", replacement)
+    assert note_service.get_by_tag("work") == []
+    assert note_service.get_by_tag("home") == [replacement]
+
+    imported = Note("n9", "T9", "Content long enough", tags=["travel"])
+    note_service.storage.import_state({"n9": imported})
+    assert note_service.get_by_tag("travel") == [imported]
+    assert [t.value for t in note_service.get_distinct_tags()] == ["travel"]
+
+
+def test_tag_stats_keep_first_color_and_count_notes(note_service):
+    note_service.add("n1", "T1", "Content long enough", tags=[("work", "red")])
+    note_service.add("n2", "T2", "Content long enough", tags=[("work", "blue")])
+
+    [(tag, count)] = note_service.get_tag_stats()
+
+    assert (tag.value, tag.color, count) == ("work", "red", 2)
+    note_service.delete("n1")
+    [(tag, count)] = note_service.get_tag_stats()
+    assert (tag.color, count) == ("blue", 1)
@@ -0,0 +1,219 @@
+import json
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from bll.helpers.search_helper import SearchHelper
+from bll.services.file_service.file_service import FileService
+from bll.services.note_service.note_service import NoteService
+from dal.codecs.note_codec import NoteCodec
+from dal.entities.note import Note
+from dal.exceptions.invalid_error import InvalidError
+from dal.file_managers.pickle_file_manager.pickle_file_manager import PickleFileManager
+from dal.storages import sqlite_text_search
+from dal.storages.note_storage import NoteStorage
+from dal.storages.sqlite_note_storage import SqliteNoteStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    sqlite_storage = SqliteNoteStorage(tmp_path / "notes.db")
+    yield sqlite_storage
+    sqlite_storage.close()
+
+
+def make_note(name, title, content, tags=None):
+    return Note(name, title, content, tags=tags)
+
+
+def test_add_find_and_delete(storage):
+    note = make_note("n1", "Shopping", "Buy some milk", tags=[("home", "blue")])
+    storage.add(note)
+
+    found = storage.find("n1")
+    assert found.title.value == "Shopping"
+    assert found.tags[0].color == "blue"
+
+    storage.delete("n1")
+
+    assert not storage.has("n1")
+    assert storage.search(["milk"]) == []
+    assert storage.find_by_tag("home") == []
+
+
+def test_update_replaces_search_and_tag_rows(storage):
+    storage.add(make_note("a", "Alpha", "first draft", tags=["work"]))
+    storage.add(make_note("b", "Beta", "second draft"))
+
+    storage.update_item("a", make_note("a", "Alpha", "rewritten text", tags=["home"]))
+
+    assert [n.name.value for n in storage.all_values()] == ["a", "b"]
+    assert storage.search(["first"]) == []
+    assert storage.search(["rewritten"])[0].name.value == "a"
+    assert storage.find_by_tag("work") == []
+    assert storage.find_by_tag("HOME")[0].name.value == "a"
+
+
+def test_search_is_substring_and_case_insensitive(storage):
+    storage.add(make_note("n1", "Meeting notes", "Discuss roadmap", tags=["Work"]))
+    storage.add(make_note("n2", "Groceries", "apples and pears"))
+
+    assert [n.name.value for n in storage.search(["ROADM"])] == ["n1"]
+    assert [n.name.value for n in storage.search(["meet", "work"])] == ["n1"]
+    assert storage.search(["meet", "apples"]) == []
+
+
+def test_search_handles_short_and_special_tokens(storage):
+    storage.add(make_note("n1", "To do", 'call 5% of "list"'))
+    storage.add(make_note("n2", "Other", "nothing here"))
+
+    assert [n.name.value for n in storage.search(["do"])] == ["n1"]
+    assert [n.name.value for n in storage.search(["5%"])] == ["n1"]
+    assert [n.name.value for n in storage.search(['"list"'])] == ["n1"]
+
+
+def test_import_state_replaces_contents(storage):
+    storage.add(make_note("old", "Old", "stale content"))
+
+    storage.import_state({"new": make_note("new", "New", "fresh content", tags=["x"])})
+
+    assert not storage.has("old")
+    assert storage.search(["stale"]) == []
+    assert list(storage.export_state()) == ["new"]
+    assert storage.find_by_tag("x")[0].name.value == "new"
+
+
+def test_import_state_rejects_non_dict(storage):
+    with pytest.raises(InvalidError):
+        storage.import_state(["not", "a", "dict"])
+
+
+def test_data_persists_between_connections(tmp_path):
+    db_path = tmp_path / "notes.db"
+    first = SqliteNoteStorage(db_path)
+    first.add(make_note("n1", "Persistent", "survives restart", tags=["keep"]))
+    first.close()
+
+    second = SqliteNoteStorage(db_path)
+    try:
+        assert second.search(["restart"])[0].name.value == "n1"
+        assert second.find_by_tag("keep")[0].name.value == "n1"
+    finally:
+        second.close()
+
+
+def test_note_service_uses_index_backed_lookups(storage):
+    service = NoteService(storage)
+    service.add("n1", "Plan", "quarterly planning", tags=["work"])
+    service.add("n2", "Trip", "pack the bags", tags=["travel", "work"])
+
+    assert [n.name.value for n in service.search("bags")] == ["n2"]
+    assert [n.name.value for n in service.get_by_tag("Work")] == ["n1", "n2"]
+    assert [n.name.value for n in service.get_all_sorted_by_tags("travel")] == ["n2"]
+
+
+@pytest.fixture
+def no_fts_storage(tmp_path, monkeypatch):
+    # Імітуємо збірку SQLite без модуля FTS5
+    monkeypatch.setattr(
+        sqlite_text_search,
+        "_FTS_SCHEMA",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING no_such_module (x);",
+    )
+    sqlite_storage = SqliteNoteStorage(tmp_path / "notes.db")
+    yield sqlite_storage
+    sqlite_storage.close()
+
+
+def test_short_tokens_fold_cyrillic_case(storage):
+    storage.add(make_note("n1", "Ліки", "Купити ЯД від комарів"))
+
+    assert [n.name.value for n in storage.search(["яд"])] == ["n1"]
+    assert [n.name.value for n in storage.search(["ліки", "комар"])] == ["n1"]
+
+
+def test_search_falls_back_to_like_without_fts5(no_fts_storage):
+    no_fts_storage.add(make_note("n1", "Meeting notes", "Обговорити ПЛАН", ["Work"]))
+    no_fts_storage.add(make_note("n2", "Groceries", "apples and pears"))
+    no_fts_storage.update_item("n2", make_note("n2", "Groceries", "just pears"))
+
+    assert [n.name.value for n in no_fts_storage.search(["план", "meet"])] == ["n1"]
+    assert [n.name.value for n in no_fts_storage.search(["pears"])] == ["n2"]
+    assert no_fts_storage.search(["apples"]) == []
+
+    no_fts_storage.delete("n1")
+    no_fts_storage.import_state({"n3": make_note("n3", "New", "fresh content")})
+    assert [n.name.value for n in no_fts_storage.search(["fresh"])] == ["n3"]
+
+
+def test_existing_database_gains_search_text(tmp_path):
+    db_path = tmp_path / "notes.db"
+    connection = sqlite3.connect(str(db_path))
+    payload = json.dumps(
+        NoteCodec().encode(make_note("n1", "Старе", "Збережений ТЕКСТ"))
+    )
+    connection.execute("CREATE TABLE notes (name TEXT PRIMARY KEY, payload TEXT)")
+    connection.execute("INSERT INTO notes VALUES (?, ?)", ("n1", payload))
+    connection.commit()
+    connection.close()
+
+    migrated = SqliteNoteStorage(db_path)
+    try:
+        assert [n.name.value for n in migrated.search(["те"])] == ["n1"]
+    finally:
+        migrated.close()
+
+
+def test_exit_save_skips_durable_notes(storage, tmp_path):
+    service = FileService(PickleFileManager(tmp_path / "snapshots"), storage)
+    storage.add(make_note("n1", "Plan", "quarterly planning"))
+
+    assert not service.is_save_able()
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["milk", "(red)", "urgent (red)", "red)", "2024-03-01", "12:30", "bread 05-02"],
+)
+def test_search_matches_in_memory_storage(tmp_path, query):
+    sqlite_storage = SqliteNoteStorage(
+        tmp_path / "notes.db",
+        search_strings=SearchHelper.collect_strings,
+        search_scheme="search-helper",
+    )
+    services = [NoteService(NoteStorage()), NoteService(sqlite_storage)]
+    try:
+        for service in services:
+            first = make_note("n1", "Shopping", "Buy some milk", [("urgent", "red")])
+            first.created_at = datetime(2024, 3, 1, 12, 30)
+            second = make_note("n2", "Bakery", "Bread and milk", ["home"])
+            second.created_at = datetime(2024, 5, 2, 9, 0)
+            second.updated_at = datetime(2024, 5, 3, 8, 0)
+            service.storage.add(first)
+            service.storage.add(second)
+
+        in_memory, sqlite = (
+            sorted(note.name.value for note in service.search(query))
+            for service in services
+        )
+        assert sqlite == in_memory
+    finally:
+        sqlite_storage.close()
+
+
+def test_changed_search_scheme_rebuilds_texts(tmp_path):
+    db_path = tmp_path / "notes.db"
+    first = SqliteNoteStorage(db_path)
+    first.add(make_note("n1", "Plan", "quarterly planning"))
+    first.close()
+
+    def title_only(note):
+        return [note.title.value]
+
+    second = SqliteNoteStorage(db_path, search_strings=title_only, search_scheme="t")
+    try:
+        assert second.search(["quarterly"]) == []
+        assert [n.name.value for n in second.search(["plan"])] == ["n1"]
+    finally:
+        second.close()
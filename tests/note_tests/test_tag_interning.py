@@ -0,0 +1,84 @@
+import gc
+import pickle
+
+import pytest
+
+from bll.services.note_service.note_service import NoteService
+from dal.codecs.compact_frame import decode_frame, encode_frame
+from dal.codecs.compact_note_codec import CompactNoteCodec
+from dal.codecs.note_codec import NoteCodec
+from dal.entities.note import Note
+from dal.entities.tag import Tag
+from dal.storages.note_storage import NoteStorage
+
+
+@pytest.fixture
+def note_service():
+    return NoteService(NoteStorage())
+
+
+def test_intern_returns_one_instance_per_name_and_color():
+    home = Tag.intern("home", "green")
+
+    assert Tag.intern("home", "green") is home
+    assert Tag.intern("  home ", " green ") is home
+    assert Tag.intern("home", "red") is not home
+    assert Tag.intern("home") is not home
+
+
+def test_tags_are_immutable():
+    tag = Tag.intern("home", "green")
+
+    with pytest.raises(AttributeError):
+        tag.color = "red"
+    with pytest.raises(AttributeError):
+        tag.value = "work"
+
+
+def test_notes_share_tag_instances(note_service):
+    first = note_service.add("n1", "T", "Content long enough", tags=["work"])
+    second = note_service.add("n2", "T", "Content long enough", tags=["work"])
+    third = Note("n3", "T", "Content long enough", tags=[first.tags[0]])
+
+    assert first.tags[0] is second.tags[0] is third.tags[0]
+    assert note_service.get_distinct_tags()[0] is first.tags[0]
+
+
+def test_recoloring_a_tag_does_not_affect_other_notes(note_service):
+    first = note_service.add("n1", "T", "Content long enough", tags=[("work", "red")])
+    second = note_service.add("n2", "T", "Content long enough", tags=[("work", "red")])
+
+    note_service.add_tags("n1", [("work", "blue")])
+
+    assert first.tags[0].color == "blue"
+    assert second.tags[0].color == "red"
+
+
+@pytest.mark.parametrize("protocol", [2, pickle.HIGHEST_PROTOCOL])
+def test_unpickled_notes_use_interned_tags(protocol):
+    note = Note("n1", "T", "Content long enough", tags=[("home", "green")])
+
+    restored = pickle.loads(pickle.dumps(note, protocol=protocol))
+
+    assert restored.tags[0] is Tag.intern("home", "green")
+
+
+def test_codecs_decode_interned_tags():
+    note = Note("n1", "T", "Content long enough", tags=[("home", "green")])
+    json_codec = NoteCodec()
+    compact_codec = CompactNoteCodec()
+
+    from_json = json_codec.decode(json_codec.encode(note))
+    [(_, from_compact)] = decode_frame(
+        compact_codec, encode_frame(compact_codec, [("n1", note)])
+    )
+
+    assert from_json.tags[0] is note.tags[0]
+    assert from_compact.tags[0] is note.tags[0]
+
+
+def test_unused_tags_leave_the_registry():
+    Tag.intern("one-off-tag", "plum")
+    gc.collect()
+
+    assert ("one-off-tag", "plum") not in Tag._interned
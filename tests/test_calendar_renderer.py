@@ -41,3 +41,13 @@ def test_render_calendar_defaults_to_current_month():
     assert "January 2024" not in result
     assert "December 2024" not in result
     assert "Carol" in result
+
+
+def test_render_calendar_uses_precomputed_birthday_map():
+    now = datetime(2024, 5, 4, 10, 30, 0)
+
+    result = render_calendar_with_clock(
+        month=5, year=2024, now=now, birthdays={5: ["Indexed"]}
+    )
+
+    assert "Indexed" in result
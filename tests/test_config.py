@@ -82,3 +82,29 @@ class TestConfig:
         override_path = Path("/override/contacts")
         config.set_contacts_dir(override_path)
         assert config.contacts_dir == override_path
+
+    def test_retention_is_off_by_default(self, monkeypatch):
+        """Test that retention stays disabled without ASSISTANT_RETENTION_*."""
+        for env_name, _default in Config._RETENTION_ENV.values():
+            monkeypatch.delenv(env_name, raising=False)
+        monkeypatch.setenv("ASSISTANT_RETENTION_KEEP_LAST", "many")
+        assert Config().retention_settings is None
+
+    def test_retention_enabled_by_any_setting(self, monkeypatch):
+        """Test that one retention variable enables it with other defaults."""
+        for env_name, _default in Config._RETENTION_ENV.values():
+            monkeypatch.delenv(env_name, raising=False)
+        monkeypatch.setenv("ASSISTANT_RETENTION_KEEP_DAILY", "3")
+        settings = Config().retention_settings
+        assert settings is not None
+        assert settings["keep_daily"] == 3
+        assert settings["keep_last"] == 10
+
+    def test_snapshot_codec_defaults_to_pickle(self, monkeypatch):
+        """Test that the compact codec is opt-in and bad values fall back."""
+        monkeypatch.delenv("ASSISTANT_SNAPSHOT_CODEC", raising=False)
+        assert Config().snapshot_codec == "pickle"
+        monkeypatch.setenv("ASSISTANT_SNAPSHOT_CODEC", "zip")
+        assert Config().snapshot_codec == "pickle"
+        monkeypatch.setenv("ASSISTANT_SNAPSHOT_CODEC", "compact")
+        assert Config().snapshot_codec == "compact"
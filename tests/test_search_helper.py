@@ -0,0 +1,84 @@
+from bll.helpers.search_helper import SearchHelper
+from bll.helpers.search_index import SearchIndex
+from dal.entities.note import Note
+from dal.entities.record import Record
+from dal.entities.tag import Tag
+from dal.storages.address_book_storage import AddressBookStorage
+
+
+def test_record_extractor_is_flat_and_without_labels():
+    record = Record(
+        "John",
+        "+380991112233",
+        emails=["john@example.com"],
+        birthday="05.11.2000",
+        address="Kyiv",
+    )
+
+    strings = SearchHelper.collect_strings(record)
+
+    assert strings == [
+        "John",
+        "+380991112233",
+        "john@example.com",
+        "05.11.2000",
+        "2000-11-05",
+        "Kyiv",
+    ]
+    assert "contact" not in SearchHelper.haystack(record)
+
+
+def test_note_extractor_covers_text_dates_and_tags():
+    note = Note("n1", "Title", "Some long content", tags=[("work", "#009688")])
+
+    haystack = SearchHelper.haystack(note)
+
+    assert "some long content" in haystack
+    assert "work (#009688)" in haystack
+    assert str(note.created_at.year) in haystack
+
+
+def test_field_subclasses_resolve_to_field_extractor():
+    assert SearchHelper.collect_strings(Tag("urgent", "red")) == ["urgent (red)"]
+
+
+def test_unregistered_types_fall_back_to_reflective_walk():
+    class Holder:
+        def __init__(self):
+            self.items = ["Alpha", 42]
+
+        def __str__(self):
+            return "holder"
+
+    assert SearchHelper.match_all_tokens(Holder(), ["alpha", "42", "holder"])
+
+
+def test_haystack_is_not_cached_and_sees_in_place_changes():
+    record = Record("John", "+380991112233")
+    assert SearchHelper.match_all_tokens(record, ["john"])
+
+    record.name.value = "Mark"
+
+    assert not SearchHelper.match_all_tokens(record, ["john"])
+    assert SearchHelper.match_all_tokens(record, ["mark"])
+
+
+def test_search_index_extracts_again_only_on_storage_events():
+    storage = AddressBookStorage()
+    storage.add(Record("John", "+380991112233"))
+    storage.add(Record("Jane", "+380931234567"))
+    extracted = []
+
+    def extract(record):
+        extracted.append(record.name.value)
+        return SearchHelper.collect_strings(record)
+
+    index = SearchIndex(storage, extract)
+    index.search(["john"])
+    index.search(["jane"])
+    assert extracted == ["John", "Jane"]
+
+    storage.update_item("John", Record("John", "+380501112233"))
+
+    assert index.search(["0501"]) == ["John"]
+    assert extracted == ["John", "Jane", "John"]